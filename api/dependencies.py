@@ -49,7 +49,12 @@ async def shutdown_pixelle_video():
     global _pixelle_video_instance
     if _pixelle_video_instance:
         logger.info("Shutting down Pixelle-Video...")
+        # Release pooled LLM/HTTP connections
+        await _pixelle_video_instance.cleanup()
         _pixelle_video_instance = None
+    else:
+        from pixelle_video.utils.http_util import close_http_client
+        await close_http_client()
 
 
 # Type alias for dependency injection
@@ -16,6 +16,7 @@ File service endpoints
 Provides access to generated files (videos, images, audio) and resource files.
 """
 
+import re
 from pathlib import Path
 from fastapi import APIRouter, HTTPException
 from fastapi.responses import FileResponse
@@ -23,6 +24,22 @@ from loguru import logger
 
 router = APIRouter(prefix="/files", tags=["Files"])
 
+# Allowed directories (in priority order)
+_ALLOWED_PREFIXES = (
+    "output/",
+    "workflows/",
+    "templates/",
+    "bgm/",
+    "data/bgm/",
+    "data/templates/",
+    "resources/",
+)
+
+# Access check: relative path must start with one of the allowed directories
+_ALLOWED_DIR_RE = re.compile(
+    "|".join(re.escape(prefix.rstrip('/')) for prefix in _ALLOWED_PREFIXES)
+)
+
 
 @router.get("/{file_path:path}")
 async def get_file(file_path: str):
@@ -50,26 +67,11 @@ async def get_file(file_path: str):
     Returns file for download or preview.
     """
     try:
-        # Define allowed directories (in priority order)
-        allowed_prefixes = [
-            "output/",
-            "workflows/",
-            "templates/",
-            "bgm/",
-            "data/bgm/",
-            "data/templates/",
-            "resources/",
-        ]
-        
-        # Check if path starts with allowed prefix, otherwise try output/
-        full_path = None
-        for prefix in allowed_prefixes:
-            if file_path.startswith(prefix):
-                full_path = file_path
-                break
-        
-        # If no prefix matched, assume it's in output/ (backward compatibility)
-        if full_path is None:
+        # Check if path starts with allowed prefix, otherwise assume it's in
+        # output/ (backward compatibility)
+        if file_path.startswith(_ALLOWED_PREFIXES):
+            full_path = file_path
+        else:
             full_path = f"output/{file_path}"
         
         abs_path = Path.cwd() / full_path
@@ -86,12 +88,12 @@ async def get_file(file_path: str):
             rel_path_str = str(rel_path)
             
             # Check if path starts with any allowed prefix
-            is_allowed = any(rel_path_str.startswith(prefix.rstrip('/')) for prefix in allowed_prefixes)
+            is_allowed = _ALLOWED_DIR_RE.match(rel_path_str) is not None
             
             if not is_allowed:
                 raise HTTPException(
                     status_code=403, 
-                    detail=f"Access denied: only {', '.join(p.rstrip('/') for p in allowed_prefixes)} directories are accessible"
+                    detail=f"Access denied: only {', '.join(p.rstrip('/') for p in _ALLOWED_PREFIXES)} directories are accessible"
                 )
         except ValueError:
             raise HTTPException(status_code=403, detail="Access denied")
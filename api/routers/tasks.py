@@ -16,7 +16,7 @@ Task management endpoints
 Endpoints for managing async tasks (checking status, canceling, etc.)
 """
 
-from typing import List, Optional
+from typing import Annotated, List, Optional
 from fastapi import APIRouter, HTTPException, Query
 from loguru import logger
 
@@ -27,8 +27,8 @@ router = APIRouter(prefix="/tasks", tags=["Tasks"])
 
 @router.get("", response_model=List[Task])
 async def list_tasks(
-    status: Optional[TaskStatus] = Query(None, description="Filter by status"),
-    limit: int = Query(100, ge=1, le=1000, description="Maximum number of tasks")
+    status: Annotated[Optional[TaskStatus], Query(description="Filter by status")] = None,
+    limit: Annotated[int, Query(ge=1, le=1000, description="Maximum number of tasks")] = 100
 ):
     """
     List tasks
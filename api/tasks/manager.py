@@ -26,6 +26,10 @@ from api.tasks.models import Task, TaskStatus, TaskType, TaskProgress
 from api.config import api_config
 
 
+# Terminal task states (eligible for cleanup)
+_FINISHED_STATUSES = frozenset({TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED})
+
+
 class TaskManager:
     """
     Task manager for handling async video generation tasks
@@ -246,16 +250,15 @@ class TaskManager:
         """Remove old completed/failed tasks"""
         cutoff_time = datetime.now() - timedelta(seconds=api_config.task_retention_time)
         
-        tasks_to_remove = []
-        for task_id, task in self._tasks.items():
-            if task.status in [TaskStatus.COMPLETED, TaskStatus.FAILED, TaskStatus.CANCELLED]:
-                if task.completed_at and task.completed_at < cutoff_time:
-                    tasks_to_remove.append(task_id)
+        tasks_to_remove = [
+            task_id for task_id, task in self._tasks.items()
+            if task.status in _FINISHED_STATUSES
+            and task.completed_at and task.completed_at < cutoff_time
+        ]
         
         for task_id in tasks_to_remove:
             del self._tasks[task_id]
-            if task_id in self._task_futures:
-                del self._task_futures[task_id]
+            self._task_futures.pop(task_id, None)
         
         if tasks_to_remove:
             logger.info(f"Cleaned up {len(tasks_to_remove)} old tasks")
@@ -31,7 +31,7 @@ Usage:
 """
 from .schema import PixelleVideoConfig, LLMConfig, ComfyUIConfig, TTSSubConfig, ImageSubConfig, VideoSubConfig
 from .manager import ConfigManager
-from .loader import load_config_dict, save_config_dict
+from .loader import load_config_dict, save_config_dict, clear_config_cache
 
 # Global singleton instance
 config_manager = ConfigManager()
@@ -47,5 +47,6 @@ __all__ = [
     "config_manager",
     "load_config_dict",
     "save_config_dict",
+    "clear_config_cache",
 ]
 
@@ -14,18 +14,71 @@
 Configuration loader - Pure YAML
 
 Handles loading and saving configuration from/to YAML files.
+
+Parsed files are cached in-process and re-parsed only when the file's
+mtime or size changes (the web UI reloads config on every rerun).
+
+Set PIXELLE_VIDEO_CONFIG_CACHE=1 to also keep a pickled copy of the parsed
+config under temp/config_cache/, keyed by a hash of the file content, so
+fresh processes skip YAML parsing while the file is unchanged.
 """
+import copy
+import hashlib
+import os
+import pickle
 from pathlib import Path
-import yaml
+from functools import lru_cache
+from typing import Any, Dict, Optional, Tuple
 from loguru import logger
 
+from pixelle_video.utils.json_util import dumps as json_dumps, loads as json_loads
+
+
+# Parsed config cache: resolved path -> (st_mtime_ns, st_size, data, JSON snapshot or None)
+_config_cache: Dict[str, Tuple[int, int, dict, Optional[str]]] = {}
+
+# Opt-in on-disk cache of parsed config (pickle sidecar)
+_SIDECAR_ENV = "PIXELLE_VIDEO_CONFIG_CACHE"
+
+
+@lru_cache(maxsize=None)
+def _yaml_codec() -> Tuple[Any, Any, Any]:
+    """
+    Import PyYAML on first use (cache hits and pickle sidecars never need it)
+    
+    Returns:
+        (yaml module, safe Loader class, safe Dumper class), preferring the
+        libyaml C bindings (several times faster than pure-Python)
+    """
+    import yaml
+    try:
+        from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+    except ImportError:
+        from yaml import SafeLoader, SafeDumper
+    return yaml, SafeLoader, SafeDumper
+
+
+def clear_config_cache(config_path: Optional[str] = None):
+    """
+    Drop cached parsed configuration
+    
+    Args:
+        config_path: Only drop this file's entry (None = drop all)
+    """
+    if config_path is None:
+        _config_cache.clear()
+    else:
+        _config_cache.pop(str(Path(config_path).resolve()), None)
 
-def load_config_dict(config_path: str = "config.yaml") -> dict:
+
+def load_config_dict(config_path: str = "config.yaml", clone: bool = True) -> dict:
     """
     Load configuration from YAML file
     
     Args:
         config_path: Path to config file
+        clone: Return a private copy of the cached dict. Pass False when the
+            result is only read (e.g., validated into a model), to skip cloning
         
     Returns:
         Configuration dictionary
@@ -38,28 +91,137 @@ def load_config_dict(config_path: str = "config.yaml") -> dict:
         return {}
     
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f) or {}
+        stat = config_file.stat()
+        cache_key = str(config_file.resolve())
+        cached = _config_cache.get(cache_key)
+        if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            logger.debug(f"Configuration loaded from cache: {config_path}")
+            return _clone_cached(cached) if clone else cached[2]
+        
+        data = _parse_config_file(config_file)
+        cached = (stat.st_mtime_ns, stat.st_size, data, _json_snapshot(data))
+        _config_cache[cache_key] = cached
         logger.info(f"Configuration loaded from {config_path}")
-        return data
+        return _clone_cached(cached) if clone else data
     except Exception as e:
         logger.error(f"Failed to load config: {e}")
         return {}
 
 
-def save_config_dict(config: dict, config_path: str = "config.yaml"):
+def _json_snapshot(data: dict) -> Optional[str]:
+    """
+    Serialize parsed config for fast cloning
+    
+    Parsing a JSON snapshot (orjson) is much faster than copy.deepcopy for
+    nested dicts. Returns None when the config holds values that do not
+    survive a JSON round-trip unchanged (e.g., YAML dates, non-string keys).
+    """
+    try:
+        snapshot = json_dumps(data)
+    except TypeError:
+        return None
+    return snapshot if json_loads(snapshot) == data else None
+
+
+def _clone_cached(entry: Tuple[int, int, dict, Optional[str]]) -> dict:
+    """Return a private copy of a cached config (callers may mutate it)"""
+    snapshot = entry[3]
+    if snapshot is not None:
+        return json_loads(snapshot)
+    return copy.deepcopy(entry[2])
+
+
+def _parse_config_file(config_file: Path) -> dict:
+    """
+    Parse YAML config file (through the pickle sidecar cache when enabled)
+    
+    Args:
+        config_file: Path to config file
+    
+    Returns:
+        Configuration dictionary
+    """
+    if os.environ.get(_SIDECAR_ENV) != "1":
+        yaml, SafeLoader, _ = _yaml_codec()
+        with open(config_file, 'r', encoding='utf-8') as f:
+            return yaml.load(f, Loader=SafeLoader) or {}
+    
+    from pixelle_video.utils.os_util import get_temp_path
+    
+    raw = config_file.read_bytes()
+    digest = hashlib.blake2b(raw, digest_size=16).hexdigest()
+    cache_dir = Path(get_temp_path("config_cache"))
+    sidecar = cache_dir / f"{config_file.stem}.{digest}.pkl"
+    
+    try:
+        with open(sidecar, 'rb') as f:
+            return pickle.load(f)
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable config cache {sidecar.name}: {e}")
+    
+    yaml, SafeLoader, _ = _yaml_codec()
+    data = yaml.load(raw.decode('utf-8'), Loader=SafeLoader) or {}
+    
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = sidecar.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, sidecar)
+        
+        # Remove caches of previous versions of this file
+        for stale in cache_dir.glob(f"{config_file.stem}.*.pkl"):
+            if stale != sidecar:
+                stale.unlink(missing_ok=True)
+    except Exception as e:
+        logger.debug(f"Failed to write config cache: {e}")
+    
+    return data
+
+
+def save_config_dict(config: dict, config_path: str = "config.yaml") -> bool:
     """
     Save configuration to YAML file
     
+    The file is left untouched when its content would not change.
+    
     Args:
         config: Configuration dictionary
         config_path: Path to config file
+    
+    Returns:
+        True if the file was written, False if it was already up to date
     """
+    # Write to a temp file and swap it in, so a crash never leaves a partial config
+    tmp_path = f"{config_path}.tmp"
     try:
-        with open(config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(config, f, allow_unicode=True, default_flow_style=False, sort_keys=False)
+        yaml, _, SafeDumper = _yaml_codec()
+        content = yaml.dump(
+            config, Dumper=SafeDumper, allow_unicode=True, default_flow_style=False, sort_keys=False
+        ).encode('utf-8')
+        
+        try:
+            with open(config_path, 'rb') as f:
+                if f.read() == content:
+                    logger.debug(f"Configuration unchanged, skipped writing {config_path}")
+                    return False
+        except FileNotFoundError:
+            pass
+        
+        with open(tmp_path, 'wb') as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, config_path)
+        clear_config_cache(config_path)
         logger.info(f"Configuration saved to {config_path}")
+        return True
     except Exception as e:
         logger.error(f"Failed to save config: {e}")
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
         raise
-
@@ -15,9 +15,11 @@ Configuration Manager - Singleton pattern
 
 Provides unified access to configuration with automatic validation.
 """
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Optional
+from typing import Any, Iterator, Optional
 from loguru import logger
+from pydantic import BaseModel
 from .schema import PixelleVideoConfig
 from .loader import load_config_dict, save_config_dict
 
@@ -42,11 +44,15 @@ class ConfigManager:
         
         self.config_path = Path(config_path)
         self.config: PixelleVideoConfig = self._load()
+        self._batch_depth = 0
+        self._save_pending = False
         self._initialized = True
     
     def _load(self) -> PixelleVideoConfig:
         """Load configuration from file"""
-        data = load_config_dict(str(self.config_path))
+        # Validation copies every value into the model, so the cached dict
+        # can be passed as-is instead of cloning it first
+        data = load_config_dict(str(self.config_path), clone=False)
         config = PixelleVideoConfig(**data)
         
         # Validate template path exists
@@ -74,33 +80,78 @@ class ConfigManager:
         logger.info("Configuration reloaded")
     
     def save(self):
-        """Save current configuration to file"""
+        """Save current configuration to file (deferred while inside batch())"""
+        if self._batch_depth:
+            self._save_pending = True
+            return
         save_config_dict(self.config.to_dict(), str(self.config_path))
     
-    def update(self, updates: dict):
+    @contextmanager
+    def batch(self) -> Iterator['ConfigManager']:
+        """
+        Coalesce saves into a single write
+        
+        Calls to save() inside the block only mark the config as pending;
+        one write happens when the outermost block exits without error.
+        
+        Example:
+            with config_manager.batch():
+                config_manager.set_llm_config(api_key, base_url, model)
+                config_manager.save()
+                config_manager.set_comfyui_config(comfyui_url=url)
+                config_manager.save()
+        """
+        self._batch_depth += 1
+        pending = False
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                # Reset even when the block raised, so the flag can't leak
+                # into later batches
+                pending = self._save_pending
+                self._save_pending = False
+        
+        if pending:
+            self.save()
+    
+    def update(self, updates: dict) -> bool:
         """
         Update configuration with new values
         
         Args:
             updates: Dictionary of updates (e.g., {"llm": {"api_key": "xxx"}})
+        
+        Returns:
+            True if any value changed (unchanged updates skip re-validation)
         """
         current = self.config.to_dict()
+        changed = False
         
-        # Deep merge
+        # Deep merge (tracking whether any leaf value actually changed)
         def deep_merge(base: dict, updates: dict) -> dict:
+            nonlocal changed
             for key, value in updates.items():
                 if key in base and isinstance(base[key], dict) and isinstance(value, dict):
                     deep_merge(base[key], value)
-                else:
+                elif key not in base or base[key] != value:
                     base[key] = value
+                    changed = True
             return base
         
         merged = deep_merge(current, updates)
-        self.config = PixelleVideoConfig(**merged)
+        if changed:
+            self.config = PixelleVideoConfig(**merged)
+        return changed
     
     def get(self, key: str, default: Any = None) -> Any:
         """Dict-like access (for backward compatibility)"""
-        return self.config.to_dict().get(key, default)
+        if key not in PixelleVideoConfig.model_fields:
+            return default
+        # Dump only the requested section instead of the whole config
+        value = getattr(self.config, key)
+        return value.model_dump() if isinstance(value, BaseModel) else value
     
     def validate(self) -> bool:
         """Validate configuration completeness"""
@@ -114,9 +165,9 @@ class ConfigManager:
             "model": self.config.llm.model,
         }
     
-    def set_llm_config(self, api_key: str, base_url: str, model: str):
-        """Set LLM configuration"""
-        self.update({
+    def set_llm_config(self, api_key: str, base_url: str, model: str) -> bool:
+        """Set LLM configuration (returns True if anything changed)"""
+        return self.update({
             "llm": {
                 "api_key": api_key,
                 "base_url": base_url,
@@ -146,13 +197,14 @@ class ConfigManager:
         self, 
         comfyui_url: Optional[str] = None, 
         runninghub_api_key: Optional[str] = None
-    ):
-        """Set ComfyUI global configuration"""
+    ) -> bool:
+        """Set ComfyUI global configuration (returns True if anything changed)"""
         updates = {}
         if comfyui_url is not None:
             updates["comfyui_url"] = comfyui_url
         updates["runninghub_api_key"] = runninghub_api_key
         
         if updates:
-            self.update({"comfyui": updates})
+            return self.update({"comfyui": updates})
+        return False
 
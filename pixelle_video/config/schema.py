@@ -19,11 +19,17 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
+def _nonblank(value: Optional[str]) -> bool:
+    """Check that a string value is set and not just whitespace"""
+    return bool(value and value.strip())
+
+
 class LLMConfig(BaseModel):
     """LLM configuration"""
     api_key: str = Field(default="", description="LLM API Key")
     base_url: str = Field(default="", description="LLM API Base URL")
     model: str = Field(default="", description="LLM Model Name")
+    json_mode: bool = Field(default=False, description="Request JSON output (response_format=json_object) for structured prompts")
 
 
 class TTSLocalConfig(BaseModel):
@@ -94,11 +100,8 @@ class PixelleVideoConfig(BaseModel):
     
     def is_llm_configured(self) -> bool:
         """Check if LLM is properly configured"""
-        return bool(
-            self.llm.api_key and self.llm.api_key.strip() and
-            self.llm.base_url and self.llm.base_url.strip() and
-            self.llm.model and self.llm.model.strip()
-        )
+        llm = self.llm
+        return _nonblank(llm.api_key) and _nonblank(llm.base_url) and _nonblank(llm.model)
     
     def validate_required(self) -> bool:
         """Validate required configuration"""
@@ -16,6 +16,7 @@ Storyboard data models for video generation
 
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional, Dict, Any
 
 
@@ -86,6 +87,16 @@ class ContentMetadata:
     summary: Optional[str] = None              # Content summary
     publication_year: Optional[str] = None     # Publication year
     cover_url: Optional[str] = None            # Cover/thumbnail image URL
+    
+    @cached_property
+    def template_ext(self) -> Dict[str, str]:
+        """Frame template variables (computed once; don't mutate the result)"""
+        return {
+            "content_title": self.title or "",
+            "content_author": self.author or "",
+            "content_subtitle": self.subtitle or "",
+            "content_genre": self.genre or "",
+        }
 
 
 @dataclass
@@ -108,10 +108,8 @@ class BasePipeline(ABC):
             progress: Progress value (0.0-1.0)
             **kwargs: Additional event-specific parameters (frame_current, frame_total, etc.)
         """
-        if callback:
-            event = ProgressEvent(event_type=event_type, progress=progress, **kwargs)
-            callback(event)
-            logger.debug(f"Progress: {progress*100:.0f}% - {event_type}")
-        else:
-            logger.debug(f"Progress: {progress*100:.0f}% - {event_type}")
+        logger.debug("Progress: {:.0f}% - {}", progress * 100, event_type)
+        if callback is None:
+            return
+        callback(ProgressEvent(event_type=event_type, progress=progress, **kwargs))
 
@@ -19,6 +19,7 @@ This serves as a reference implementation showing how to extend BasePipeline.
 For real projects, copy this file and modify it according to your needs.
 """
 
+import asyncio
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable
@@ -179,57 +180,65 @@ class CustomPipeline(BasePipeline):
         self._report_progress(progress_callback, "processing_content", 0.10)
         
         # Example: Generate title using LLM
+        # The title doesn't depend on narrations or image prompts, so it is
+        # started now and awaited after Step 2 (the LLM calls overlap)
         from pixelle_video.utils.content_generators import generate_title
-        title = await generate_title(self.llm, text, strategy="llm")
-        logger.info(f"Generated title: '{title}'")
-        
-        # Example: Split or generate narrations
-        # Option A: Split by lines (for fixed script)
-        narrations = [line.strip() for line in text.split('\n') if line.strip()]
-        
-        # Option B: Use LLM to generate narrations (uncomment to use)
-        # from pixelle_video.utils.content_generators import generate_narrations_from_topic
-        # narrations = await generate_narrations_from_topic(
-        #     self.llm,
-        #     topic=text,
-        #     n_scenes=5,
-        #     min_words=20,
-        #     max_words=80
-        # )
-        
-        logger.info(f"Generated {len(narrations)} narrations")
-        
-        # ========== Step 2: Generate image prompts (CONDITIONAL - CUSTOMIZE THIS) ==========
-        self._report_progress(progress_callback, "generating_image_prompts", 0.25)
-        
-        # IMPORTANT: Check if template is image type
-        # If your template is static_*.html, you can skip this entire step!
-        if template_requires_image:
-            # Template requires images - generate image prompts using LLM
-            from pixelle_video.utils.content_generators import generate_image_prompts
+        title_task = asyncio.ensure_future(generate_title(self.llm, text, strategy="llm"))
+        try:
+            # Example: Split or generate narrations
+            # Option A: Split by lines (for fixed script)
+            narrations = [line.strip() for line in text.split('\n') if line.strip()]
             
-            image_prompts = await generate_image_prompts(
-                self.llm,
-                narrations=narrations,
-                min_words=30,
-                max_words=60
-            )
+            # Option B: Use LLM to generate narrations (uncomment to use)
+            # from pixelle_video.utils.content_generators import generate_narrations_from_topic
+            # narrations = await generate_narrations_from_topic(
+            #     self.llm,
+            #     topic=text,
+            #     n_scenes=5,
+            #     min_words=20,
+            #     max_words=80
+            # )
             
-            # Example: Apply custom prompt prefix
-            from pixelle_video.utils.prompt_helper import build_image_prompt
-            custom_prefix = "cinematic style, professional lighting"  # Customize this
+            logger.info(f"Generated {len(narrations)} narrations")
             
-            final_image_prompts = []
-            for base_prompt in image_prompts:
-                final_prompt = build_image_prompt(base_prompt, custom_prefix)
-                final_image_prompts.append(final_prompt)
+            # ========== Step 2: Generate image prompts (CONDITIONAL - CUSTOMIZE THIS) ==========
+            self._report_progress(progress_callback, "generating_image_prompts", 0.25)
             
-            logger.info(f"✅ Generated {len(final_image_prompts)} image prompts")
-        else:
-            # Template doesn't need images - skip image generation entirely
-            final_image_prompts = [None] * len(narrations)
-            logger.info(f"⚡ Skipped image prompt generation (template doesn't need images)")
-            logger.info(f"   💡 Savings: {len(narrations)} LLM calls + {len(narrations)} image generations")
+            # IMPORTANT: Check if template is image type
+            # If your template is static_*.html, you can skip this entire step!
+            if template_requires_image:
+                # Template requires images - generate image prompts using LLM
+                from pixelle_video.utils.content_generators import generate_image_prompts
+                
+                image_prompts = await generate_image_prompts(
+                    self.llm,
+                    narrations=narrations,
+                    min_words=30,
+                    max_words=60
+                )
+                
+                # Example: Apply custom prompt prefix
+                from pixelle_video.utils.prompt_helper import build_image_prompt
+                custom_prefix = "cinematic style, professional lighting"  # Customize this
+                
+                final_image_prompts = []
+                for base_prompt in image_prompts:
+                    final_prompt = build_image_prompt(base_prompt, custom_prefix)
+                    final_image_prompts.append(final_prompt)
+                
+                logger.info(f"✅ Generated {len(final_image_prompts)} image prompts")
+            else:
+                # Template doesn't need images - skip image generation entirely
+                final_image_prompts = [None] * len(narrations)
+                logger.info(f"⚡ Skipped image prompt generation (template doesn't need images)")
+                logger.info(f"   💡 Savings: {len(narrations)} LLM calls + {len(narrations)} image generations")
+            
+            title = await title_task
+        finally:
+            # Don't leave the title request running if an earlier step failed
+            if not title_task.done():
+                title_task.cancel()
+        logger.info(f"Generated title: '{title}'")
         
         # ========== Step 3: Create storyboard ==========
         config = StoryboardConfig(
@@ -306,10 +315,10 @@ class CustomPipeline(BasePipeline):
             self._report_progress(progress_callback, "concatenating", 0.85)
             segment_paths = [frame.video_segment_path for frame in storyboard.frames]
             
-            from pixelle_video.services.video import VideoService
-            video_service = VideoService()
+            # Shared instance created once by the core
+            video_service = self.core.video
             
-            final_video_path = video_service.concat_videos(
+            final_video_path = await video_service.concat_videos_async(
                 videos=segment_paths,
                 output=output_path,
                 bgm_path=bgm_path,
@@ -17,6 +17,8 @@ Standard workflow for generating short videos from topic or fixed script.
 This is the default pipeline for general-purpose video generation.
 """
 
+import asyncio
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Callable, Literal, Dict, Any
@@ -35,11 +37,40 @@ from pixelle_video.models.storyboard import (
 from pixelle_video.utils.content_generators import (
     generate_title,
     generate_narrations_from_topic,
+    generate_title_and_narrations_from_topic,
     split_narration_script,
     generate_image_prompts,
 )
 
 
+# Supported processing modes
+_MODES = ("generate", "fixed")
+
+
+class _FrameProgressAdapter:
+    """
+    Maps a frame's own progress (0.0-1.0) onto the overall pipeline range
+    
+    One instance per frame, passed to the frame processor as its
+    progress_callback.
+    """
+    
+    __slots__ = ("report", "base", "per")
+    
+    def __init__(
+        self,
+        report: Callable[[ProgressEvent, float], None],
+        base: float,
+        per: float
+    ):
+        self.report = report
+        self.base = base
+        self.per = per
+    
+    def __call__(self, event: ProgressEvent):
+        self.report(event, self.base + self.per * event.progress)
+
+
 class StandardPipeline(BasePipeline):
     """
     Standard video generation pipeline
@@ -115,6 +146,11 @@ class StandardPipeline(BasePipeline):
         # === Advanced Options ===
         content_metadata: Optional[ContentMetadata] = None,
         progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        max_concurrent_frames: int = 1,
+        reuse_identical_media: bool = True,
+        media_prefetch_concurrency: int = 1,
+        tts_batch_concurrency: int = 1,
+        use_script_cache: bool = False,
     ) -> VideoGenerationResult:
         """
         Generate short video from text input
@@ -168,26 +204,48 @@ class StandardPipeline(BasePipeline):
             
             content_metadata: Content metadata (optional, for display)
             progress_callback: Progress callback function(ProgressEvent)
+            max_concurrent_frames: Frames processed concurrently (default 1 = sequential)
+                                   Frames are independent; higher values overlap their
+                                   TTS/media requests (bounded by provider limits)
+            reuse_identical_media: Generate media once for frames whose image prompts
+                                   are identical, and reuse it for the others (default True)
+            media_prefetch_concurrency: When > 1, media for all frames is generated up front
+                                   with this many requests in flight, while frames are
+                                   processed (default 1 = generate per frame).
+                                   Requires reuse_identical_media
+            tts_batch_concurrency: When > 1, narration audio for all frames is synthesized
+                                   before frame processing with this many requests in
+                                   flight (default 1 = synthesize per frame)
+            use_script_cache: Reuse the title, narrations and media prompts of an earlier
+                              run with identical input and LLM settings, skipping the LLM
+                              steps (default False)
         
         Returns:
             VideoGenerationResult with video path and metadata
         """
         # ========== Step 0: Process text and determine title ==========
-        logger.info(f"🚀 Starting StandardPipeline in '{mode}' mode")
-        logger.info(f"   Text length: {len(text)} chars")
+        if mode not in _MODES:
+            raise ValueError(f"Invalid mode: '{mode}' (expected one of: {', '.join(_MODES)})")
+        
+        logger.info("🚀 Starting StandardPipeline in '{}' mode", mode)
+        logger.info("   Text length: {} chars", len(text))
         
         # Determine final title
         if title:
             final_title = title
-            logger.info(f"   Title: '{title}' (user-specified)")
+            logger.info("   Title: '{}' (user-specified)", title)
         else:
             self._report_progress(progress_callback, "generating_title", 0.01)
-            if mode == "generate":
-                final_title = await generate_title(self.llm, text, strategy="auto")
-                logger.info(f"   Title: '{final_title}' (auto-generated)")
-            else:  # fixed
-                final_title = await generate_title(self.llm, text, strategy="llm")
-                logger.info(f"   Title: '{final_title}' (LLM-generated)")
+            topic = text.strip()
+            if mode == "generate" and len(topic) <= 15:
+                # Short topic is used as the title as-is
+                final_title = topic
+                logger.info("   Title: '{}' (auto-generated)", final_title)
+            else:
+                # Generated by the LLM in Step 1: in the same call as the
+                # narrations (generate mode), or concurrently with the script
+                # split and media prompts (fixed mode)
+                final_title = None
         
         # ========== Step 0.5: Create isolated task directory ==========
         from pixelle_video.utils.os_util import (
@@ -270,7 +328,7 @@ class StandardPipeline(BasePipeline):
         
         # Create storyboard
         storyboard = Storyboard(
-            title=final_title,
+            title=final_title or "",
             config=config,
             content_metadata=content_metadata,
             created_at=datetime.now()
@@ -286,191 +344,321 @@ class StandardPipeline(BasePipeline):
             logger.info(f"⚡ Static template - skipping media generation pipeline")
             logger.info(f"   💡 Benefits: Faster generation + Lower cost + No ComfyUI dependency")
         
+        title_task = None
         try:
-            # ========== Step 1: Generate/Split narrations ==========
-            if mode == "generate":
-                self._report_progress(progress_callback, "generating_narrations", 0.05)
-                narrations = await generate_narrations_from_topic(
-                    self.llm,
-                    topic=text,
-                    n_scenes=n_scenes,
-                    min_words=min_narration_words,
-                    max_words=max_narration_words
-                )
-                logger.info(f"✅ Generated {len(narrations)} narrations")
-            else:  # fixed
-                self._report_progress(progress_callback, "splitting_script", 0.05)
-                narrations = await split_narration_script(text)
-                logger.info(f"✅ Split script into {len(narrations)} segments (by lines)")
-                logger.info(f"   Note: n_scenes={n_scenes} is ignored in fixed mode")
-            
-            # ========== Step 2: Generate media prompts (conditional) ==========
-            if template_media_type == "video":
-                # Video template: generate video prompts
-                self._report_progress(progress_callback, "generating_video_prompts", 0.15)
+            # Reuse a cached script (Steps 1-2) from an identical earlier run
+            script_cache_key = None
+            cached_script = None
+            if use_script_cache:
+                from pixelle_video.utils.script_cache import get_cached_script, make_script_cache_key
                 
-                from pixelle_video.utils.content_generators import generate_video_prompts
-                
-                # Override prompt_prefix if provided
-                original_prefix = None
-                if prompt_prefix is not None:
-                    image_config = self.core.config.get("comfyui", {}).get("image", {})
-                    original_prefix = image_config.get("prompt_prefix")
-                    image_config["prompt_prefix"] = prompt_prefix
-                    logger.info(f"Using custom prompt_prefix: '{prompt_prefix}'")
+                image_config = self.core.config.get("comfyui", {}).get("image", {})
+                llm_config = self.core.config.get("llm", {})
+                script_cache_key = make_script_cache_key(
+                    text=text,
+                    mode=mode,
+                    generate_title=final_title is None,
+                    n_scenes=n_scenes if mode == "generate" else None,
+                    min_narration_words=min_narration_words,
+                    max_narration_words=max_narration_words,
+                    min_image_prompt_words=min_image_prompt_words,
+                    max_image_prompt_words=max_image_prompt_words,
+                    media_type=template_media_type,
+                    prompt_prefix=prompt_prefix if prompt_prefix is not None else image_config.get("prompt_prefix", ""),
+                    model=llm_config.get("model"),
+                    base_url=llm_config.get("base_url"),
+                )
+                cached_script = get_cached_script(script_cache_key)
+            
+            if cached_script is not None:
+                narrations = cached_script["narrations"]
+                image_prompts = cached_script["image_prompts"]
+                if final_title is None:
+                    final_title = cached_script["title"]
+                    storyboard.title = final_title
+                    logger.info("   Title: '{}' (cached)", final_title)
+                self._report_progress(progress_callback, "preparing_frames", 0.15)
+                logger.info(f"♻️  Reusing cached script: {len(narrations)} narrations + media prompts (LLM steps skipped)")
+            else:
+                # ========== Step 1: Generate/Split narrations ==========
+                if mode == "fixed" and final_title is None:
+                    title_task = asyncio.create_task(generate_title(self.llm, text, strategy="llm"))
                 
-                try:
-                    # Create progress callback wrapper for video prompt generation
-                    def video_prompt_progress(completed: int, total: int, message: str):
-                        batch_progress = completed / total if total > 0 else 0
-                        overall_progress = 0.15 + (batch_progress * 0.15)
-                        self._report_progress(
-                            progress_callback,
-                            "generating_video_prompts",
-                            overall_progress,
-                            extra_info=message
+                if mode == "generate":
+                    self._report_progress(progress_callback, "generating_narrations", 0.05)
+                    if final_title is None:
+                        final_title, narrations = await generate_title_and_narrations_from_topic(
+                            self.llm,
+                            topic=text,
+                            n_scenes=n_scenes,
+                            min_words=min_narration_words,
+                            max_words=max_narration_words
+                        )
+                        storyboard.title = final_title
+                        logger.info(f"   Title: '{final_title}' (auto-generated)")
+                    else:
+                        narrations = await generate_narrations_from_topic(
+                            self.llm,
+                            topic=text,
+                            n_scenes=n_scenes,
+                            min_words=min_narration_words,
+                            max_words=max_narration_words
                         )
+                    logger.info(f"✅ Generated {len(narrations)} narrations")
+                else:  # fixed
+                    self._report_progress(progress_callback, "splitting_script", 0.05)
+                    narrations = await split_narration_script(text)
+                    logger.info(f"✅ Split script into {len(narrations)} segments (by lines)")
+                    logger.info(f"   Note: n_scenes={n_scenes} is ignored in fixed mode")
+                
+                # ========== Step 2: Generate media prompts (conditional) ==========
+                if template_media_type == "video":
+                    # Video template: generate video prompts
+                    self._report_progress(progress_callback, "generating_video_prompts", 0.15)
                     
-                    # Generate base video prompts
-                    base_image_prompts = await generate_video_prompts(
-                        self.llm,
-                        narrations=narrations,
-                        min_words=min_image_prompt_words,
-                        max_words=max_image_prompt_words,
-                        progress_callback=video_prompt_progress
-                    )
+                    from pixelle_video.utils.content_generators import generate_video_prompts
                     
-                    # Apply prompt prefix
-                    from pixelle_video.utils.prompt_helper import build_image_prompt
+                    # Override prompt_prefix if provided
                     image_config = self.core.config.get("comfyui", {}).get("image", {})
-                    prompt_prefix_to_use = prompt_prefix if prompt_prefix is not None else image_config.get("prompt_prefix", "")
-                    
-                    image_prompts = []
-                    for base_prompt in base_image_prompts:
-                        final_prompt = build_image_prompt(base_prompt, prompt_prefix_to_use)
-                        image_prompts.append(final_prompt)
+                    original_prefix = None
+                    if prompt_prefix is not None:
+                        original_prefix = image_config.get("prompt_prefix")
+                        image_config["prompt_prefix"] = prompt_prefix
+                        logger.info(f"Using custom prompt_prefix: '{prompt_prefix}'")
                     
-                finally:
-                    # Restore original prompt_prefix
-                    if original_prefix is not None:
-                        image_config["prompt_prefix"] = original_prefix
-                
-                logger.info(f"✅ Generated {len(image_prompts)} video prompts")
-            
-            elif template_media_type == "image":
-                # Image template: generate image prompts
-                self._report_progress(progress_callback, "generating_image_prompts", 0.15)
-                
-                # Override prompt_prefix if provided
-                original_prefix = None
-                if prompt_prefix is not None:
-                    image_config = self.core.config.get("comfyui", {}).get("image", {})
-                    original_prefix = image_config.get("prompt_prefix")
-                    image_config["prompt_prefix"] = prompt_prefix
-                    logger.info(f"Using custom prompt_prefix: '{prompt_prefix}'")
-                
-                try:
-                    # Create progress callback wrapper for image prompt generation
-                    def image_prompt_progress(completed: int, total: int, message: str):
-                        batch_progress = completed / total if total > 0 else 0
-                        overall_progress = 0.15 + (batch_progress * 0.15)
-                        self._report_progress(
-                            progress_callback,
-                            "generating_image_prompts",
-                            overall_progress,
-                            extra_info=message
+                    try:
+                        # Create progress callback wrapper for video prompt generation
+                        def video_prompt_progress(completed: int, total: int, message: str):
+                            batch_progress = completed / total if total > 0 else 0
+                            overall_progress = 0.15 + (batch_progress * 0.15)
+                            self._report_progress(
+                                progress_callback,
+                                "generating_video_prompts",
+                                overall_progress,
+                                extra_info=message
+                            )
+                        
+                        # Generate base video prompts
+                        base_image_prompts = await generate_video_prompts(
+                            self.llm,
+                            narrations=narrations,
+                            min_words=min_image_prompt_words,
+                            max_words=max_image_prompt_words,
+                            progress_callback=video_prompt_progress
                         )
+                        
+                        # Apply prompt prefix
+                        from pixelle_video.utils.prompt_helper import build_image_prompt
+                        prompt_prefix_to_use = prompt_prefix if prompt_prefix is not None else image_config.get("prompt_prefix", "")
+                        
+                        image_prompts = [
+                            build_image_prompt(base_prompt, prompt_prefix_to_use)
+                            for base_prompt in base_image_prompts
+                        ]
+                        
+                    finally:
+                        # Restore original prompt_prefix
+                        if original_prefix is not None:
+                            image_config["prompt_prefix"] = original_prefix
                     
-                    # Generate base image prompts
-                    base_image_prompts = await generate_image_prompts(
-                        self.llm,
-                        narrations=narrations,
-                        min_words=min_image_prompt_words,
-                        max_words=max_image_prompt_words,
-                        progress_callback=image_prompt_progress
-                    )
+                    logger.info(f"✅ Generated {len(image_prompts)} video prompts")
+                
+                elif template_media_type == "image":
+                    # Image template: generate image prompts
+                    self._report_progress(progress_callback, "generating_image_prompts", 0.15)
                     
-                    # Apply prompt prefix
-                    from pixelle_video.utils.prompt_helper import build_image_prompt
+                    # Override prompt_prefix if provided
                     image_config = self.core.config.get("comfyui", {}).get("image", {})
-                    prompt_prefix_to_use = prompt_prefix if prompt_prefix is not None else image_config.get("prompt_prefix", "")
+                    original_prefix = None
+                    if prompt_prefix is not None:
+                        original_prefix = image_config.get("prompt_prefix")
+                        image_config["prompt_prefix"] = prompt_prefix
+                        logger.info(f"Using custom prompt_prefix: '{prompt_prefix}'")
                     
-                    image_prompts = []
-                    for base_prompt in base_image_prompts:
-                        final_prompt = build_image_prompt(base_prompt, prompt_prefix_to_use)
-                        image_prompts.append(final_prompt)
+                    try:
+                        # Create progress callback wrapper for image prompt generation
+                        def image_prompt_progress(completed: int, total: int, message: str):
+                            batch_progress = completed / total if total > 0 else 0
+                            overall_progress = 0.15 + (batch_progress * 0.15)
+                            self._report_progress(
+                                progress_callback,
+                                "generating_image_prompts",
+                                overall_progress,
+                                extra_info=message
+                            )
+                        
+                        # Generate base image prompts
+                        base_image_prompts = await generate_image_prompts(
+                            self.llm,
+                            narrations=narrations,
+                            min_words=min_image_prompt_words,
+                            max_words=max_image_prompt_words,
+                            progress_callback=image_prompt_progress
+                        )
+                        
+                        # Apply prompt prefix
+                        from pixelle_video.utils.prompt_helper import build_image_prompt
+                        prompt_prefix_to_use = prompt_prefix if prompt_prefix is not None else image_config.get("prompt_prefix", "")
+                        
+                        image_prompts = [
+                            build_image_prompt(base_prompt, prompt_prefix_to_use)
+                            for base_prompt in base_image_prompts
+                        ]
+                        
+                    finally:
+                        # Restore original prompt_prefix
+                        if original_prefix is not None:
+                            image_config["prompt_prefix"] = original_prefix
                     
-                finally:
-                    # Restore original prompt_prefix
-                    if original_prefix is not None:
-                        image_config["prompt_prefix"] = original_prefix
+                    logger.info(f"✅ Generated {len(image_prompts)} image prompts")
                 
-                logger.info(f"✅ Generated {len(image_prompts)} image prompts")
+                else:  # text
+                    # Text-only template: skip media prompt generation
+                    image_prompts = [None] * len(narrations)
+                    self._report_progress(progress_callback, "preparing_frames", 0.15)
+                    logger.info(f"⚡ Skipped media prompt generation (text-only template)")
+                    logger.info(f"   💡 Savings: {len(narrations)} LLM calls + {len(narrations)} media generations")
             
-            else:  # text
-                # Text-only template: skip media prompt generation
-                image_prompts = [None] * len(narrations)
-                self._report_progress(progress_callback, "preparing_frames", 0.15)
-                logger.info(f"⚡ Skipped media prompt generation (text-only template)")
-                logger.info(f"   💡 Savings: {len(narrations)} LLM calls + {len(narrations)} media generations")
+            if title_task is not None:
+                final_title = await title_task
+                storyboard.title = final_title
+                logger.info(f"   Title: '{final_title}' (LLM-generated)")
+            
+            if script_cache_key is not None and cached_script is None:
+                from pixelle_video.utils.script_cache import set_cached_script
+                set_cached_script(
+                    script_cache_key,
+                    title=None if title else final_title,
+                    narrations=narrations,
+                    image_prompts=image_prompts
+                )
             
             # ========== Step 3: Create frames ==========
-            for i, (narration, image_prompt) in enumerate(zip(narrations, image_prompts)):
-                frame = StoryboardFrame(
+            # All frames are created together; one timestamp serves them all
+            frames_created_at = datetime.now()
+            storyboard.frames.extend(
+                StoryboardFrame(
                     index=i,
                     narration=narration,
                     image_prompt=image_prompt,
-                    created_at=datetime.now()
+                    created_at=frames_created_at
                 )
-                storyboard.frames.append(frame)
+                for i, (narration, image_prompt) in enumerate(zip(narrations, image_prompts))
+            )
             
             # ========== Step 4: Process each frame ==========
-            for i, frame in enumerate(storyboard.frames):
-                base_progress = 0.2
-                frame_range = 0.6
-                per_frame_progress = frame_range / len(storyboard.frames)
+            # Frames are independent, so up to max_concurrent_frames run at once
+            # (their TTS/media requests overlap). Progress never moves backwards.
+            n_frames = len(storyboard.frames)
+            base_progress = 0.2
+            frame_range = 0.6
+            per_frame_progress = frame_range / n_frames if n_frames else 0.0
+            last_progress = base_progress
+            semaphore = asyncio.Semaphore(max(1, max_concurrent_frames))
+            media_tasks = {} if reuse_identical_media else None
+            # Filled by index as frames complete, so order is kept under concurrency
+            segment_paths = [None] * n_frames
+            
+            if media_tasks is not None:
+                n_unique_prompts = len({p for p in image_prompts if p is not None})
+                n_media_prompts = sum(1 for p in image_prompts if p is not None)
+                if n_unique_prompts < n_media_prompts:
+                    logger.info(f"♻️  {n_media_prompts - n_unique_prompts} frame(s) reuse media from identical prompts")
                 
-                # Create frame-specific progress callback
-                def frame_progress_callback(event: ProgressEvent):
-                    overall_progress = base_progress + (per_frame_progress * i) + (per_frame_progress * event.progress)
+                if media_prefetch_concurrency > 1 and n_unique_prompts:
+                    self.core.frame_processor.prefetch_media(
+                        image_prompts,
+                        config,
+                        media_tasks,
+                        max_concurrency=media_prefetch_concurrency
+                    )
+                    logger.info(f"🚀 Prefetching media for {n_unique_prompts} prompt(s) ({media_prefetch_concurrency} concurrent)")
+            
+            def report_frame_progress(event: ProgressEvent, overall_progress: float):
+                nonlocal last_progress
+                last_progress = max(last_progress, overall_progress)
+                if progress_callback:
+                    progress_callback(ProgressEvent(
+                        event_type=event.event_type,
+                        progress=last_progress,
+                        frame_current=event.frame_current,
+                        frame_total=event.frame_total,
+                        step=event.step,
+                        action=event.action
+                    ))
+            
+            async def process_frame(i: int, frame: StoryboardFrame) -> StoryboardFrame:
+                async with semaphore:
+                    frame_base_progress = base_progress + (per_frame_progress * i)
+                    
+                    # Frame-specific progress callback (none needed without a user callback)
+                    frame_progress_callback = None
                     if progress_callback:
-                        adjusted_event = ProgressEvent(
-                            event_type=event.event_type,
-                            progress=overall_progress,
-                            frame_current=event.frame_current,
-                            frame_total=event.frame_total,
-                            step=event.step,
-                            action=event.action
+                        frame_progress_callback = _FrameProgressAdapter(
+                            report_frame_progress,
+                            frame_base_progress,
+                            per_frame_progress
                         )
-                        progress_callback(adjusted_event)
-                
-                # Report frame start
-                self._report_progress(
-                    progress_callback,
-                    "processing_frame",
-                    base_progress + (per_frame_progress * i),
-                    frame_current=i+1,
-                    frame_total=len(storyboard.frames)
-                )
+                        
+                        # Report frame start
+                        report_frame_progress(
+                            ProgressEvent(
+                                event_type="processing_frame",
+                                progress=0.0,
+                                frame_current=i+1,
+                                frame_total=n_frames
+                            ),
+                            frame_base_progress
+                        )
+                    
+                    processed_frame = await self.core.frame_processor(
+                        frame=frame,
+                        storyboard=storyboard,
+                        config=config,
+                        total_frames=n_frames,
+                        progress_callback=frame_progress_callback,
+                        media_tasks=media_tasks
+                    )
+                    segment_paths[i] = processed_frame.video_segment_path
+                    logger.info("✅ Frame {} completed ({:.2f}s)", i+1, processed_frame.duration)
+                    return processed_frame
+            
+            frame_tasks = []
+            try:
+                if tts_batch_concurrency > 1 and n_frames > 1:
+                    # Overlaps with any media prefetch started above
+                    logger.info(f"🎙️  Synthesizing audio for {n_frames} frames ({tts_batch_concurrency} concurrent)")
+                    await self.core.frame_processor.synthesize_audio(
+                        storyboard.frames,
+                        config,
+                        max_concurrency=tts_batch_concurrency
+                    )
                 
-                processed_frame = await self.core.frame_processor(
-                    frame=frame,
-                    storyboard=storyboard,
-                    config=config,
-                    total_frames=len(storyboard.frames),
-                    progress_callback=frame_progress_callback
-                )
-                storyboard.total_duration += processed_frame.duration
-                logger.info(f"✅ Frame {i+1} completed ({processed_frame.duration:.2f}s)")
+                frame_tasks = [
+                    asyncio.ensure_future(process_frame(i, frame))
+                    for i, frame in enumerate(storyboard.frames)
+                ]
+                processed_frames = await asyncio.gather(*frame_tasks)
+            except BaseException:
+                # Don't leave sibling frames running after a failure
+                for task in frame_tasks:
+                    task.cancel()
+                for task in (media_tasks or {}).values():
+                    task.cancel()
+                raise
+            finally:
+                # Frames keep only file paths; drop the shared media results
+                if media_tasks:
+                    media_tasks.clear()
+            storyboard.total_duration += sum(f.duration for f in processed_frames)
             
             # ========== Step 5: Concatenate videos ==========
             self._report_progress(progress_callback, "concatenating", 0.85)
-            segment_paths = [frame.video_segment_path for frame in storyboard.frames]
             
-            from pixelle_video.services.video import VideoService
-            video_service = VideoService()
+            # Shared instance created once by the core
+            video_service = self.core.video
             
-            final_video_path = video_service.concat_videos(
+            final_video_path = await video_service.concat_videos_async(
                 videos=segment_paths,
                 output=output_path,
                 bgm_path=bgm_path,
@@ -484,7 +672,7 @@ class StandardPipeline(BasePipeline):
             # Copy to user-specified path if provided
             if user_specified_output:
                 import shutil
-                Path(user_specified_output).parent.mkdir(parents=True, exist_ok=True)
+                os.makedirs(os.path.dirname(user_specified_output) or ".", exist_ok=True)
                 shutil.copy2(final_video_path, user_specified_output)
                 logger.info(f"📹 Final video copied to: {user_specified_output}")
                 final_video_path = user_specified_output
@@ -495,8 +683,7 @@ class StandardPipeline(BasePipeline):
             # ========== Step 6: Create result ==========
             self._report_progress(progress_callback, "completed", 1.0)
             
-            video_path_obj = Path(final_video_path)
-            file_size = video_path_obj.stat().st_size
+            file_size = os.stat(final_video_path).st_size
             
             result = VideoGenerationResult(
                 video_path=final_video_path,
@@ -515,6 +702,11 @@ class StandardPipeline(BasePipeline):
         except Exception as e:
             logger.error(f"❌ Video generation failed: {e}")
             raise
+        
+        finally:
+            # Also covers cancellation: never leave the title request running
+            if title_task is not None and not title_task.done():
+                title_task.cancel()
     
     def _check_template_media_type(self, frame_template: str) -> str:
         """
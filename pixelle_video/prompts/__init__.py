@@ -17,13 +17,17 @@ Centralized prompt management for all LLM interactions.
 """
 
 # Narration prompts
-from pixelle_video.prompts.topic_narration import build_topic_narration_prompt
+from pixelle_video.prompts.topic_narration import (
+    build_topic_narration_prompt,
+    build_topic_narration_with_title_prompt,
+)
 from pixelle_video.prompts.content_narration import build_content_narration_prompt
 from pixelle_video.prompts.title_generation import build_title_generation_prompt
 
 # Image prompts
 from pixelle_video.prompts.image_generation import (
     build_image_prompt_prompt,
+    ImageStylePreset,
     IMAGE_STYLE_PRESETS,
     DEFAULT_IMAGE_STYLE
 )
@@ -34,6 +38,7 @@ __all__ = [
     # Narration builders
     "build_topic_narration_prompt",
     "build_content_narration_prompt",
+    "build_topic_narration_with_title_prompt",
     "build_title_generation_prompt",
     
     # Image builders
@@ -41,6 +46,7 @@ __all__ = [
     "build_style_conversion_prompt",
     
     # Image style presets
+    "ImageStylePreset",
     "IMAGE_STYLE_PRESETS",
     "DEFAULT_IMAGE_STYLE",
 ]
@@ -16,6 +16,14 @@ Content narration generation prompt
 For extracting/refining narrations from user-provided content.
 """
 
+from functools import lru_cache
+
+from pixelle_video.prompts.narration_common import (
+    NARRATION_OUTPUT_FORMAT_HEADER,
+    NARRATION_REMINDER_HEADER,
+)
+from pixelle_video.utils.prompt_helper import compile_template, render_template
+
 
 CONTENT_NARRATION_PROMPT = """# 角色定位
 你是一位专业的内容提炼专家，擅长从用户提供的内容中提取核心要点，并转化成适合短视频的脚本。
@@ -50,9 +58,7 @@ CONTENT_NARRATION_PROMPT = """# 角色定位
 - 每个分镜像同一个人在讲述，语气一致
 - 确保提炼的内容忠于用户原意，但更适合短视频呈现
 
-# 输出格式
-严格按照以下JSON格式输出，不要添加任何额外的文字说明：
-
+""" + NARRATION_OUTPUT_FORMAT_HEADER + """
 ```json
 {{
   "narrations": [
@@ -63,10 +69,7 @@ CONTENT_NARRATION_PROMPT = """# 角色定位
 }}
 ```
 
-# 重要提醒
-1. 只输出JSON格式内容，不要添加任何解释说明
-2. 确保JSON格式严格正确，可以被程序直接解析
-3. 旁白必须严格控制在{min_words}~{max_words}字之间
+""" + NARRATION_REMINDER_HEADER + """3. 旁白必须严格控制在{min_words}~{max_words}字之间
 4. 必须输出恰好 {n_storyboard} 个分镜的旁白
 5. 内容要忠于用户原意，但优化为更适合口播的表达
 6. 输出格式为 {{"narrations": [旁白数组]}} 的JSON对象
@@ -74,7 +77,10 @@ CONTENT_NARRATION_PROMPT = """# 角色定位
 现在，请从上述内容中提炼出 {n_storyboard} 个分镜的旁白。只输出JSON，不要其他内容。
 """
 
+_COMPILED_CONTENT_NARRATION_PROMPT = compile_template(CONTENT_NARRATION_PROMPT)
 
+
+@lru_cache(maxsize=128)
 def build_content_narration_prompt(
     content: str,
     n_storyboard: int,
@@ -91,12 +97,11 @@ def build_content_narration_prompt(
         max_words: Maximum word count
     
     Returns:
-        Formatted prompt
+        Formatted prompt (memoized per argument tuple)
     """
-    return CONTENT_NARRATION_PROMPT.format(
-        content=content,
-        n_storyboard=n_storyboard,
-        min_words=min_words,
-        max_words=max_words
-    )
-
+    return render_template(_COMPILED_CONTENT_NARRATION_PROMPT, {
+        "content": content,
+        "n_storyboard": n_storyboard,
+        "min_words": min_words,
+        "max_words": max_words,
+    })
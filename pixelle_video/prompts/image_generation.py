@@ -16,47 +16,64 @@ Image prompt generation template
 For generating image prompts from narrations.
 """
 
-import json
+import sys
+from dataclasses import dataclass
 from typing import List, Optional
 
+from pixelle_video.utils.json_util import dumps as json_dumps
+from pixelle_video.utils.prompt_helper import compile_template, render_template
+
 
 # ==================== PRESET IMAGE STYLES ====================
 # Predefined visual styles for different use cases
 
+@dataclass(frozen=True, slots=True)
+class ImageStylePreset:
+    """Predefined image style"""
+    
+    name: str               # Display name
+    description: str        # Style prompt (English, interned)
+    use_case: str           # When to use this style
+    
+    def __getitem__(self, key: str) -> str:
+        """Dict-style access (presets used to be plain dicts)"""
+        if key not in self.__slots__:
+            raise KeyError(key)
+        return getattr(self, key)
+
+
 IMAGE_STYLE_PRESETS = {
-    "stick_figure": {
-        "name": "火柴人简笔画",
-        "description": "stick figure style sketch, black and white lines, pure white background, minimalist hand-drawn feel",
-        "use_case": "通用场景，简单直观"
-    },
+    "stick_figure": ImageStylePreset(
+        name="火柴人简笔画",
+        description=sys.intern("stick figure style sketch, black and white lines, pure white background, minimalist hand-drawn feel"),
+        use_case="通用场景，简单直观"
+    ),
     
-    "minimal": {
-        "name": "极简抽象",
-        "description": "minimalist abstract art, geometric shapes, clean composition, modern design, soft pastel colors",
-        "use_case": "现代感、艺术感"
-    },
+    "minimal": ImageStylePreset(
+        name="极简抽象",
+        description=sys.intern("minimalist abstract art, geometric shapes, clean composition, modern design, soft pastel colors"),
+        use_case="现代感、艺术感"
+    ),
     
-    "concept": {
-        "name": "概念化视觉",
-        "description": "conceptual visual metaphors, symbolic elements, thought-provoking imagery, artistic interpretation",
-        "use_case": "深度内容、哲学思考"
-    },
+    "concept": ImageStylePreset(
+        name="概念化视觉",
+        description=sys.intern("conceptual visual metaphors, symbolic elements, thought-provoking imagery, artistic interpretation"),
+        use_case="深度内容、哲学思考"
+    ),
 }
 
 # Default preset
 DEFAULT_IMAGE_STYLE = "stick_figure"
 
 
+# Static instructions (no per-request placeholders)
 IMAGE_PROMPT_GENERATION_PROMPT = """# 角色定位
 你是一个专业的视觉创意设计师，擅长为视频脚本创作富有表现力和象征性的图像提示词，将抽象概念转化为具象的视觉画面。
 
 # 核心任务
 基于已有的视频脚本，为每个分镜的"旁白内容"创作对应的**英文**图像提示词，确保视觉画面与叙述内容完美配合，增强观众的理解和记忆。
 
-**重要：输入包含 {narrations_count} 个旁白，你必须为每个旁白都生成一个对应的图像提示词，总共输出 {narrations_count} 个图像提示词。**
-
-# 输入内容
-{narrations_json}
+**重要：输入包含多少个旁白，你就必须为每个旁白都生成一个对应的图像提示词，输出数量与旁白数量完全一致。**
 
 # 输出要求
 
@@ -95,27 +112,36 @@ IMAGE_PROMPT_GENERATION_PROMPT = """# 角色定位
 严格按照以下JSON格式输出，**图像提示词必须是英文**：
 
 ```json
-{{
+{
   "image_prompts": [
     "[detailed English image prompt following the style requirements]",
     "[detailed English image prompt following the style requirements]"
   ]
-}}
+}
 ```
 
 # 重要提醒
 1. 只输出JSON格式内容，不要添加任何解释说明
 2. 确保JSON格式严格正确，可以被程序直接解析
-3. 输入是 {{"narrations": [旁白数组]}} 格式，输出是 {{"image_prompts": [图像提示词数组]}} 格式
-4. **输出的image_prompts数组必须恰好包含 {narrations_count} 个元素，与输入的narrations数组一一对应**
+3. 输入是 {"narrations": [旁白数组]} 格式，输出是 {"image_prompts": [图像提示词数组]} 格式
+4. **输出的image_prompts数组元素个数必须与输入的narrations数组完全相同，一一对应**
 5. **图像提示词必须使用英文**（for AI image generation models）
 6. 图像提示词必须准确反映对应旁白的具体内容和情感
 7. 每个图像都要有创意性和视觉冲击力，避免千篇一律
 8. 确保视觉画面能增强文案的说服力和观众的理解度
+"""
+
+# Per-request tail. Everything that varies between calls lives here so the
+# static prefix above stays byte-identical and can hit provider prefix caching.
+IMAGE_PROMPT_INPUT_SUFFIX = """
+# 输入内容
+{narrations_json}
 
 现在，请为上述 {narrations_count} 个旁白创作对应的 {narrations_count} 个**英文**图像提示词。只输出JSON，不要其他内容。
 """
 
+_COMPILED_INPUT_SUFFIX = compile_template(IMAGE_PROMPT_INPUT_SUFFIX)
+
 
 def build_image_prompt_prompt(
     narrations: List[str],
@@ -138,16 +164,11 @@ def build_image_prompt_prompt(
     Example:
         >>> build_image_prompt_prompt(narrations, 50, 100)
     """
-    narrations_json = json.dumps(
-        {"narrations": narrations},
-        ensure_ascii=False,
-        indent=2
-    )
+    # Compact JSON: pretty-printing only adds prompt tokens
+    narrations_json = json_dumps({"narrations": narrations})
     
-    return IMAGE_PROMPT_GENERATION_PROMPT.format(
-        narrations_json=narrations_json,
-        narrations_count=len(narrations),
-        min_words=min_words,
-        max_words=max_words
-    )
+    return IMAGE_PROMPT_GENERATION_PROMPT + render_template(_COMPILED_INPUT_SUFFIX, {
+        "narrations_json": narrations_json,
+        "narrations_count": len(narrations),
+    })
 
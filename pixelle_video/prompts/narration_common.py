@@ -0,0 +1,28 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared narration prompt sections
+
+Text blocks used verbatim by both the topic and content narration prompts.
+Kept in one place so the prompts stay in sync.
+"""
+
+
+NARRATION_OUTPUT_FORMAT_HEADER = """# 输出格式
+严格按照以下JSON格式输出，不要添加任何额外的文字说明：
+"""
+
+NARRATION_REMINDER_HEADER = """# 重要提醒
+1. 只输出JSON格式内容，不要添加任何解释说明
+2. 确保JSON格式严格正确，可以被程序直接解析
+"""
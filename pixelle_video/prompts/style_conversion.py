@@ -16,6 +16,11 @@ Style conversion prompt
 For converting user's custom style description to image generation prompt.
 """
 
+import unicodedata
+from functools import lru_cache
+
+from pixelle_video.utils.prompt_helper import compile_template, render_template
+
 
 STYLE_CONVERSION_PROMPT = """Convert this style description into a detailed image generation prompt for Stable Diffusion/FLUX:
 
@@ -31,7 +36,10 @@ Requirements:
 
 Image Prompt:"""
 
+_COMPILED_STYLE_CONVERSION_PROMPT = compile_template(STYLE_CONVERSION_PROMPT)
 
+
+@lru_cache(maxsize=64)
 def build_style_conversion_prompt(description: str) -> str:
     """
     Build style conversion prompt
@@ -49,5 +57,28 @@ def build_style_conversion_prompt(description: str) -> str:
         >>> build_style_conversion_prompt("赛博朋克风格，霓虹灯，未来感")
         # Returns prompt that will convert to: "cyberpunk style, neon lights, futuristic..."
     """
-    return STYLE_CONVERSION_PROMPT.format(description=description)
+    return render_template(_COMPILED_STYLE_CONVERSION_PROMPT, {
+        "description": normalize_style_description(description)
+    })
+
+
+def normalize_style_description(description: str) -> str:
+    """
+    Canonicalize a style description
+    
+    Descriptions that differ only in full-/half-width characters or
+    whitespace map to the same text, so they build the same prompt and
+    share one LLM cache entry.
+    
+    Args:
+        description: User's style description
+    
+    Returns:
+        Normalized description
+    
+    Example:
+        >>> normalize_style_description("  赛博朋克风格， 霓虹灯 ")
+        '赛博朋克风格, 霓虹灯'
+    """
+    return " ".join(unicodedata.normalize("NFKC", description).split())
 
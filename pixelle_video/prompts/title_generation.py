@@ -16,6 +16,9 @@ Title generation prompt
 For generating video title from content.
 """
 
+from pixelle_video.utils.prompt_helper import compile_template, render_template
+from pixelle_video.utils.text_util import truncate_graphemes
+
 
 TITLE_GENERATION_PROMPT = """Please generate a short, attractive title (within 10 characters) for the following content.
 
@@ -30,6 +33,8 @@ Requirements:
 
 Title:"""
 
+_COMPILED_TITLE_GENERATION_PROMPT = compile_template(TITLE_GENERATION_PROMPT)
+
 
 def build_title_generation_prompt(content: str, max_length: int = 500) -> str:
     """
@@ -43,9 +48,7 @@ def build_title_generation_prompt(content: str, max_length: int = 500) -> str:
         Formatted prompt
     """
     # Take first max_length chars to avoid overly long prompts
-    content_preview = content[:max_length]
+    content_preview = truncate_graphemes(content, max_length)
     
-    return TITLE_GENERATION_PROMPT.format(
-        content=content_preview
-    )
+    return render_template(_COMPILED_TITLE_GENERATION_PROMPT, {"content": content_preview})
 
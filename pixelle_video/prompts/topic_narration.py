@@ -16,6 +16,14 @@ Topic narration generation prompt
 For generating narrations from a topic/theme.
 """
 
+from functools import lru_cache
+
+from pixelle_video.prompts.narration_common import (
+    NARRATION_OUTPUT_FORMAT_HEADER,
+    NARRATION_REMINDER_HEADER,
+)
+from pixelle_video.utils.prompt_helper import compile_template, render_template
+
 
 TOPIC_NARRATION_PROMPT = """# 角色定位
 你是一位专业的内容创作专家，擅长将话题扩展成引人入胜的短视频脚本，用深入浅出的方式讲解观点，帮助观众理解复杂概念。
@@ -89,9 +97,7 @@ TOPIC_NARRATION_PROMPT = """# 角色定位
 - 通过观点的递进自然过渡，形成完整的论述脉络
 - 确保内容有价值、有启发，让观众觉得"这个视频值得看"
 
-# 输出格式
-严格按照以下JSON格式输出，不要添加任何额外的文字说明：
-
+""" + NARRATION_OUTPUT_FORMAT_HEADER + """
 
 ```json
 {{
@@ -103,10 +109,7 @@ TOPIC_NARRATION_PROMPT = """# 角色定位
 }}
 ```
 
-# 重要提醒
-1. 只输出JSON格式内容，不要添加任何解释说明
-2. 确保JSON格式严格正确，可以被程序直接解析
-3. 旁白必须严格控制在{min_words}~{max_words}字之间，用通俗易懂的语言
+""" + NARRATION_REMINDER_HEADER + """3. 旁白必须严格控制在{min_words}~{max_words}字之间，用通俗易懂的语言
 4. {n_storyboard} 个分镜要围绕话题展开，形成完整的观点表达
 5. 每个分镜都要有价值，提供洞察，避免空洞的陈述
 6. 输出格式为 {{"narrations": [旁白数组]}} 的JSON对象
@@ -123,7 +126,15 @@ TOPIC_NARRATION_PROMPT = """# 角色定位
 只输出JSON，不要其他内容。
 """
 
+_COMPILED_TOPIC_NARRATION_PROMPT = compile_template(TOPIC_NARRATION_PROMPT)
+
+
+# Appended when the title is requested in the same call as the narrations
+TOPIC_NARRATION_TITLE_INSTRUCTION = """
+补充要求：请在输出的JSON对象中额外增加一个 "title" 字段，内容为根据话题生成的简短、吸引人的视频标题（10个字以内，不要引号），即输出格式为 {"title": "标题", "narrations": [旁白数组]}。
+"""
 
+@lru_cache(maxsize=128)
 def build_topic_narration_prompt(
     topic: str,
     n_storyboard: int,
@@ -140,12 +151,36 @@ def build_topic_narration_prompt(
         max_words: Maximum word count
     
     Returns:
-        Formatted prompt
+        Formatted prompt (memoized per argument tuple)
     """
-    return TOPIC_NARRATION_PROMPT.format(
-        topic=topic,
-        n_storyboard=n_storyboard,
-        min_words=min_words,
-        max_words=max_words
-    )
+    return render_template(_COMPILED_TOPIC_NARRATION_PROMPT, {
+        "topic": topic,
+        "n_storyboard": n_storyboard,
+        "min_words": min_words,
+        "max_words": max_words,
+    })
 
+
+def build_topic_narration_with_title_prompt(
+    topic: str,
+    n_storyboard: int,
+    min_words: int,
+    max_words: int
+) -> str:
+    """
+    Build topic narration prompt that also asks for a video title
+    
+    Saves a separate title-generation LLM round-trip.
+    
+    Args:
+        topic: Topic or theme
+        n_storyboard: Number of storyboard frames
+        min_words: Minimum word count
+        max_words: Maximum word count
+    
+    Returns:
+        Formatted prompt (response: {"title": ..., "narrations": [...]})
+    """
+    return build_topic_narration_prompt(
+        topic, n_storyboard, min_words, max_words
+    ) + TOPIC_NARRATION_TITLE_INSTRUCTION
@@ -16,20 +16,20 @@ Video prompt generation template
 For generating video prompts from narrations.
 """
 
-import json
 from typing import List
 
+from pixelle_video.utils.json_util import dumps as json_dumps
+from pixelle_video.utils.prompt_helper import compile_template, render_template
 
+
+# Static instructions (no per-request placeholders)
 VIDEO_PROMPT_GENERATION_PROMPT = """# 角色定位
 你是一个专业的视频创意设计师，擅长为视频脚本创作富有动感和表现力的视频生成提示词，将叙述内容转化为生动的视频画面。
 
 # 核心任务
 基于已有的视频脚本，为每个分镜的"旁白内容"创作对应的**英文**视频生成提示词，确保视频画面与叙述内容完美配合，通过动态画面增强观众的理解和记忆。
 
-**重要：输入包含 {narrations_count} 个旁白，你必须为每个旁白都生成一个对应的视频提示词，总共输出 {narrations_count} 个视频提示词。**
-
-# 输入内容
-{narrations_json}
+**重要：输入包含多少个旁白，你就必须为每个旁白都生成一个对应的视频提示词，输出数量与旁白数量完全一致。**
 
 # 输出要求
 
@@ -76,28 +76,37 @@ VIDEO_PROMPT_GENERATION_PROMPT = """# 角色定位
 严格按照以下JSON格式输出，**视频提示词必须是英文**：
 
 ```json
-{{
+{
   "video_prompts": [
     "[detailed English video prompt with dynamic elements and camera movements]",
     "[detailed English video prompt with dynamic elements and camera movements]"
   ]
-}}
+}
 ```
 
 # 重要提醒
 1. 只输出JSON格式内容，不要添加任何解释说明
 2. 确保JSON格式严格正确，可以被程序直接解析
-3. 输入是 {{"narrations": [旁白数组]}} 格式，输出是 {{"video_prompts": [视频提示词数组]}} 格式
-4. **输出的video_prompts数组必须恰好包含 {narrations_count} 个元素，与输入的narrations数组一一对应**
+3. 输入是 {"narrations": [旁白数组]} 格式，输出是 {"video_prompts": [视频提示词数组]} 格式
+4. **输出的video_prompts数组元素个数必须与输入的narrations数组完全相同，一一对应**
 5. **视频提示词必须使用英文**（for AI video generation models）
 6. 视频提示词必须准确反映对应旁白的具体内容和情感
 7. 每个视频都要强调动态性和运动感，避免静态描述
 8. 适当使用镜头语言增强表现力
 9. 确保视频画面能增强文案的说服力和观众的理解度
+"""
+
+# Per-request tail. Everything that varies between calls lives here so the
+# static prefix above stays byte-identical and can hit provider prefix caching.
+VIDEO_PROMPT_INPUT_SUFFIX = """
+# 输入内容
+{narrations_json}
 
 现在，请为上述 {narrations_count} 个旁白创作对应的 {narrations_count} 个**英文**视频提示词。只输出JSON，不要其他内容。
 """
 
+_COMPILED_INPUT_SUFFIX = compile_template(VIDEO_PROMPT_INPUT_SUFFIX)
+
 
 def build_video_prompt_prompt(
     narrations: List[str],
@@ -118,16 +127,11 @@ def build_video_prompt_prompt(
     Example:
         >>> build_video_prompt_prompt(narrations, 50, 100)
     """
-    narrations_json = json.dumps(
-        {"narrations": narrations},
-        ensure_ascii=False,
-        indent=2
-    )
+    # Compact JSON: pretty-printing only adds prompt tokens
+    narrations_json = json_dumps({"narrations": narrations})
     
-    return VIDEO_PROMPT_GENERATION_PROMPT.format(
-        narrations_json=narrations_json,
-        narrations_count=len(narrations),
-        min_words=min_words,
-        max_words=max_words
-    )
+    return VIDEO_PROMPT_GENERATION_PROMPT + render_template(_COMPILED_INPUT_SUFFIX, {
+        "narrations_json": narrations_json,
+        "narrations_count": len(narrations),
+    })
 
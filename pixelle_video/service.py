@@ -170,6 +170,37 @@ class PixelleVideoCore:
         
         return generate_video_wrapper
     
+    async def cleanup(self):
+        """
+        Release pooled network clients (LLM clients, shared HTTP client)
+        
+        Clients are opened lazily on first use and reused across calls;
+        call this once when done instead of tearing them down per call.
+        
+        Example:
+            await pixelle_video.cleanup()
+        """
+        if self.llm is not None:
+            await self.llm.aclose()
+        
+        from pixelle_video.utils.http_util import close_http_client
+        await close_http_client()
+    
+    async def __aenter__(self) -> "PixelleVideoCore":
+        """
+        Initialize once and keep clients open for the whole block
+        
+        Example:
+            async with PixelleVideoCore() as core:
+                await core.generate_video(text="...")
+        """
+        if not self._initialized:
+            await self.initialize()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.cleanup()
+    
     @property
     def project_name(self) -> str:
         """Get project name from config"""
@@ -24,15 +24,28 @@ Services:
 - ComfyBaseService: Base class for ComfyUI-based services
 """
 
-from pixelle_video.services.comfy_base_service import ComfyBaseService
-from pixelle_video.services.llm_service import LLMService
-from pixelle_video.services.tts_service import TTSService
-from pixelle_video.services.media import MediaService
-from pixelle_video.services.video import VideoService
-from pixelle_video.services.frame_processor import FrameProcessor
+import importlib
+from typing import TYPE_CHECKING
 
-# Backward compatibility alias
-ImageService = MediaService
+if TYPE_CHECKING:
+    from pixelle_video.services.comfy_base_service import ComfyBaseService
+    from pixelle_video.services.llm_service import LLMService
+    from pixelle_video.services.tts_service import TTSService
+    from pixelle_video.services.media import MediaService
+    from pixelle_video.services.video import VideoService
+    from pixelle_video.services.frame_processor import FrameProcessor
+
+# Services are imported on first attribute access (PEP 562), so importing
+# one service doesn't pull in the dependencies of all the others
+_LAZY_IMPORTS = {
+    "ComfyBaseService": "pixelle_video.services.comfy_base_service",
+    "LLMService": "pixelle_video.services.llm_service",
+    "TTSService": "pixelle_video.services.tts_service",
+    "MediaService": "pixelle_video.services.media",
+    "ImageService": "pixelle_video.services.media",  # Backward compatibility alias
+    "VideoService": "pixelle_video.services.video",
+    "FrameProcessor": "pixelle_video.services.frame_processor",
+}
 
 __all__ = [
     "ComfyBaseService",
@@ -44,3 +57,17 @@ __all__ = [
     "FrameProcessor",
 ]
 
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    attr = "MediaService" if name == "ImageService" else name
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -14,14 +14,16 @@
 ComfyUI Base Service - Common logic for ComfyUI-based services
 """
 
-import json
+import asyncio
 import os
+import sys
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple, Union
 
 from comfykit import ComfyKit
 from loguru import logger
 
+from pixelle_video.utils.json_util import loads as json_loads
 from pixelle_video.utils.os_util import (
     get_resource_path,
     list_resource_files,
@@ -36,15 +38,22 @@ class ComfyBaseService:
     Provides common functionality for TTS, Image, and other ComfyUI-based services.
     
     Subclasses should define:
-    - WORKFLOW_PREFIX: Prefix for workflow files (e.g., "image_", "tts_")
+    - WORKFLOW_PREFIX: Prefix (or tuple of prefixes) for workflow files (e.g., "tts_", ("image_", "video_"))
     - DEFAULT_WORKFLOW: Default workflow filename (e.g., "image_flux.json")
     - WORKFLOWS_DIR: Directory containing workflows (default: "workflows")
     """
     
-    WORKFLOW_PREFIX: str = ""  # Must be overridden by subclass
+    __slots__ = ("config", "global_config", "service_name", "_workflow_info_cache")
+    
+    WORKFLOW_PREFIX: Union[str, Tuple[str, ...]] = ""  # Must be overridden by subclass
     DEFAULT_WORKFLOW: str = ""  # Must be overridden by subclass
     WORKFLOWS_DIR: str = "workflows"
     
+    # ComfyKit instances shared by all services, keyed by (comfyui_url, runninghub_api_key)
+    # and bound to the event loop they were created on
+    _kits: Dict[Tuple[Optional[str], Optional[str]], ComfyKit] = {}
+    _kits_loop: Optional[asyncio.AbstractEventLoop] = None
+    
     def __init__(self, config: dict, service_name: str):
         """
         Initialize ComfyUI base service
@@ -60,8 +69,10 @@ class ComfyBaseService:
         # Global ComfyUI config (for comfyui_url and runninghub_api_key)
         self.global_config = comfyui_config
         
-        self.service_name = service_name
-        self._workflows_cache: Optional[List[str]] = None
+        self.service_name = sys.intern(service_name)
+        
+        # Parsed workflow metadata: file path -> (st_mtime_ns, workflow_info)
+        self._workflow_info_cache: Dict[str, Tuple[int, Dict[str, Any]]] = {}
     
     def _scan_workflows(self) -> List[Dict[str, Any]]:
         """
@@ -98,6 +109,10 @@ class ComfyBaseService:
         
         # Scan each source directory for workflow files
         for source_name in source_dirs:
+            # Shared by every workflow info of this source and compared against
+            # literals like "runninghub" on each call; intern it
+            source_name = sys.intern(source_name)
+            
             # Get all JSON files for this source (merged from both locations)
             workflow_files = list_resource_files("workflows", source_name)
             
@@ -111,14 +126,44 @@ class ComfyBaseService:
                 try:
                     # Get actual file path (custom > default)
                     file_path = Path(get_resource_path("workflows", source_name, filename))
-                    workflow_info = self._parse_workflow_file(file_path, source_name)
+                    workflow_info = self._get_workflow_info(file_path, source_name)
                     workflows.append(workflow_info)
-                    logger.debug(f"Found workflow: {workflow_info['key']}")
                 except Exception as e:
                     logger.error(f"Failed to parse workflow {source_name}/{filename}: {e}")
         
         # Sort by key (source/name)
-        return sorted(workflows, key=lambda w: w["key"])
+        workflows.sort(key=lambda w: w["key"])
+        
+        # One summary record instead of one per workflow
+        logger.debug(
+            f"Found {len(workflows)} {self.service_name} workflows: "
+            f"{', '.join(w['key'] for w in workflows)}"
+        )
+        return workflows
+    
+    def _get_workflow_info(self, file_path: Path, source: str) -> Dict[str, Any]:
+        """
+        Get workflow metadata, re-parsing the file only when it has changed
+        
+        Workflows are resolved on every generation call, so parsed metadata
+        is cached per file path and invalidated by modification time.
+        
+        Args:
+            file_path: Path to workflow JSON file
+            source: Source directory name (e.g., "selfhost", "runninghub")
+        
+        Returns:
+            Workflow info dict (see _parse_workflow_file)
+        """
+        cache_key = str(file_path)
+        mtime_ns = file_path.stat().st_mtime_ns
+        
+        cached = self._workflow_info_cache.get(cache_key)
+        if cached is None or cached[0] != mtime_ns:
+            cached = (mtime_ns, self._parse_workflow_file(file_path, source))
+            self._workflow_info_cache[cache_key] = cached
+        
+        return dict(cached[1])
     
     def _parse_workflow_file(self, file_path: Path, source: str) -> Dict[str, Any]:
         """
@@ -139,8 +184,8 @@ class ComfyBaseService:
                 "workflow_id": "123456"  # Only for RunningHub
             }
         """
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = json.load(f)
+        with open(file_path, 'rb') as f:
+            content = json_loads(f.read())
         
         # Build base info
         workflow_info = {
@@ -152,10 +197,11 @@ class ComfyBaseService:
         }
         
         # Check if it's a wrapper format (RunningHub, etc.)
+        # Wrapper format: {"source": "runninghub", "workflow_id": "xxx", ...}
         if "source" in content:
-            # Wrapper format: {"source": "runninghub", "workflow_id": "xxx", ...}
-            if "workflow_id" in content:
-                workflow_info["workflow_id"] = content["workflow_id"]
+            workflow_id = content.get("workflow_id")
+            if workflow_id is not None:
+                workflow_info["workflow_id"] = workflow_id
         
         return workflow_info
     
@@ -261,6 +307,37 @@ class ComfyBaseService:
         logger.debug(f"ComfyKit config: {kit_config}")
         return kit_config
     
+    def _get_comfykit(self, kit_config: Dict[str, Any]) -> ComfyKit:
+        """
+        Get ComfyKit instance (cached per credentials)
+        
+        Kits are reused across calls and services so that client setup is paid
+        once per (comfyui_url, runninghub_api_key). The cache is reset when the
+        running event loop changes, since kit clients may be bound to a loop.
+        
+        Args:
+            kit_config: ComfyKit configuration from _prepare_comfykit_config()
+        
+        Returns:
+            ComfyKit instance
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not ComfyBaseService._kits_loop:
+            ComfyBaseService._kits = {}
+            ComfyBaseService._kits_loop = loop
+        
+        cache_key = (kit_config.get("comfyui_url"), kit_config.get("runninghub_api_key"))
+        kit = ComfyBaseService._kits.get(cache_key)
+        if kit is None:
+            kit = ComfyKit(**kit_config)
+            ComfyBaseService._kits[cache_key] = kit
+            logger.debug(f"Created ComfyKit for {cache_key[0]}")
+        
+        return kit
+    
     def list_workflows(self) -> List[Dict[str, Any]]:
         """
         List all available workflows with full metadata
@@ -301,9 +378,10 @@ class ComfyBaseService:
     def __repr__(self) -> str:
         """String representation"""
         default = self._get_default_workflow()
-        available = ", ".join(self.available) if self.available else "none"
+        # available scans the workflow directories; evaluate it only once
+        available = ", ".join(self.available) or "none"
         return (
-            f"<{self.__class__.__name__} "
+            f"<{type(self).__name__} "
             f"default={default!r} "
             f"available=[{available}]>"
         )
@@ -24,17 +24,32 @@ Linux Environment Requirements:
 """
 
 from math import log
+import asyncio
 import os
 import re
 import uuid
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Optional
 from pathlib import Path
-from html2image import Html2Image
 from loguru import logger
-from PIL import Image
 
 from pixelle_video.utils.template_util import parse_template_size
 
+if TYPE_CHECKING:
+    from html2image import Html2Image
+
+# html2image and PIL are imported where frames are rendered: loading a
+# template only to read its parameters or media size doesn't need them
+
+
+# Template parameter placeholder: {{param_name:type=default}} or {{param_name=default}}
+# or {{param_name:type}} or {{param_name}}
+# Param name: must start with letter or underscore, can contain letters, digits, underscores
+PARAM_PATTERN = re.compile(r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}')
+
+# <meta> tags and their attributes (for template:media-* size hints)
+META_TAG_PATTERN = re.compile(r'<meta\b([^>]*)>', re.IGNORECASE)
+META_ATTR_PATTERN = re.compile(r'([a-zA-Z_:-]+)\s*=\s*(?:"([^"]*)"|\'([^\']*)\'|([^\s"\'>]+))')
+
 
 class HTMLFrameGenerator:
     """
@@ -60,6 +75,20 @@ class HTMLFrameGenerator:
     # This is a temporary workaround until the issue is fixed in Chromium.
     CHROMIUM_HEIGHT_OFFSET = 87
     
+    # zlib level for the cropped frame PNG. The frame is an intermediate file
+    # read once by ffmpeg, so fast encoding beats a smaller file
+    # (Pillow's default level 6 is several times slower to encode)
+    FRAME_PNG_COMPRESS_LEVEL = 1
+    
+    # System dependencies are checked once per process, not per generator
+    _linux_dependencies_checked = False
+    
+    # Browser lookup result and Html2Image instances (one per render size),
+    # shared by all generators in the process
+    _UNRESOLVED = object()
+    _browser_path = _UNRESOLVED
+    _hti_instances: Dict[tuple, "Html2Image"] = {}
+    
     def __init__(self, template_path: str):
         """
         Initialize HTML frame generator
@@ -69,6 +98,7 @@ class HTMLFrameGenerator:
         """
         self.template_path = template_path
         self.template = self._load_template(template_path)
+        self._render = self._compile_template(self._split_template(self.template))
         
         # Parse video size from template path
         self.width, self.height = parse_template_size(template_path)
@@ -80,8 +110,9 @@ class HTMLFrameGenerator:
     
     def _check_linux_dependencies(self):
         """Check Linux system dependencies and warn if missing"""
-        if os.name != 'posix':
+        if os.name != 'posix' or HTMLFrameGenerator._linux_dependencies_checked:
             return
+        HTMLFrameGenerator._linux_dependencies_checked = True
         
         try:
             import subprocess
@@ -104,7 +135,8 @@ class HTMLFrameGenerator:
                     "Install fonts with: sudo apt-get install -y fonts-liberation fonts-noto-cjk"
                 )
             else:
-                logger.debug(f"✓ Fontconfig detected {len(result.stdout.splitlines())} fonts")
+                # Count lines in place instead of materializing one bytes object per font
+                logger.debug("✓ Fontconfig detected {} fonts", result.stdout.count(b"\n"))
                 
         except FileNotFoundError:
             logger.warning(
@@ -137,18 +169,26 @@ class HTMLFrameGenerator:
         Returns:
             Tuple of (width, height) or (None, None) if not found
         """
-        from bs4 import BeautifulSoup
-        
         try:
-            soup = BeautifulSoup(self.template, 'html.parser')
+            # Only the <meta> tags are needed, so scan for them directly
+            # instead of building a full DOM of the template
+            sizes = {}
+            for tag in META_TAG_PATTERN.finditer(self.template):
+                attrs = {
+                    m.group(1).lower(): m.group(2) or m.group(3) or m.group(4) or ''
+                    for m in META_ATTR_PATTERN.finditer(tag.group(1))
+                }
+                name = attrs.get('name')
+                if name in ('template:media-width', 'template:media-height'):
+                    # Use first occurrence, like soup.find()
+                    sizes.setdefault(name, attrs.get('content') or 0)
             
-            # Find width and height meta tags
-            width_meta = soup.find('meta', attrs={'name': 'template:media-width'})
-            height_meta = soup.find('meta', attrs={'name': 'template:media-height'})
+            width_meta = sizes.get('template:media-width')
+            height_meta = sizes.get('template:media-height')
             
-            if width_meta and height_meta:
-                width = int(width_meta.get('content', 0))
-                height = int(height_meta.get('content', 0))
+            if width_meta is not None and height_meta is not None:
+                width = int(width_meta)
+                height = int(height_meta)
                 
                 if width > 0 and height > 0:
                     logger.debug(f"Found media size in meta tags: {width}x{height}")
@@ -204,13 +244,9 @@ class HTMLFrameGenerator:
         PRESET_PARAMS = {'title', 'text', 'image', 'content_title', 'content_author', 
                         'content_subtitle', 'content_genre'}
         
-        # Pattern: {{param_name:type=default}} or {{param_name=default}} or {{param_name:type}} or {{param_name}}
-        # Param name: must start with letter or underscore, can contain letters, digits, underscores
-        PARAM_PATTERN = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}'
-        
         params = {}
         
-        for match in re.finditer(PARAM_PATTERN, self.template):
+        for match in PARAM_PATTERN.finditer(self.template):
             param_name = match.group(1)
             param_type = match.group(2) or 'text'  # Default to text
             default_value = match.group(3)
@@ -287,46 +323,73 @@ class HTMLFrameGenerator:
         else:  # text
             return value_str
     
-    def _replace_parameters(self, html: str, values: Dict[str, Any]) -> str:
+    def _split_template(self, html: str) -> list:
         """
-        Replace parameter placeholders with actual values
-        
-        Supports DSL syntax: {{param:type=default}}
-        - If value provided in values dict, use it
-        - Otherwise, use default value from placeholder
-        - If no default, use empty string
-        
-        Args:
-            html: HTML template content
-            values: Dictionary of parameter values
+        Split template into literal text and placeholders once, at load time
         
         Returns:
-            HTML with placeholders replaced
+            List alternating literal strings and (param_name, default_value_str)
+            tuples, in template order
+        """
+        segments = []
+        pos = 0
+        for match in PARAM_PATTERN.finditer(html):
+            segments.append(html[pos:match.start()])
+            segments.append((match.group(1), match.group(3)))
+            pos = match.end()
+        segments.append(html[pos:])
+        return segments
+    
+    @staticmethod
+    def _format_value(value: Any) -> str:
+        """Format a provided parameter value for HTML"""
+        # Convert bool to string for HTML
+        if isinstance(value, bool):
+            return 'true' if value else 'false'
+        return str(value) if value is not None else ''
+    
+    def _compile_template(self, segments: list):
         """
-        PARAM_PATTERN = r'\{\{([a-zA-Z_][a-zA-Z0-9_]*)(?::([a-z]+))?(?:=([^}]+))?\}\}'
+        Compile pre-split segments into a render function, once per template
         
-        def replacer(match):
-            param_name = match.group(1)
-            param_type = match.group(2) or 'text'
-            default_value_str = match.group(3)
-            
-            # Check if value is provided
-            if param_name in values:
-                value = values[param_name]
-                # Convert bool to string for HTML
-                if isinstance(value, bool):
-                    return 'true' if value else 'false'
-                return str(value) if value is not None else ''
-            
-            # Use default value from placeholder if available
-            elif default_value_str:
-                return default_value_str
+        The generated function is a single ''.join() over a tuple of literal
+        strings and one inline expression per placeholder, e.g.:
+        
+            def _render(values):
+                return _join(('<h1>', _fmt(values['title']) if 'title' in values else '', '</h1>'))
+        
+        Param names are identifiers (enforced by PARAM_PATTERN) and literals
+        are embedded via repr(), so the generated source is always valid.
+        """
+        parts = []
+        for segment in segments:
+            if isinstance(segment, str):
+                if segment:
+                    parts.append(repr(segment))
+                continue
             
-            # No value and no default
-            else:
-                return ''
+            param_name, default_value_str = segment
+            # Use default value from placeholder when the value is not provided
+            fallback = repr(default_value_str or '')
+            parts.append(f"(_fmt(values[{param_name!r}]) if {param_name!r} in values else {fallback})")
+        
+        if not parts:
+            parts.append(repr(''))
+        
+        source = f"def _render(values):\n    return _join(({', '.join(parts)},))\n"
+        namespace = {'_join': ''.join, '_fmt': self._format_value}
+        exec(compile(source, f"<template {os.path.basename(self.template_path)}>", 'exec'), namespace)
+        return namespace['_render']
+    
+    def _render_template(self, values: Dict[str, Any]) -> str:
+        """
+        Render the loaded template with values
         
-        return re.sub(PARAM_PATTERN, replacer, html)
+        Placeholders take the provided value (bools as 'true'/'false', None as
+        empty), else their default, else an empty string. Runs the function
+        compiled at load time instead of scanning the template per frame.
+        """
+        return self._render(values)
     
     def _find_chrome_executable(self) -> Optional[str]:
         """
@@ -382,7 +445,9 @@ class HTMLFrameGenerator:
         return None
     
     def _ensure_hti(self, width: int, height: int):
-        """Lazily initialize Html2Image instance"""
+        """Lazily initialize Html2Image instance (shared per size across generators)"""
+        if self.hti is None:
+            self.hti = HTMLFrameGenerator._hti_instances.get((width, height))
         if self.hti is None:
             # Configure Chrome flags for Linux headless environment
             custom_flags = [
@@ -405,8 +470,10 @@ class HTMLFrameGenerator:
                 '--disable-renderer-backgrounding',  # Improve performance
             ]
             
-            # Try to find non-snap browser
-            browser_path = self._find_chrome_executable()
+            # Try to find non-snap browser (looked up once per process)
+            if HTMLFrameGenerator._browser_path is HTMLFrameGenerator._UNRESOLVED:
+                HTMLFrameGenerator._browser_path = self._find_chrome_executable()
+            browser_path = HTMLFrameGenerator._browser_path
             
             # Workaround: Add extra height to compensate for Chromium screenshot cropping bug
             # The extra pixels will be cropped back in generate_frame() after rendering
@@ -419,13 +486,51 @@ class HTMLFrameGenerator:
             if browser_path:
                 kwargs['browser_executable'] = browser_path
             
+            from html2image import Html2Image
             self.hti = Html2Image(**kwargs)
+            HTMLFrameGenerator._hti_instances[(width, height)] = self.hti
             
             if browser_path:
                 logger.debug(f"Initialized Html2Image with size ({width}, {height}), {len(custom_flags)} custom flags, using browser: {browser_path}")
             else:
                 logger.debug(f"Initialized Html2Image with size ({width}, {height}) and {len(custom_flags)} custom flags")
     
+    def _render_to_file(self, html: str, output_path: str):
+        """Screenshot HTML into output_path and crop it to the template size (blocking)"""
+        from PIL import Image
+        
+        # Screenshot under a unique name: html2image writes both the page and the
+        # PNG into the shared current directory, and concurrent tasks render
+        # frames with the same basename (e.g. 01_composed.png)
+        temp_filename = f"frame_{uuid.uuid4().hex[:16]}.png"
+        self.hti.screenshot(
+            html_str=html,
+            save_as=temp_filename
+        )
+        
+        # html2image saves to current directory by default, move to target directory
+        import shutil
+        temp_file = os.path.join(os.getcwd(), temp_filename)
+        if os.path.exists(temp_file):
+            shutil.move(temp_file, output_path)
+        
+        # Workaround: Crop image to remove extra height added to compensate for Chromium bug
+        # Chromium screenshots are cropped at the bottom, so we render with extra height
+        # and then crop it back to the desired size. See CHROMIUM_HEIGHT_OFFSET constant.
+        # Reference: https://issues.chromium.org/issues/405165895
+        if os.path.exists(output_path):
+            with Image.open(output_path) as img:
+                # Opening only reads the PNG header; skip the full decode and
+                # re-encode when the screenshot already has the target size
+                if img.size == (self.width, self.height):
+                    return
+                
+                # Crop from (0, 0) to (originWidth, originHeight)
+                # This removes the extra CHROMIUM_HEIGHT_OFFSET pixels added during rendering
+                cropped_img = img.crop((0, 0, self.width, self.height))
+                cropped_img.save(output_path, format='PNG', compress_level=self.FRAME_PNG_COMPRESS_LEVEL)
+                logger.debug(f"Cropped image to size: {self.width}x{self.height} (removed {self.CHROMIUM_HEIGHT_OFFSET}px workaround offset)")
+    
     async def generate_frame(
         self,
         title: str,
@@ -449,37 +554,11 @@ class HTMLFrameGenerator:
         Returns:
             Path to generated frame image
         """
-        # Convert image path to absolute path or file:// URL for html2image
-        if image and not image.startswith(('http://', 'https://', 'data:', 'file://')):
-            # Local file path - convert to absolute path and file:// URL
-            image_path = Path(image)
-            if not image_path.is_absolute():
-                # Relative to current working directory (project root)
-                image_path = Path.cwd() / image
-            
-            # Ensure the file exists
-            if not image_path.exists():
-                logger.warning(f"Image file not found: {image_path}")
-            else:
-                # Convert to file:// URL for html2image compatibility
-                image = image_path.as_uri()
-                logger.debug(f"Converted image path to: {image}")
-        
-        # Build variable context
-        context = {
-            # Required variables
-            "title": title,
-            "text": text,
-            "image": image,
-        }
-        
-        # Add all ext fields
-        if ext:
-            context.update(ext)
+        context = self._build_context(title, text, image, ext)
         
         # Replace variables in HTML (supports DSL syntax: {{param:type=default}})
-        html = self._replace_parameters(self.template, context)
-        logger.debug(f"html--->{html}")
+        html = self._render_template(context)
+        logger.debug("html--->{}", html)
         # Use provided output path or auto-generate
         if output_path is None:
             # Fallback: auto-generate (for backward compatibility)
@@ -488,42 +567,17 @@ class HTMLFrameGenerator:
             output_path = get_output_path(output_filename)
         else:
             # Ensure parent directory exists
-            import os
             os.makedirs(os.path.dirname(output_path), exist_ok=True)
         
-        # Extract filename from output_path for html2image
-        import os
-        output_filename = os.path.basename(output_path)
-        output_dir = os.path.dirname(output_path)
-        
         # Ensure Html2Image is initialized with template's size
         self._ensure_hti(self.width, self.height)
         
         # Render HTML to image
         logger.debug(f"Rendering HTML template to {output_path} (size: {self.width}x{self.height})")
         try:
-            self.hti.screenshot(
-                html_str=html,
-                save_as=output_filename
-            )
-            
-            # html2image saves to current directory by default, move to target directory
-            import shutil
-            temp_file = os.path.join(os.getcwd(), output_filename)
-            if os.path.exists(temp_file) and temp_file != output_path:
-                shutil.move(temp_file, output_path)
-            
-            # Workaround: Crop image to remove extra height added to compensate for Chromium bug
-            # Chromium screenshots are cropped at the bottom, so we render with extra height
-            # and then crop it back to the desired size. See CHROMIUM_HEIGHT_OFFSET constant.
-            # Reference: https://issues.chromium.org/issues/405165895
-            if os.path.exists(output_path):
-                with Image.open(output_path) as img:
-                    # Crop from (0, 0) to (originWidth, originHeight)
-                    # This removes the extra CHROMIUM_HEIGHT_OFFSET pixels added during rendering
-                    cropped_img = img.crop((0, 0, self.width, self.height))
-                    cropped_img.save(output_path)
-                    logger.debug(f"Cropped image to size: {self.width}x{self.height} (removed {self.CHROMIUM_HEIGHT_OFFSET}px workaround offset)")
+            # Browser screenshot, file move and PNG crop all block; run them in a
+            # worker thread so other frames' TTS/media requests keep progressing
+            await asyncio.to_thread(self._render_to_file, html, output_path)
             
             logger.info(f"✅ Frame generated: {output_path}")
             return output_path
@@ -531,4 +585,36 @@ class HTMLFrameGenerator:
         except Exception as e:
             logger.error(f"Failed to render HTML template: {e}")
             raise RuntimeError(f"HTML rendering failed: {e}")
+    
+    def _build_context(
+        self,
+        title: str,
+        text: str,
+        image: str,
+        ext: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Build template variable context for one frame"""
+        # Convert image path to absolute path or file:// URL for html2image
+        if image and not image.startswith(('http://', 'https://', 'data:', 'file://')):
+            # Local file path - convert to absolute path and file:// URL
+            image_path = Path(image)
+            if not image_path.is_absolute():
+                # Relative to current working directory (project root)
+                image_path = Path.cwd() / image
+            
+            # Ensure the file exists
+            if not image_path.exists():
+                logger.warning(f"Image file not found: {image_path}")
+            else:
+                # Convert to file:// URL for html2image compatibility
+                image = image_path.as_uri()
+                logger.debug(f"Converted image path to: {image}")
+        
+        # Build variable context (required variables, then all ext fields)
+        return {
+            "title": title,
+            "text": text,
+            "image": image,
+            **(ext or {}),
+        }
 
@@ -16,13 +16,15 @@ Frame processor - Process single frame through complete pipeline
 Orchestrates: TTS → Image Generation → Frame Composition → Video Segment
 """
 
-from typing import Callable, Optional
+import asyncio
+import os
+from typing import Callable, Dict, List, Optional
 
-import httpx
 from loguru import logger
 
 from pixelle_video.models.progress import ProgressEvent
 from pixelle_video.models.storyboard import Storyboard, StoryboardFrame, StoryboardConfig
+from pixelle_video.utils.http_util import get_http_client
 
 
 class FrameProcessor:
@@ -36,6 +38,10 @@ class FrameProcessor:
             pixelle_video_core: PixelleVideoCore instance
         """
         self.core = pixelle_video_core
+        
+        # template path -> (mtime, HTMLFrameGenerator): the template is loaded
+        # and parsed once, not once per frame
+        self._frame_generators: Dict[str, tuple] = {}
     
     async def __call__(
         self,
@@ -43,7 +49,8 @@ class FrameProcessor:
         storyboard: 'Storyboard',
         config: StoryboardConfig,
         total_frames: int = 1,
-        progress_callback: Optional[Callable[[ProgressEvent], None]] = None
+        progress_callback: Optional[Callable[[ProgressEvent], None]] = None,
+        media_tasks: Optional[Dict[str, asyncio.Future]] = None
     ) -> StoryboardFrame:
         """
         Process single frame through complete pipeline
@@ -60,11 +67,14 @@ class FrameProcessor:
             config: Storyboard configuration
             total_frames: Total number of frames in storyboard
             progress_callback: Optional callback for progress updates (receives ProgressEvent)
+            media_tasks: Optional dict shared by the frames of one storyboard, mapping
+                image prompt -> media generation task. Frames with identical prompts
+                then generate the media once (None = always generate)
             
         Returns:
             Processed frame with all paths filled
         """
-        logger.info(f"Processing frame {frame.index}...")
+        logger.info("Processing frame {}...", frame.index)
         
         frame_num = frame.index + 1
         
@@ -95,7 +105,7 @@ class FrameProcessor:
                         step=2,
                         action="media"
                     ))
-                await self._step_generate_media(frame, config)
+                await self._step_generate_media(frame, config, media_tasks)
             else:
                 frame.image_path = None
                 frame.media_type = None
@@ -125,7 +135,7 @@ class FrameProcessor:
                 ))
             await self._step_create_video_segment(frame, config)
             
-            logger.info(f"✅ Frame {frame.index} completed")
+            logger.info("✅ Frame {} completed", frame.index)
             return frame
             
         except Exception as e:
@@ -138,17 +148,69 @@ class FrameProcessor:
         config: StoryboardConfig
     ):
         """Step 1: Generate audio using TTS"""
-        logger.debug(f"  1/4: Generating audio for frame {frame.index}...")
+        if frame.audio_path:
+            # Already synthesized ahead of frame processing (synthesize_audio)
+            logger.debug("  1/4: Using pre-generated audio for frame {}", frame.index)
+            frame.duration = await self._get_audio_duration(frame.audio_path)
+            return
+        
+        logger.debug("  1/4: Generating audio for frame {}...", frame.index)
         
         # Generate output path using task_id
         from pixelle_video.utils.os_util import get_task_frame_path
         output_path = get_task_frame_path(config.task_id, frame.index, "audio")
         
-        # Build TTS params based on inference mode
+        audio_path = await self.core.tts(
+            text=frame.narration,
+            output_path=output_path,
+            **self._tts_params(config)
+        )
+        
+        frame.audio_path = audio_path
+        
+        # Get audio duration
+        frame.duration = await self._get_audio_duration(audio_path)
+        
+        logger.debug("  ✓ Audio generated: {} ({:.2f}s)", audio_path, frame.duration)
+    
+    async def synthesize_audio(
+        self,
+        frames: List[StoryboardFrame],
+        config: StoryboardConfig,
+        max_concurrency: int = 4
+    ):
+        """
+        Generate narration audio for all frames ahead of frame processing
+        
+        Syntheses run concurrently (at most max_concurrency at once) and set
+        frame.audio_path; the audio step of each frame then only reads the
+        duration. Frames whose synthesis failed are left without audio and
+        retried by their own audio step.
+        
+        Args:
+            frames: Storyboard frames
+            config: Storyboard configuration
+            max_concurrency: Maximum number of in-flight syntheses
+        """
+        from pixelle_video.utils.os_util import get_task_frame_path
+        
+        results = await self.core.tts.batch(
+            [frame.narration for frame in frames],
+            max_concurrency=max_concurrency,
+            output_paths=[get_task_frame_path(config.task_id, frame.index, "audio") for frame in frames],
+            **self._tts_params(config)
+        )
+        
+        for frame, result in zip(frames, results):
+            if isinstance(result, Exception):
+                logger.warning(f"Audio pre-generation failed for frame {frame.index}, will retry: {result}")
+            else:
+                frame.audio_path = result
+    
+    def _tts_params(self, config: StoryboardConfig) -> dict:
+        """Build TTS params (other than text/output path) based on inference mode"""
         tts_params = {
-            "text": frame.narration,
             "inference_mode": config.tts_inference_mode,
-            "output_path": output_path,
         }
         
         if config.tts_inference_mode == "local":
@@ -168,39 +230,27 @@ class FrameProcessor:
             if config.ref_audio:
                 tts_params["ref_audio"] = config.ref_audio
         
-        audio_path = await self.core.tts(**tts_params)
-        
-        frame.audio_path = audio_path
-        
-        # Get audio duration
-        frame.duration = await self._get_audio_duration(audio_path)
-        
-        logger.debug(f"  ✓ Audio generated: {audio_path} ({frame.duration:.2f}s)")
+        return tts_params
     
     async def _step_generate_media(
         self,
         frame: StoryboardFrame,
-        config: StoryboardConfig
+        config: StoryboardConfig,
+        media_tasks: Optional[Dict[str, asyncio.Future]] = None
     ):
         """Step 2: Generate media (image or video) using ComfyKit"""
-        logger.debug(f"  2/4: Generating media for frame {frame.index}...")
-        
-        # Determine media type based on workflow
-        # video_ prefix in workflow name indicates video generation
-        workflow_name = config.image_workflow or ""
-        is_video_workflow = "video_" in workflow_name.lower()
-        media_type = "video" if is_video_workflow else "image"
-        
-        logger.debug(f"  → Media type: {media_type} (workflow: {workflow_name})")
-        
-        # Call Media generation (with optional preset)
-        media_result = await self.core.media(
-            prompt=frame.image_prompt,
-            workflow=config.image_workflow,  # Pass workflow from config (None = use default)
-            media_type=media_type,
-            width=config.image_width,
-            height=config.image_height
-        )
+        logger.debug("  2/4: Generating media for frame {}...", frame.index)
+        
+        # Workflow and size are fixed per storyboard, so the prompt alone
+        # identifies the result; identical prompts share one generation.
+        task = media_tasks.get(frame.image_prompt) if media_tasks is not None else None
+        if task is None:
+            task = self._start_media_generation(frame.image_prompt, config)
+            if media_tasks is not None:
+                media_tasks[frame.image_prompt] = task
+        else:
+            logger.debug("  → Reusing media generated for an identical prompt (frame {})", frame.index)
+        media_result = await task
         
         # Store media type
         frame.media_type = media_result.media_type
@@ -214,7 +264,7 @@ class FrameProcessor:
                 media_type="image"
             )
             frame.image_path = local_path
-            logger.debug(f"  ✓ Image generated: {local_path}")
+            logger.debug("  ✓ Image generated: {}", local_path)
         
         elif media_result.is_video:
             # Download video to local (pass task_id)
@@ -229,15 +279,71 @@ class FrameProcessor:
             # Update duration from video if available
             if media_result.duration:
                 frame.duration = media_result.duration
-                logger.debug(f"  ✓ Video generated: {local_path} (duration: {frame.duration:.2f}s)")
+                logger.debug("  ✓ Video generated: {} (duration: {:.2f}s)", local_path, frame.duration)
             else:
                 # Get video duration from file
                 frame.duration = await self._get_video_duration(local_path)
-                logger.debug(f"  ✓ Video generated: {local_path} (duration: {frame.duration:.2f}s)")
+                logger.debug("  ✓ Video generated: {} (duration: {:.2f}s)", local_path, frame.duration)
         
         else:
             raise ValueError(f"Unknown media type: {media_result.media_type}")
     
+    def prefetch_media(
+        self,
+        prompts: List[Optional[str]],
+        config: StoryboardConfig,
+        media_tasks: Dict[str, asyncio.Future],
+        max_concurrency: int = 4
+    ):
+        """
+        Start media generation for all frames ahead of frame processing
+        
+        Generations run in the background (at most max_concurrency at once)
+        and are registered in media_tasks, where each frame's media step
+        picks up its result instead of issuing its own request.
+        
+        Args:
+            prompts: Image prompts of all frames (None entries are skipped)
+            config: Storyboard configuration
+            media_tasks: Shared prompt -> task dict passed to __call__ later
+            max_concurrency: Maximum number of in-flight generations
+        """
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        for prompt in prompts:
+            if prompt is not None and prompt not in media_tasks:
+                media_tasks[prompt] = self._start_media_generation(prompt, config, semaphore)
+    
+    def _start_media_generation(
+        self,
+        prompt: str,
+        config: StoryboardConfig,
+        semaphore: Optional[asyncio.Semaphore] = None
+    ) -> asyncio.Future:
+        """Schedule a media generation task for a prompt"""
+        # Determine media type based on workflow
+        # video_ prefix in workflow name indicates video generation
+        workflow_name = config.image_workflow or ""
+        is_video_workflow = "video_" in workflow_name.lower()
+        media_type = "video" if is_video_workflow else "image"
+        
+        logger.debug("  → Media type: {} (workflow: {})", media_type, workflow_name)
+        
+        async def _generate():
+            # Call Media generation (with optional preset)
+            coro = self.core.media(
+                prompt=prompt,
+                workflow=config.image_workflow,  # Pass workflow from config (None = use default)
+                media_type=media_type,
+                width=config.image_width,
+                height=config.image_height
+            )
+            if semaphore is None:
+                return await coro
+            async with semaphore:
+                return await coro
+        
+        return asyncio.ensure_future(_generate())
+    
     async def _step_compose_frame(
         self,
         frame: StoryboardFrame,
@@ -245,7 +351,7 @@ class FrameProcessor:
         config: StoryboardConfig
     ):
         """Step 3: Compose frame with subtitle using HTML template"""
-        logger.debug(f"  3/4: Composing frame {frame.index}...")
+        logger.debug("  3/4: Composing frame {}...", frame.index)
         
         # Generate output path using task_id
         from pixelle_video.utils.os_util import get_task_frame_path
@@ -258,7 +364,7 @@ class FrameProcessor:
         
         frame.composed_image_path = composed_path
         
-        logger.debug(f"  ✓ Frame composed: {composed_path}")
+        logger.debug("  ✓ Frame composed: {}", composed_path)
     
     async def _compose_frame_html(
         self,
@@ -268,7 +374,6 @@ class FrameProcessor:
         output_path: str
     ) -> str:
         """Compose frame using HTML template"""
-        from pixelle_video.services.frame_html import HTMLFrameGenerator
         from pixelle_video.utils.template_util import resolve_template_path
         
         # Resolve template path (handles various input formats)
@@ -277,20 +382,15 @@ class FrameProcessor:
         # Get content metadata from storyboard
         content_metadata = storyboard.content_metadata if storyboard else None
         
-        # Build ext data
-        ext = {}
-        if content_metadata:
-            ext["content_title"] = content_metadata.title or ""
-            ext["content_author"] = content_metadata.author or ""
-            ext["content_subtitle"] = content_metadata.subtitle or ""
-            ext["content_genre"] = content_metadata.genre or ""
+        # Build ext data (content fields are shared by every frame)
+        ext = dict(content_metadata.template_ext) if content_metadata else {}
         
         # Add custom template parameters
         if config.template_params:
             ext.update(config.template_params)
         
         # Generate frame using HTML (size is auto-parsed from template path)
-        generator = HTMLFrameGenerator(template_path)
+        generator = self._get_frame_generator(template_path)
         composed_path = await generator.generate_frame(
             title=storyboard.title,
             text=frame.narration,
@@ -301,57 +401,60 @@ class FrameProcessor:
         
         return composed_path
     
+    def _get_frame_generator(self, template_path: str) -> "HTMLFrameGenerator":
+        """Get cached HTMLFrameGenerator for a template (reloaded if the file changed)"""
+        from pixelle_video.services.frame_html import HTMLFrameGenerator
+        
+        try:
+            mtime = os.path.getmtime(template_path)
+        except OSError:
+            # Let HTMLFrameGenerator raise its own "template not found" error
+            return HTMLFrameGenerator(template_path)
+        
+        cached = self._frame_generators.get(template_path)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        generator = HTMLFrameGenerator(template_path)
+        self._frame_generators[template_path] = (mtime, generator)
+        return generator
+    
     async def _step_create_video_segment(
         self,
         frame: StoryboardFrame,
         config: StoryboardConfig
     ):
         """Step 4: Create video segment from media + audio"""
-        logger.debug(f"  4/4: Creating video segment for frame {frame.index}...")
+        logger.debug("  4/4: Creating video segment for frame {}...", frame.index)
         
         # Generate output path using task_id
         from pixelle_video.utils.os_util import get_task_frame_path
         output_path = get_task_frame_path(config.task_id, frame.index, "segment")
         
-        from pixelle_video.services.video import VideoService
-        video_service = VideoService()
+        # Shared instance created once by the core
+        video_service = self.core.video
         
         # Branch based on media type
         if frame.media_type == "video":
             # Video workflow: overlay HTML template on video, then add audio
             logger.debug(f"  → Using video-based composition with HTML overlay")
             
-            # Step 1: Overlay transparent HTML image on video
-            # The composed_image_path contains the rendered HTML with transparent background
-            temp_video_with_overlay = get_task_frame_path(config.task_id, frame.index, "video") + "_overlay.mp4"
-            
-            video_service.overlay_image_on_video(
+            # Overlay transparent HTML image on video and add narration audio
+            # The composed_image_path contains the rendered HTML with transparent background.
+            # The overlaid video is piped straight into the audio merge (no temp file).
+            segment_path = await video_service.overlay_image_and_merge_audio_async(
                 video=frame.video_path,
                 overlay_image=frame.composed_image_path,
-                output=temp_video_with_overlay,
-                scale_mode="contain"  # Scale video to fit template size (contain mode)
-            )
-            
-            # Step 2: Add narration audio to the overlaid video
-            # Note: The video might have audio (replaced) or be silent (audio added)
-            segment_path = video_service.merge_audio_video(
-                video=temp_video_with_overlay,
-                audio=frame.audio_path,
+                audio=frame.audio_path,  # Replaces the video's own audio
                 output=output_path,
-                replace_audio=True,  # Replace video audio with narration
-                audio_volume=1.0
+                scale_mode="contain"  # Scale video to fit template size (contain mode)
             )
-            
-            # Clean up temp file
-            import os
-            if os.path.exists(temp_video_with_overlay):
-                os.unlink(temp_video_with_overlay)
         
         elif frame.media_type == "image" or frame.media_type is None:
             # Image workflow: create video from image + audio
             logger.debug(f"  → Using image-based composition")
             
-            segment_path = video_service.create_video_from_image(
+            segment_path = await video_service.create_video_from_image_async(
                 image=frame.composed_image_path,
                 audio=frame.audio_path,
                 output=output_path,
@@ -363,14 +466,14 @@ class FrameProcessor:
         
         frame.video_segment_path = segment_path
         
-        logger.debug(f"  ✓ Video segment created: {segment_path}")
+        logger.debug("  ✓ Video segment created: {}", segment_path)
     
     async def _get_audio_duration(self, audio_path: str) -> float:
         """Get audio duration in seconds"""
         try:
-            # Try using ffmpeg-python
-            import ffmpeg
-            probe = ffmpeg.probe(audio_path)
+            # Cached ffprobe (shared with the video service)
+            from pixelle_video.services.video import probe_media
+            probe = probe_media(audio_path)
             duration = float(probe['format']['duration'])
             return duration
         except Exception as e:
@@ -393,21 +496,21 @@ class FrameProcessor:
         from pixelle_video.utils.os_util import get_task_frame_path
         output_path = get_task_frame_path(task_id, frame_index, media_type)
         
-        timeout = httpx.Timeout(connect=10.0, read=60, write=60, pool=60)
-        async with httpx.AsyncClient(timeout=timeout) as client:
-            response = await client.get(url)
+        # Stream to disk so the whole file is never held in memory
+        client = get_http_client()
+        async with client.stream("GET", url) as response:
             response.raise_for_status()
-            
             with open(output_path, 'wb') as f:
-                f.write(response.content)
+                async for chunk in response.aiter_bytes():
+                    f.write(chunk)
         
         return output_path
     
     async def _get_video_duration(self, video_path: str) -> float:
         """Get video duration in seconds"""
         try:
-            import ffmpeg
-            probe = ffmpeg.probe(video_path)
+            from pixelle_video.services.video import probe_media
+            probe = probe_media(video_path)
             duration = float(probe['format']['duration'])
             return duration
         except Exception as e:
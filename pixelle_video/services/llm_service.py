@@ -14,12 +14,20 @@
 LLM (Large Language Model) Service - Direct OpenAI SDK implementation
 """
 
+import asyncio
 import os
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 from openai import AsyncOpenAI
 from loguru import logger
 
+from pixelle_video.utils.llm_cache import (
+    MAX_CACHEABLE_TEMPERATURE,
+    get_cached_response,
+    make_cache_key,
+    set_cached_response,
+)
+
 
 class LLMService:
     """
@@ -48,6 +56,8 @@ class LLMService:
         )
     """
     
+    __slots__ = ("config", "_clients", "_clients_loop")
+    
     def __init__(self, config: dict):
         """
         Initialize LLM service
@@ -56,7 +66,10 @@ class LLMService:
             config: Full application config dict
         """
         self.config = config.get("llm", {})
-        self._client: Optional[AsyncOpenAI] = None
+        
+        # Clients cached per (api_key, base_url), bound to the event loop they were created on
+        self._clients: Dict[Tuple[str, Optional[str]], AsyncOpenAI] = {}
+        self._clients_loop: Optional[asyncio.AbstractEventLoop] = None
     
     def _get_config_value(self, key: str, default=None):
         """
@@ -77,7 +90,11 @@ class LLMService:
         base_url: Optional[str] = None,
     ) -> AsyncOpenAI:
         """
-        Create OpenAI client
+        Get OpenAI client (cached per credentials)
+        
+        Clients are reused across calls so that connection pooling and
+        keep-alive apply. The cache is reset when the running event loop
+        changes, since the underlying HTTP transport is bound to a loop.
         
         Args:
             api_key: API key (optional, uses config if not provided)
@@ -99,12 +116,25 @@ class LLMService:
             or self._get_config_value("base_url")
         )
         
-        # Create client
-        client_kwargs = {"api_key": final_api_key}
-        if final_base_url:
-            client_kwargs["base_url"] = final_base_url
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+        if loop is not self._clients_loop:
+            self._clients = {}
+            self._clients_loop = loop
+        
+        cache_key = (final_api_key, final_base_url or None)
+        client = self._clients.get(cache_key)
+        if client is None:
+            client_kwargs = {"api_key": final_api_key}
+            if final_base_url:
+                client_kwargs["base_url"] = final_base_url
+            
+            client = AsyncOpenAI(**client_kwargs)
+            self._clients[cache_key] = client
         
-        return AsyncOpenAI(**client_kwargs)
+        return client
     
     async def __call__(
         self,
@@ -114,11 +144,18 @@ class LLMService:
         model: Optional[str] = None,
         temperature: float = 0.7,
         max_tokens: int = 2000,
+        use_cache: bool = True,
+        force_cache: bool = False,
+        json_mode: bool = False,
         **kwargs
     ) -> str:
         """
         Generate text using LLM
         
+        Near-deterministic requests (temperature <= 0.2, or any request with
+        force_cache=True) are served from an on-disk response cache when an
+        identical request was made before.
+        
         Args:
             prompt: The prompt to generate from
             api_key: API key (optional, uses config if not provided)
@@ -126,6 +163,11 @@ class LLMService:
             model: Model name (optional, uses config if not provided)
             temperature: Sampling temperature (0.0-2.0). Lower is more deterministic.
             max_tokens: Maximum tokens to generate
+            use_cache: Allow reading/writing the response cache (default: True)
+            force_cache: Cache regardless of temperature, for calls where reusing
+                an earlier sampled answer is acceptable (default: False)
+            json_mode: Prompt expects a JSON object; requests JSON output when
+                llm.json_mode is enabled in config (default: False)
             **kwargs: Additional provider-specific parameters
         
         Returns:
@@ -145,7 +187,7 @@ class LLMService:
                 max_tokens=500
             )
         """
-        # Create client (new instance each time to support parameter overrides)
+        # Get client (cached per api_key/base_url to support parameter overrides)
         client = self._create_client(api_key=api_key, base_url=base_url)
         
         # Get model (priority: parameter > config)
@@ -155,7 +197,28 @@ class LLMService:
             or "gpt-3.5-turbo"  # Default fallback
         )
         
-        logger.debug(f"LLM call: model={final_model}, base_url={client.base_url}")
+        logger.debug("LLM call: model={}, base_url={}", final_model, client.base_url)
+        
+        # Structured output (opt-in: not every OpenAI-compatible provider supports it)
+        if json_mode and self._get_config_value("json_mode", False) and "response_format" not in kwargs:
+            kwargs["response_format"] = {"type": "json_object"}
+        
+        # Response cache (only for near-deterministic requests)
+        cache_key = None
+        cacheable = force_cache or temperature <= MAX_CACHEABLE_TEMPERATURE
+        if use_cache and cacheable and not kwargs.get("stream"):
+            cache_key = make_cache_key(
+                model=final_model,
+                base_url=str(client.base_url),
+                temperature=temperature,
+                max_tokens=max_tokens,
+                prompt=prompt,
+                extra=kwargs
+            )
+            cached = get_cached_response(cache_key)
+            if cached is not None:
+                logger.debug(f"LLM cache hit ({len(cached)} chars)")
+                return cached
         
         try:
             response = await client.chat.completions.create(
@@ -167,7 +230,10 @@ class LLMService:
             )
             
             result = response.choices[0].message.content
-            logger.debug(f"LLM response length: {len(result)} chars")
+            logger.debug("LLM response length: {} chars", len(result))
+            
+            if cache_key and result:
+                set_cached_response(cache_key, result, model=final_model)
             
             return result
         
@@ -175,6 +241,17 @@ class LLMService:
             logger.error(f"LLM call error (model={final_model}, base_url={client.base_url}): {e}")
             raise
     
+    async def aclose(self):
+        """Close cached clients (call on shutdown)"""
+        clients = list(self._clients.values())
+        self._clients = {}
+        self._clients_loop = None
+        for client in clients:
+            try:
+                await client.close()
+            except Exception as e:
+                logger.debug(f"Failed to close LLM client: {e}")
+    
     @property
     def active(self) -> str:
         """
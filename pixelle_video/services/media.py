@@ -19,7 +19,6 @@ Automatically detects output type based on ExecuteResult.
 
 from typing import Optional
 
-from comfykit import ComfyKit
 from loguru import logger
 
 from pixelle_video.services.comfy_base_service import ComfyBaseService
@@ -51,7 +50,9 @@ class MediaService(ComfyBaseService):
         workflows = pixelle_video.media.list_workflows()
     """
     
-    WORKFLOW_PREFIX = ""  # Will be overridden by _scan_workflows
+    __slots__ = ()
+    
+    WORKFLOW_PREFIX = ("image_", "video_")  # Both image and video workflows
     DEFAULT_WORKFLOW = None  # No hardcoded default, must be configured
     WORKFLOWS_DIR = "workflows"
     
@@ -64,48 +65,6 @@ class MediaService(ComfyBaseService):
         """
         super().__init__(config, service_name="image")  # Keep "image" for config compatibility
     
-    def _scan_workflows(self):
-        """
-        Scan workflows for both image_ and video_ prefixes
-        
-        Override parent method to support multiple prefixes
-        """
-        from pixelle_video.utils.os_util import list_resource_dirs, list_resource_files, get_resource_path
-        from pathlib import Path
-        
-        workflows = []
-        
-        # Get all workflow source directories
-        source_dirs = list_resource_dirs("workflows")
-        
-        if not source_dirs:
-            logger.warning("No workflow source directories found")
-            return workflows
-        
-        # Scan each source directory for workflow files
-        for source_name in source_dirs:
-            # Get all JSON files for this source
-            workflow_files = list_resource_files("workflows", source_name)
-            
-            # Filter to only files matching image_ or video_ prefix
-            matching_files = [
-                f for f in workflow_files 
-                if (f.startswith("image_") or f.startswith("video_")) and f.endswith('.json')
-            ]
-            
-            for filename in matching_files:
-                try:
-                    # Get actual file path
-                    file_path = Path(get_resource_path("workflows", source_name, filename))
-                    workflow_info = self._parse_workflow_file(file_path, source_name)
-                    workflows.append(workflow_info)
-                    logger.debug(f"Found workflow: {workflow_info['key']}")
-                except Exception as e:
-                    logger.error(f"Failed to parse workflow {source_name}/{filename}: {e}")
-        
-        # Sort by key (source/name)
-        return sorted(workflows, key=lambda w: w["key"])
-    
     async def __call__(
         self,
         prompt: str,
@@ -201,32 +160,27 @@ class MediaService(ComfyBaseService):
         )
         
         # 3. Build workflow parameters
-        workflow_params = {"prompt": prompt}
-        
-        # Add optional parameters
-        if width is not None:
-            workflow_params["width"] = width
-        if height is not None:
-            workflow_params["height"] = height
-        if negative_prompt is not None:
-            workflow_params["negative_prompt"] = negative_prompt
-        if steps is not None:
-            workflow_params["steps"] = steps
-        if seed is not None:
-            workflow_params["seed"] = seed
-        if cfg is not None:
-            workflow_params["cfg"] = cfg
-        if sampler is not None:
-            workflow_params["sampler"] = sampler
-        
-        # Add any additional parameters
-        workflow_params.update(params)
-        
-        logger.debug(f"Workflow parameters: {workflow_params}")
+        # (optional parameters only if provided; additional params override)
+        optional_params = {
+            "width": width,
+            "height": height,
+            "negative_prompt": negative_prompt,
+            "steps": steps,
+            "seed": seed,
+            "cfg": cfg,
+            "sampler": sampler,
+        }
+        workflow_params = {
+            "prompt": prompt,
+            **{k: v for k, v in optional_params.items() if v is not None},
+            **params,
+        }
+        
+        logger.debug("Workflow parameters: {}", workflow_params)
         
         # 4. Execute workflow (ComfyKit auto-detects based on input type)
         try:
-            kit = ComfyKit(**kit_config)
+            kit = self._get_comfykit(kit_config)
             
             # Determine what to pass to ComfyKit based on source
             if workflow_info["source"] == "runninghub" and "workflow_id" in workflow_info:
@@ -257,9 +211,7 @@ class MediaService(ComfyBaseService):
                 logger.info(f"✅ Generated video: {video_url}")
                 
                 # Try to extract duration from result (if available)
-                duration = None
-                if hasattr(result, 'duration') and result.duration:
-                    duration = result.duration
+                duration = getattr(result, 'duration', None) or None
                 
                 return MediaResult(
                     media_type="video",
@@ -14,12 +14,12 @@
 TTS (Text-to-Speech) Service - Supports both local and ComfyUI inference
 """
 
+import asyncio
 import os
 import uuid
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Union
 
-from comfykit import ComfyKit
 from loguru import logger
 
 from pixelle_video.services.comfy_base_service import ComfyBaseService
@@ -27,6 +27,10 @@ from pixelle_video.utils.tts_util import edge_tts
 from pixelle_video.tts_voices import speed_to_rate
 
 
+# Audio file extensions recognized in workflow outputs
+_AUDIO_EXTENSIONS = ('.mp3', '.wav', '.flac')
+
+
 class TTSService(ComfyBaseService):
     """
     TTS (Text-to-Speech) service - Workflow-based
@@ -47,6 +51,8 @@ class TTSService(ComfyBaseService):
         workflows = pixelle_video.tts.list_workflows()
     """
     
+    __slots__ = ()
+    
     WORKFLOW_PREFIX = "tts_"
     DEFAULT_WORKFLOW = None  # No hardcoded default, must be configured
     WORKFLOWS_DIR = "workflows"
@@ -137,6 +143,48 @@ class TTSService(ComfyBaseService):
                 **params
             )
     
+    async def batch(
+        self,
+        texts: List[str],
+        max_concurrency: int = 4,
+        output_paths: Optional[List[Optional[str]]] = None,
+        **shared
+    ) -> List[Union[str, Exception]]:
+        """
+        Generate speech for multiple texts concurrently
+        
+        Args:
+            texts: Texts to convert to speech
+            max_concurrency: Maximum number of in-flight syntheses
+            output_paths: Optional per-text output paths (same length as texts)
+            **shared: Parameters common to all items (voice, speed, inference_mode, ...)
+        
+        Returns:
+            List in the same order as texts; failed items hold the raised exception
+        
+        Example:
+            audio_paths = await pixelle_video.tts.batch(
+                ["第一段旁白", "第二段旁白"],
+                inference_mode="local",
+                voice="zh-CN-YunjianNeural"
+            )
+        """
+        if output_paths is None:
+            output_paths = [None] * len(texts)
+        elif len(output_paths) != len(texts):
+            raise ValueError("output_paths must have the same length as texts")
+        
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        async def _run(text: str, output_path: Optional[str]) -> str:
+            async with semaphore:
+                return await self(text, output_path=output_path, **shared)
+        
+        return await asyncio.gather(
+            *(_run(t, p) for t, p in zip(texts, output_paths)),
+            return_exceptions=True
+        )
+    
     async def _call_local_tts(
         self,
         text: str,
@@ -179,11 +227,13 @@ class TTSService(ComfyBaseService):
         
         # Call Edge TTS
         try:
-            audio_bytes = await edge_tts(
+            # Only the file is needed here; skip materializing the audio bytes
+            await edge_tts(
                 text=text,
                 voice=final_voice,
                 rate=rate,
-                output_path=output_path
+                output_path=output_path,
+                return_bytes=False
             )
             
             logger.info(f"✅ Generated audio (local Edge TTS): {output_path}")
@@ -228,23 +278,20 @@ class TTSService(ComfyBaseService):
             runninghub_api_key=runninghub_api_key
         )
         
-        # 2. Build workflow parameters
-        workflow_params = {"text": text}
-        
-        # Add optional TTS parameters (only if explicitly provided and not None)
-        if voice is not None:
-            workflow_params["voice"] = voice
-        if speed is not None and speed != 1.0:
-            workflow_params["speed"] = speed
+        # 2. Build workflow parameters (optional TTS parameters only if explicitly
+        # provided and not None; additional params override)
+        workflow_params = {
+            "text": text,
+            **({"voice": voice} if voice is not None else {}),
+            **({"speed": speed} if speed is not None and speed != 1.0 else {}),
+            **params,
+        }
         
-        # Add any additional parameters
-        workflow_params.update(params)
-        
-        logger.debug(f"Workflow parameters: {workflow_params}")
+        logger.debug("Workflow parameters: {}", workflow_params)
         
         # 3. Execute workflow (ComfyKit auto-detects based on input type)
         try:
-            kit = ComfyKit(**kit_config)
+            kit = self._get_comfykit(kit_config)
             
             # Determine what to pass to ComfyKit based on source
             if workflow_info["source"] == "runninghub" and "workflow_id" in workflow_info:
@@ -268,20 +315,24 @@ class TTSService(ComfyBaseService):
             # Try to get audio file path from result
             audio_path = None
             
-            # Check for audio files in result.audios (if available)
-            if hasattr(result, 'audios') and result.audios:
-                audio_path = result.audios[0]
+            audios = getattr(result, 'audios', None)
+            files = getattr(result, 'files', None)
+            outputs = getattr(result, 'outputs', None)
+            
+            # Check for audio files in result.audios (common case)
+            if audios:
+                audio_path = audios[0]
                 logger.debug(f"✅ Found audio in result.audios: {audio_path}")
             # Check for files in result.files
-            elif hasattr(result, 'files') and result.files:
-                audio_path = result.files[0]
+            elif files:
+                audio_path = files[0]
                 logger.debug(f"✅ Found audio in result.files: {audio_path}")
             # Check in outputs dictionary
-            elif hasattr(result, 'outputs') and result.outputs:
-                logger.debug(f"Searching for audio file in result.outputs: {result.outputs}")
+            elif outputs:
+                logger.debug(f"Searching for audio file in result.outputs: {outputs}")
                 # Try to find audio file in outputs
-                for key, value in result.outputs.items():
-                    if isinstance(value, str) and any(value.endswith(ext) for ext in ['.mp3', '.wav', '.flac']):
+                for key, value in outputs.items():
+                    if isinstance(value, str) and value.endswith(_AUDIO_EXTENSIONS):
                         audio_path = value
                         logger.debug(f"✅ Found audio in result.outputs[{key}]: {audio_path}")
                         break
@@ -297,19 +348,19 @@ class TTSService(ComfyBaseService):
             
             # If output_path provided and audio_path is URL, download to local
             if output_path and audio_path.startswith(('http://', 'https://')):
-                import httpx
-                import os
+                from pixelle_video.utils.http_util import get_http_client
                 
                 # Ensure parent directory exists
                 os.makedirs(os.path.dirname(output_path), exist_ok=True)
                 
                 logger.info(f"Downloading audio from {audio_path} to {output_path}")
-                async with httpx.AsyncClient() as client:
-                    response = await client.get(audio_path)
+                # Stream to disk so the whole file is never held in memory
+                client = get_http_client()
+                async with client.stream("GET", audio_path) as response:
                     response.raise_for_status()
-                    
                     with open(output_path, 'wb') as f:
-                        f.write(response.content)
+                        async for chunk in response.aiter_bytes():
+                            f.write(chunk)
                 
                 logger.info(f"✅ Generated audio (ComfyUI): {output_path}")
                 return output_path
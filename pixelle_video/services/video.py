@@ -24,11 +24,12 @@ Features:
 Note: Requires FFmpeg to be installed on the system.
 """
 
+import asyncio
 import os
 import shutil
-import tempfile
-from pathlib import Path
-from typing import List, Literal, Optional
+import subprocess
+from functools import lru_cache
+from typing import Callable, Dict, List, Literal, Optional, Tuple
 
 import ffmpeg
 from loguru import logger
@@ -60,6 +61,95 @@ def check_ffmpeg() -> None:
 check_ffmpeg()
 
 
+@lru_cache(maxsize=512)
+def _cached_probe(path: str, mtime_ns: int, size: int) -> dict:
+    return ffmpeg.probe(path)
+
+
+def probe_media(path: str) -> dict:
+    """
+    ffprobe a media file, cached per file version
+    
+    Each ffprobe is a subprocess spawn; a pipeline probes the same audio and
+    video files several times (durations, stream layout, codecs). Results
+    are cached keyed by (path, mtime, size), so a rewritten file is probed
+    again. The returned dict is shared: do not modify it.
+    
+    Args:
+        path: Media file path
+    
+    Returns:
+        ffmpeg.probe() result
+    
+    Raises:
+        ffmpeg.Error: If ffprobe fails
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        # Not a local file (URL) or missing: probe uncached, ffprobe reports the error
+        return ffmpeg.probe(path)
+    return _cached_probe(path, stat.st_mtime_ns, stat.st_size)
+
+
+# Concat demuxer list quoting: ' closes the quote, adds an escaped quote, reopens
+_CONCAT_QUOTE_ESCAPE = str.maketrans({"'": "'\\''"})
+
+# Containers with a moov atom (index), which FFmpeg writes last by default
+_MP4_EXTENSIONS = ('.mp4', '.m4v', '.mov')
+
+
+def _output_kwargs(output: str) -> dict:
+    """
+    Muxer options for an output file
+    
+    MP4/MOV outputs get +faststart so the moov atom is placed before the
+    media data and the file can start playing over HTTP before it is fully
+    downloaded. Other containers don't take movflags (FFmpeg rejects unused
+    muxer options), so they get none.
+    """
+    if output.lower().endswith(_MP4_EXTENSIONS):
+        return {'movflags': '+faststart'}
+    return {}
+
+
+@lru_cache(maxsize=32)
+def _image_video_output_args(codec_args: Tuple[str, ...], threads: Optional[int], is_mp4: bool) -> Tuple[str, ...]:
+    """
+    Output options of create_video_from_image() for one output shape
+    
+    Segments of a video all share encoder, thread limit and container, so
+    these are assembled once and reused for every segment.
+    """
+    args = ['-c:a', 'aac', '-b:a', '192k', '-pix_fmt', 'yuv420p', *codec_args, '-b:v', '2M']
+    if threads:
+        # Limit encoder threads when several encodes run side by side
+        args.extend(['-threads', str(threads)])
+    if is_mp4:
+        args.extend(['-movflags', '+faststart'])
+    return tuple(args)
+
+
+def _filter_thread_args() -> List[str]:
+    """
+    Global options letting filter graphs use every core
+    
+    Used with -threads 0 (encoder auto threading) on single re-encodes of
+    whole videos (filter concat, audio mix). Not used for per-segment encodes,
+    which already run several FFmpeg processes side by side.
+    """
+    cpu_count = str(os.cpu_count() or 1)
+    return ['-filter_threads', cpu_count, '-filter_complex_threads', cpu_count]
+
+
+def _output_args(output: str) -> List[str]:
+    """Command-line form of _output_kwargs()"""
+    args = []
+    for key, value in _output_kwargs(output).items():
+        args.extend([f'-{key}', value])
+    return args
+
+
 class VideoService:
     """
     Video compositor for common video processing tasks
@@ -99,11 +189,251 @@ class VideoService:
         ... )
     """
     
+    # Hardware H.264 encoders, in "auto" preference order
+    HW_ENCODERS = {
+        "cuda": "h264_nvenc",
+        "qsv": "h264_qsv",
+    }
+    
+    # Encoder name -> usable on this machine (probed once per process)
+    _encoder_support: Dict[str, bool] = {}
+    _ffmpeg_encoders: Optional[str] = None
+    # Whether a CUDA-decoded, scale_cuda + concat graph works (probed once per process)
+    _cuda_concat_support: Optional[bool] = None
+    
+    def __init__(
+        self,
+        hw_accel: Literal["auto", "cuda", "qsv", "none"] = "auto",
+        max_parallel: Optional[int] = None
+    ):
+        """
+        Initialize video service
+        
+        Args:
+            hw_accel: Hardware video encoder selection
+                - "auto": Use NVENC or Quick Sync when a test encode succeeds, else libx264
+                - "cuda": Prefer NVENC (h264_nvenc)
+                - "qsv": Prefer Intel Quick Sync (h264_qsv)
+                - "none": Always encode on CPU with libx264
+            max_parallel: Maximum number of FFmpeg processes run concurrently by
+                the *_async methods (default: half the CPU count)
+        """
+        if hw_accel not in ("auto", "none", *self.HW_ENCODERS):
+            raise ValueError(f"Invalid hw_accel: {hw_accel!r}")
+        self.hw_accel = hw_accel
+        self._video_encoder: Optional[str] = None  # Resolved on first encode
+        
+        self.max_parallel = max(1, max_parallel or (os.cpu_count() or 2) // 2)
+        # Semaphore bound to the event loop it was created on
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._semaphore_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    async def _run_in_thread(self, func: Callable, *args, **kwargs):
+        """Run a blocking FFmpeg method in a worker thread, at most max_parallel at a time"""
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._semaphore_loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_parallel)
+            self._semaphore_loop = loop
+        
+        async with self._semaphore:
+            return await asyncio.to_thread(func, *args, **kwargs)
+    
+    async def concat_videos_async(self, *args, **kwargs) -> str:
+        """Async variant of concat_videos() (FFmpeg runs off the event loop)"""
+        return await self._run_in_thread(self.concat_videos, *args, **kwargs)
+    
+    async def merge_audio_video_async(self, *args, **kwargs) -> str:
+        """Async variant of merge_audio_video() (FFmpeg runs off the event loop)"""
+        return await self._run_in_thread(self.merge_audio_video, *args, **kwargs)
+    
+    async def overlay_image_on_video_async(self, *args, **kwargs) -> str:
+        """Async variant of overlay_image_on_video() (FFmpeg runs off the event loop)"""
+        return await self._run_in_thread(self.overlay_image_on_video, *args, **kwargs)
+    
+    async def overlay_image_and_merge_audio_async(self, *args, **kwargs) -> str:
+        """Async variant of overlay_image_and_merge_audio() (FFmpeg runs off the event loop)"""
+        return await self._run_in_thread(self.overlay_image_and_merge_audio, *args, **kwargs)
+    
+    async def create_video_from_image_async(self, *args, **kwargs) -> str:
+        """Async variant of create_video_from_image() (FFmpeg runs off the event loop)"""
+        return await self._run_in_thread(self.create_video_from_image, *args, **kwargs)
+    
+    async def add_bgm_async(self, *args, **kwargs) -> str:
+        """Async variant of add_bgm() (FFmpeg runs off the event loop)"""
+        return await self._run_in_thread(self.add_bgm, *args, **kwargs)
+    
+    @classmethod
+    def _encoder_available(cls, encoder: str) -> bool:
+        """Check that FFmpeg has the encoder and that it actually works here"""
+        supported = cls._encoder_support.get(encoder)
+        if supported is not None:
+            return supported
+        
+        supported = False
+        try:
+            if cls._ffmpeg_encoders is None:
+                cls._ffmpeg_encoders = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-encoders"],
+                    capture_output=True, text=True, timeout=10
+                ).stdout
+            # Being compiled in doesn't mean a GPU/driver is present: run a tiny test encode
+            if f" {encoder} " in cls._ffmpeg_encoders:
+                result = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-loglevel", "error",
+                     "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.1",
+                     "-c:v", encoder, "-f", "null", "-"],
+                    capture_output=True, timeout=15
+                )
+                supported = result.returncode == 0
+        except Exception as e:
+            logger.debug(f"Failed to probe encoder {encoder}: {e}")
+        
+        cls._encoder_support[encoder] = supported
+        return supported
+    
+    @classmethod
+    def _cuda_concat_available(cls) -> bool:
+        """Check that a multi-input concat over CUDA frames works here"""
+        if cls._cuda_concat_support is not None:
+            return cls._cuda_concat_support
+        
+        supported = False
+        try:
+            import tempfile
+            with tempfile.TemporaryDirectory() as tmp_dir:
+                # hwaccel needs a real encoded input; lavfi frames are never GPU-decoded
+                clip = os.path.join(tmp_dir, "probe.mp4")
+                subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin",
+                     "-f", "lavfi", "-i", "color=c=black:s=256x256:d=0.2",
+                     "-c:v", "h264_nvenc", "-y", clip],
+                    capture_output=True, timeout=15, check=True
+                )
+                hw_input = ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda", "-i", clip]
+                result = subprocess.run(
+                    ["ffmpeg", "-hide_banner", "-loglevel", "error", "-nostdin",
+                     *hw_input, *hw_input,
+                     "-filter_complex",
+                     "[0:v]scale_cuda=256:256[g0];[1:v]scale_cuda=256:256[g1];"
+                     "[g0][g1]concat=n=2:v=1:a=0[v]",
+                     "-map", "[v]", "-c:v", "h264_nvenc", "-f", "null", "-"],
+                    capture_output=True, timeout=15
+                )
+                supported = result.returncode == 0
+        except Exception as e:
+            logger.debug(f"Failed to probe CUDA concat: {e}")
+        
+        cls._cuda_concat_support = supported
+        return supported
+    
+    def _select_video_encoder(self) -> str:
+        """Resolve the H.264 encoder to use (cached per instance)"""
+        if self._video_encoder is None:
+            if self.hw_accel == "none":
+                candidates = []
+            elif self.hw_accel == "auto":
+                candidates = list(self.HW_ENCODERS.values())
+            else:
+                candidates = [self.HW_ENCODERS[self.hw_accel]]
+            
+            self._video_encoder = next(
+                (encoder for encoder in candidates if self._encoder_available(encoder)),
+                "libx264"
+            )
+            if self._video_encoder != "libx264":
+                logger.info(f"Using hardware video encoder: {self._video_encoder}")
+            elif self.hw_accel not in ("auto", "none"):
+                logger.warning(f"Hardware encoder for '{self.hw_accel}' not available, using libx264")
+        return self._video_encoder
+    
+    def _video_codec_kwargs(self, encoder: str) -> dict:
+        """Output kwargs for an encoder, matching libx264 preset=medium/crf=23 quality"""
+        if encoder == "h264_nvenc":
+            return {"vcodec": encoder, "preset": "p4", "tune": "hq", "rc": "vbr", "cq": 23}
+        if encoder == "h264_qsv":
+            return {"vcodec": encoder, "preset": "medium", "global_quality": 23}
+        return {"vcodec": "libx264", "preset": "medium", "crf": 23}
+    
+    def _run_encode(self, build: Callable[[dict], "ffmpeg.nodes.OutputStream"]):
+        """
+        Run an encode with the selected video encoder
+        
+        Args:
+            build: Returns the output stream for the given video codec kwargs
+        
+        Raises:
+            ffmpeg.Error: If the encode fails (after retrying with libx264
+                when a hardware encoder was used)
+        """
+        encoder = self._select_video_encoder()
+        try:
+            build(self._video_codec_kwargs(encoder)).overwrite_output().run(capture_stdout=True, capture_stderr=True)
+        except ffmpeg.Error as e:
+            if encoder == "libx264":
+                raise
+            error_msg = e.stderr.decode(errors="replace") if e.stderr else str(e)
+            logger.warning(f"{encoder} encode failed, retrying with libx264: {error_msg[-500:]}")
+            build(self._video_codec_kwargs("libx264")).overwrite_output().run(capture_stdout=True, capture_stderr=True)
+    
+    def _run_ffmpeg(self, args: List[str], input: Optional[bytes] = None):
+        """
+        Run FFmpeg with a prebuilt argument list
+        
+        Used for fixed commands that need no filter DSL, where building an
+        ffmpeg-python graph and serializing it back to argv is pure overhead.
+        
+        Args:
+            args: Arguments after the "ffmpeg" executable
+            input: Data fed to FFmpeg's stdin (e.g. a concat file list)
+        
+        Raises:
+            ffmpeg.Error: If FFmpeg exits with a non-zero status (same error
+                type as ffmpeg-python runs, so callers handle both alike)
+        """
+        cmd = ['ffmpeg', '-hide_banner']
+        if input is None:
+            cmd.append('-nostdin')
+        cmd.extend(args)
+        
+        logger.debug(f"Running: {' '.join(cmd)}")
+        result = subprocess.run(cmd, input=input, capture_output=True)
+        if result.returncode != 0:
+            raise ffmpeg.Error('ffmpeg', result.stdout, result.stderr)
+    
+    def _video_codec_args(self, encoder: str) -> List[str]:
+        """Command-line form of _video_codec_kwargs()"""
+        args = []
+        for key, value in self._video_codec_kwargs(encoder).items():
+            args.extend(['-c:v' if key == 'vcodec' else f'-{key}', str(value)])
+        return args
+    
+    def _run_encode_args(self, build: Callable[[List[str]], List[str]], input: Optional[bytes] = None):
+        """
+        Argument-list variant of _run_encode()
+        
+        Args:
+            build: Returns the FFmpeg arguments for the given video codec arguments
+            input: Data fed to FFmpeg's stdin
+        
+        Raises:
+            ffmpeg.Error: If the encode fails (after retrying with libx264
+                when a hardware encoder was used)
+        """
+        encoder = self._select_video_encoder()
+        try:
+            self._run_ffmpeg(build(self._video_codec_args(encoder)), input=input)
+        except ffmpeg.Error as e:
+            if encoder == "libx264":
+                raise
+            error_msg = e.stderr.decode(errors="replace") if e.stderr else str(e)
+            logger.warning(f"{encoder} encode failed, retrying with libx264: {error_msg[-500:]}")
+            self._run_ffmpeg(build(self._video_codec_args("libx264")), input=input)
+    
     def concat_videos(
         self,
         videos: List[str],
         output: str,
-        method: Literal["demuxer", "filter"] = "demuxer",
+        method: Literal["demuxer", "filter", "auto"] = "auto",
         bgm_path: Optional[str] = None,
         bgm_volume: float = 0.2,
         bgm_mode: Literal["once", "loop"] = "loop"
@@ -115,6 +445,8 @@ class VideoService:
             videos: List of video file paths to concatenate
             output: Output video file path
             method: Concatenation method
+                - "auto": Probe the inputs and use "demuxer" when their formats
+                  match, otherwise "filter" (default)
                 - "demuxer": Fast, no re-encoding (requires identical formats)
                 - "filter": Slower but handles different formats
             bgm_path: Background music file path (optional)
@@ -146,13 +478,41 @@ class VideoService:
             shutil.copy(videos[0], output)
             return output
         
+        if method == "auto":
+            method = self._choose_concat_method(videos)
+        
         logger.info(f"Concatenating {len(videos)} videos using {method} method")
         
         # Step 1: Concatenate videos
+        if bgm_path:
+            # Concatenate and mix BGM in a single pass, without writing
+            # (and re-reading) an intermediate concatenated file
+            resolved_bgm = self._resolve_bgm_path(bgm_path)
+            if method != "demuxer":
+                # The filter concat already falls back from CUDA to CPU inside;
+                # a two-pass retry would only repeat the same re-encode
+                return self._concat_filter(
+                    videos,
+                    output,
+                    bgm=resolved_bgm,
+                    bgm_volume=bgm_volume,
+                    loop=(bgm_mode == "loop")
+                )
+            try:
+                return self._concat_demuxer_with_bgm(
+                    videos,
+                    output,
+                    bgm=resolved_bgm,
+                    bgm_volume=bgm_volume,
+                    loop=(bgm_mode == "loop")
+                )
+            except RuntimeError as e:
+                logger.warning(f"Single-pass concat with BGM failed, falling back to two passes: {e}")
+        
         if bgm_path:
             # If BGM needed, concatenate to temp file first
             temp_output = output.replace('.mp4', '_no_bgm.mp4')
-            concat_result = self._concat_demuxer(videos, temp_output) if method == "demuxer" else self._concat_filter(videos, temp_output)
+            concat_result = self._concat_demuxer(videos, temp_output)
             
             # Step 2: Add BGM
             logger.info(f"Adding BGM: {bgm_path} (volume={bgm_volume}, mode={bgm_mode})")
@@ -164,9 +524,11 @@ class VideoService:
                 mode=bgm_mode
             )
             
-            # Clean up temp file
-            if os.path.exists(temp_output):
+            # Clean up temp file (one syscall; no separate existence check)
+            try:
                 os.unlink(temp_output)
+            except FileNotFoundError:
+                pass
             
             return final_result
         else:
@@ -176,34 +538,97 @@ class VideoService:
             else:
                 return self._concat_filter(videos, output)
     
+    def _concat_signature(self, video: str) -> Tuple:
+        """
+        Stream parameters that must match for stream-copy concatenation
+        
+        Returns:
+            (codec_name, width, height, pix_fmt, r_frame_rate) of the first
+            video stream plus (codec_name, sample_rate, channels) of the first
+            audio stream (None entries when a stream is missing)
+        """
+        streams = probe_media(video).get('streams', [])
+        video_stream = next((s for s in streams if s.get('codec_type') == 'video'), {})
+        audio_stream = next((s for s in streams if s.get('codec_type') == 'audio'), {})
+        return (
+            video_stream.get('codec_name'),
+            video_stream.get('width'),
+            video_stream.get('height'),
+            video_stream.get('pix_fmt'),
+            video_stream.get('r_frame_rate'),
+            audio_stream.get('codec_name'),
+            audio_stream.get('sample_rate'),
+            audio_stream.get('channels'),
+        )
+    
+    def _choose_concat_method(self, videos: List[str]) -> Literal["demuxer", "filter"]:
+        """
+        Use the concat demuxer (stream copy) when all inputs share codecs,
+        resolution, pixel format, frame rate and audio layout, else the filter
+        """
+        try:
+            signatures = {self._concat_signature(video) for video in videos}
+        except Exception as e:
+            logger.warning(f"Failed to probe videos for concat, using filter method: {e}")
+            return "filter"
+        
+        if len(signatures) == 1:
+            logger.debug("All videos share the same stream parameters, using concat demuxer")
+            return "demuxer"
+        
+        logger.info(f"Videos have {len(signatures)} different stream layouts, using concat filter (re-encode)")
+        return "filter"
+    
+    def _build_concat_filelist(self, videos: List[str]) -> bytes:
+        """
+        Build a concat demuxer file list in memory
+        
+        The list is fed to FFmpeg on stdin (see _concat_input), so no
+        temporary file is created, reopened and deleted per concat.
+        
+        Returns:
+            File list content (UTF-8)
+        """
+        if os.name == "posix":
+            # posixpath.abspath() calls os.getcwd() (a syscall) for every
+            # relative path; resolve against the working directory once
+            cwd = os.getcwd()
+            join, normpath, isabs = os.path.join, os.path.normpath, os.path.isabs
+            paths = [normpath(video if isabs(video) else join(cwd, video)) for video in videos]
+        else:
+            paths = [os.path.abspath(video) for video in videos]
+        
+        return "".join([
+            "file '" + path.translate(_CONCAT_QUOTE_ESCAPE) + "'\n"
+            for path in paths
+        ]).encode("utf-8")
+    
+    def _concat_input(self):
+        """Concat demuxer input reading its file list from stdin"""
+        # Entries are local files referenced from a pipe input, so both
+        # protocols must be whitelisted
+        return ffmpeg.input('pipe:', format='concat', safe=0, protocol_whitelist='file,pipe')
+    
     def _concat_demuxer(self, videos: List[str], output: str) -> str:
         """
         Concatenate using concat demuxer (fast, no re-encoding)
         
         FFmpeg equivalent:
-            ffmpeg -f concat -safe 0 -i filelist.txt -c copy output.mp4
-        """
-        # Create temporary file list
-        with tempfile.NamedTemporaryFile(
-            mode='w',
-            delete=False,
-            suffix='.txt',
-            encoding='utf-8'
-        ) as f:
-            for video in videos:
-                abs_path = Path(video).absolute()
-                escaped_path = str(abs_path).replace("'", "'\\''")
-                f.write(f"file '{escaped_path}'\n")
-            filelist = f.name
+            ffmpeg -f concat -safe 0 -protocol_whitelist file,pipe -i pipe: -c copy output.mp4
+            (file list on stdin)
+        """
+        filelist = self._build_concat_filelist(videos)
         
         try:
-            logger.debug(f"Created filelist: {filelist}")
-            (
-                ffmpeg
-                .input(filelist, format='concat', safe=0)
-                .output(output, c='copy')
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+            self._run_ffmpeg(
+                [
+                    '-f', 'concat', '-safe', '0', '-protocol_whitelist', 'file,pipe',
+                    '-i', 'pipe:',
+                    '-c', 'copy',
+                    *_output_args(output),
+                    '-y', output
+                ],
+                input=filelist
             )
             logger.success(f"Videos concatenated successfully: {output}")
             return output
@@ -211,61 +636,179 @@ class VideoService:
             error_msg = e.stderr.decode() if e.stderr else str(e)
             logger.error(f"FFmpeg concat error: {error_msg}")
             raise RuntimeError(f"Failed to concatenate videos: {error_msg}")
-        finally:
-            if os.path.exists(filelist):
-                os.unlink(filelist)
     
-    def _concat_filter(self, videos: List[str], output: str) -> str:
+    def _concat_demuxer_with_bgm(
+        self,
+        videos: List[str],
+        output: str,
+        bgm: str,
+        bgm_volume: float = 0.2,
+        loop: bool = True
+    ) -> str:
+        """
+        Concatenate using concat demuxer and mix in BGM in the same pass
+        
+        Video is stream-copied; only the audio is re-encoded (as add_bgm does).
+        
+        FFmpeg equivalent:
+            ffmpeg -f concat -safe 0 -protocol_whitelist file,pipe -i pipe: -stream_loop -1 -i bgm.mp3
+                   -filter_complex "[1:a]volume=0.2[b];[0:a][b]amix=inputs=2:duration=first[a]"
+                   -map 0:v -map "[a]" -c:v copy -c:a aac -b:a 192k output.mp4
+        """
+        filelist = self._build_concat_filelist(videos)
+        
+        try:
+            logger.info(f"Concatenating with BGM in one pass (volume={bgm_volume}, loop={loop})")
+            input_video = self._concat_input()
+            bgm_input = ffmpeg.input(bgm, stream_loop=-1 if loop else 0)
+            
+            mixed_audio = ffmpeg.filter(
+                [input_video.audio, bgm_input.audio.filter('volume', bgm_volume)],
+                'amix',
+                inputs=2,
+                duration='first'  # Use video's duration
+            )
+            
+            (
+                ffmpeg
+                .output(
+                    input_video.video,
+                    mixed_audio,
+                    output,
+                    vcodec='copy',
+                    acodec='aac',
+                    audio_bitrate='192k',
+                    **_output_kwargs(output)
+                )
+                .overwrite_output()
+                .run(input=filelist, capture_stdout=True, capture_stderr=True)
+            )
+            logger.success(f"Videos concatenated with BGM successfully: {output}")
+            return output
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            logger.error(f"FFmpeg concat with BGM error: {error_msg}")
+            raise RuntimeError(f"Failed to concatenate videos with BGM: {error_msg}")
+    
+    def _concat_filter(
+        self,
+        videos: List[str],
+        output: str,
+        bgm: Optional[str] = None,
+        bgm_volume: float = 0.2,
+        loop: bool = True
+    ) -> str:
         """
         Concatenate using concat filter (slower but handles different formats)
         
+        When bgm is given, it is mixed into the concatenated audio in the same
+        filter graph (as add_bgm does), so no intermediate file is written.
+        
         FFmpeg equivalent:
             ffmpeg -i v1.mp4 -i v2.mp4 -filter_complex "[0:v][0:a][1:v][1:a]concat=n=2:v=1:a=1[v][a]"
                    -map "[v]" -map "[a]" output.mp4
+        
+            With BGM:
+            ffmpeg -i v1.mp4 -i v2.mp4 -stream_loop -1 -i bgm.mp3
+                   -filter_complex "[0:v][0:a][1:v][1:a]concat=n=2:v=1:a=1[v][a0];
+                                    [2:a]volume=0.2[b];[a0][b]amix=inputs=2:duration=first[a]"
+                   -map "[v]" -map "[a]" -c:a aac -b:a 192k output.mp4
+        
+        With NVENC, frames are kept in GPU memory from decode to encode (see
+        _build_cuda_filter_graph) when a one-time probe shows the CUDA graph
+        works; the CPU graph is used otherwise and as the fallback.
         """
         try:
             # Build filter_complex string manually
             n = len(videos)
             
-            # Build input stream labels: [0:v][0:a][1:v][1:a]...
-            stream_spec = "".join([f"[{i}:v][{i}:a]" for i in range(n)])
-            filter_complex = f"{stream_spec}concat=n={n}:v=1:a=1[v][a]"
+            def graph(video_filters: str, video_labels: List[str]) -> str:
+                # Build input stream labels: [0:v][0:a][1:v][1:a]...
+                stream_spec = "".join([f"{label}[{i}:a]" for i, label in enumerate(video_labels)])
+                if bgm:
+                    return (
+                        f"{video_filters}{stream_spec}concat=n={n}:v=1:a=1[v][a0];"
+                        f"[{n}:a]volume={bgm_volume}[b];"
+                        f"[a0][b]amix=inputs=2:duration=first[a]"  # Use video's duration
+                    )
+                return f"{video_filters}{stream_spec}concat=n={n}:v=1:a=1[v][a]"
             
-            # Build ffmpeg command
-            cmd = ['ffmpeg']
-            for video in videos:
-                cmd.extend(['-i', video])
-            cmd.extend([
-                '-filter_complex', filter_complex,
-                '-map', '[v]',
-                '-map', '[a]',
-                '-y',  # Overwrite output
-                output
-            ])
+            def build(codec_args: List[str], filter_complex: str, input_args: Tuple[str, ...] = ()) -> List[str]:
+                args = _filter_thread_args()
+                for video in videos:
+                    args.extend([*input_args, '-i', video])
+                if bgm:
+                    args.extend(['-stream_loop', '-1' if loop else '0', '-i', bgm])
+                args.extend([
+                    '-filter_complex', filter_complex,
+                    '-map', '[v]',
+                    '-map', '[a]',
+                    *codec_args,
+                    '-threads', '0'
+                ])
+                if bgm:
+                    args.extend(['-c:a', 'aac', '-b:a', '192k'])
+                args.extend([
+                    *_output_args(output),
+                    '-y',  # Overwrite output
+                    output
+                ])
+                return args
             
-            # Run command
-            import subprocess
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            if self._select_video_encoder() == "h264_nvenc" and self._cuda_concat_available():
+                try:
+                    video_filters, video_labels = self._build_cuda_filter_graph(videos)
+                    self._run_ffmpeg(build(
+                        self._video_codec_args("h264_nvenc"),
+                        graph(video_filters, video_labels),
+                        input_args=('-hwaccel', 'cuda', '-hwaccel_output_format', 'cuda')
+                    ))
+                    logger.success(f"Videos concatenated successfully (CUDA): {output}")
+                    return output
+                except Exception as e:
+                    error_msg = e.stderr.decode(errors="replace") if getattr(e, 'stderr', None) else str(e)
+                    logger.warning(f"CUDA concat failed, using CPU filter graph: {error_msg[-500:]}")
+            
+            cpu_graph = graph("", [f"[{i}:v]" for i in range(n)])
+            self._run_encode_args(lambda codec_args: build(codec_args, cpu_graph))
             
             logger.success(f"Videos concatenated successfully: {output}")
             return output
-        except subprocess.CalledProcessError as e:
-            error_msg = e.stderr if e.stderr else str(e)
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode(errors="replace") if e.stderr else str(e)
             logger.error(f"FFmpeg concat filter error: {error_msg}")
             raise RuntimeError(f"Failed to concatenate videos: {error_msg}")
         except Exception as e:
             logger.error(f"Concatenation error: {e}")
             raise RuntimeError(f"Failed to concatenate videos: {e}")
     
+    def _build_cuda_filter_graph(self, videos: List[str]) -> Tuple[str, List[str]]:
+        """
+        GPU-side video part of the concat graph
+        
+        Inputs are decoded with -hwaccel cuda -hwaccel_output_format cuda, so
+        frames stay in GPU memory; scale_cuda brings every input to the first
+        video's size (concat needs matching sizes) and the concatenated CUDA
+        frames go straight into h264_nvenc, without a download/upload per frame.
+        
+        Returns:
+            (filter chains ending in ";", output labels to feed into concat)
+        """
+        first_video = next(
+            s for s in probe_media(videos[0]).get('streams', [])
+            if s.get('codec_type') == 'video'
+        )
+        width, height = first_video['width'], first_video['height']
+        
+        video_filters = "".join([
+            f"[{i}:v]scale_cuda={width}:{height}[g{i}];" for i in range(len(videos))
+        ])
+        return video_filters, [f"[g{i}]" for i in range(len(videos))]
+    
     def _get_video_duration(self, video: str) -> float:
         """Get video duration in seconds"""
         try:
-            probe = ffmpeg.probe(video)
+            probe = probe_media(video)
             duration = float(probe['format']['duration'])
             return duration
         except Exception as e:
@@ -275,7 +818,7 @@ class VideoService:
     def _get_audio_duration(self, audio: str) -> float:
         """Get audio duration in seconds"""
         try:
-            probe = ffmpeg.probe(audio)
+            probe = probe_media(audio)
             duration = float(probe['format']['duration'])
             return duration
         except Exception as e:
@@ -287,6 +830,17 @@ class VideoService:
             estimated_duration = file_size / 2000
             return max(1.0, estimated_duration)  # At least 1 second
     
+    def _probe_audio_codec(self, path: str) -> Optional[str]:
+        """Get codec name of the first audio stream (None if unknown)"""
+        try:
+            probe = probe_media(path)
+            for stream in probe.get('streams', []):
+                if stream.get('codec_type') == 'audio':
+                    return stream.get('codec_name')
+        except Exception as e:
+            logger.debug(f"Failed to probe audio codec of {path}: {e}")
+        return None
+    
     def has_audio_stream(self, video: str) -> bool:
         """
         Check if video has audio stream
@@ -298,7 +852,7 @@ class VideoService:
             True if video has audio stream, False otherwise
         """
         try:
-            probe = ffmpeg.probe(video)
+            probe = probe_media(video)
             audio_streams = [s for s in probe.get('streams', []) if s['codec_type'] == 'audio']
             has_audio = len(audio_streams) > 0
             logger.debug(f"Video {video} has_audio={has_audio}")
@@ -368,46 +922,38 @@ class VideoService:
         # Check if video has audio stream
         video_has_audio = self.has_audio_stream(video)
         
+        # Mixing in a muted original track contributes nothing: replace instead
+        # of running a two-input amix over a silent stream
+        if not replace_audio and video_volume == 0.0:
+            logger.debug("Original audio volume is 0, replacing audio instead of mixing")
+            replace_audio = True
+        
         # Prepare video stream (potentially with padding)
         input_video = ffmpeg.input(video)
         video_stream = input_video.video
         
         # Pad video if audio is longer
+        tpad_args = None
         if audio_duration > video_duration:
             pad_duration = audio_duration - video_duration
             logger.info(f"Audio is longer, padding video by {pad_duration:.2f}s using '{pad_strategy}' strategy")
             
             if pad_strategy == "freeze":
                 # Freeze last frame: tpad filter
-                video_stream = video_stream.filter('tpad', stop_mode='clone', stop_duration=pad_duration)
+                tpad_args = {'stop_mode': 'clone', 'stop_duration': pad_duration}
             else:  # black
-                # Generate black frames for padding duration
-                from pixelle_video.utils.os_util import get_temp_path
-                import os
-                
-                # Get video properties
-                probe = ffmpeg.probe(video)
-                video_info = next(s for s in probe['streams'] if s['codec_type'] == 'video')
-                width = int(video_info['width'])
-                height = int(video_info['height'])
-                fps_str = video_info['r_frame_rate']
-                fps_num, fps_den = map(int, fps_str.split('/'))
-                fps = fps_num / fps_den if fps_den != 0 else 30
-                
-                # Create black video for padding
-                black_video_path = get_temp_path(f"black_pad_{os.path.basename(output)}")
-                black_input = ffmpeg.input(
-                    f'color=c=black:s={width}x{height}:r={fps}',
-                    f='lavfi',
-                    t=pad_duration
-                )
-                
-                # Concatenate original video with black padding
-                video_stream = ffmpeg.concat(video_stream, black_input.video, v=1, a=0)
+                # Append black frames in place (tpad add mode) instead of
+                # probing the video, generating a separate black color source
+                # of the same size and concatenating it
+                tpad_args = {'stop_mode': 'add', 'stop_duration': pad_duration, 'color': 'black'}
+            video_stream = video_stream.filter('tpad', **tpad_args)
         
         # Prepare audio stream (pad if needed to match target duration)
         input_audio = ffmpeg.input(audio)
-        audio_stream = input_audio.audio.filter('volume', audio_volume)
+        audio_stream = input_audio.audio
+        if audio_volume != 1.0:
+            # Unit volume is an identity filter: leave it out of the graph
+            audio_stream = audio_stream.filter('volume', audio_volume)
         
         # Pad audio with silence if video is longer
         if video_duration > audio_duration:
@@ -416,23 +962,53 @@ class VideoService:
             # Use apad to add silence at the end
             audio_stream = audio_stream.filter('apad', whole_dur=target_duration)
         
+        # The new audio is stream-copied when it is used unchanged (no volume
+        # change, no padding) and is already AAC. The command has no audio
+        # filters, so it is built directly instead of through ffmpeg-python.
+        if (
+            (replace_audio or not video_has_audio)
+            and audio_volume == 1.0
+            and video_duration <= audio_duration
+            and self._probe_audio_codec(audio) == 'aac'
+        ):
+            logger.debug("Audio is already AAC, copying audio stream without re-encoding")
+            video_filter = []
+            if tpad_args:
+                video_filter = ['-vf', 'tpad=' + ':'.join(f'{k}={v}' for k, v in tpad_args.items())]
+            try:
+                self._run_encode_args(lambda codec_args: [
+                    '-i', video,
+                    '-i', audio,
+                    '-map', '0:v',
+                    '-map', '1:a',
+                    *video_filter,
+                    *codec_args,
+                    '-c:a', 'copy',
+                    *_output_args(output),
+                    '-y', output
+                ])
+                logger.success(f"Audio merged successfully: {output}")
+                return output
+            except ffmpeg.Error as e:
+                error_msg = e.stderr.decode() if e.stderr else str(e)
+                logger.error(f"FFmpeg merge error: {error_msg}")
+                raise RuntimeError(f"Failed to merge audio and video: {error_msg}")
+        
+        audio_codec = {'acodec': 'aac', 'audio_bitrate': '192k'}
+        
         if not video_has_audio:
             logger.info(f"Video has no audio stream, adding audio track")
             # Video is silent, just add the audio
             try:
-                (
-                    ffmpeg
-                    .output(
-                        video_stream,
-                        audio_stream,
-                        output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
-                )
+                # Re-encode video if padded
+                self._run_encode(lambda codec: ffmpeg.output(
+                    video_stream,
+                    audio_stream,
+                    output,
+                    **audio_codec,
+                    **codec,
+                    **_output_kwargs(output)
+                ))
                 
                 logger.success(f"Audio added to silent video: {output}")
                 return output
@@ -446,20 +1022,15 @@ class VideoService:
         
         try:
             if replace_audio:
-                # Replace audio: use only new audio, ignore original
-                (
-                    ffmpeg
-                    .output(
-                        video_stream,
-                        audio_stream,
-                        output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
-                )
+                # Replace audio: use only new audio, ignore original (re-encode video if padded)
+                self._run_encode(lambda codec: ffmpeg.output(
+                    video_stream,
+                    audio_stream,
+                    output,
+                    **audio_codec,
+                    **codec,
+                    **_output_kwargs(output)
+                ))
             else:
                 # Mix audio: combine original and new audio
                 mixed_audio = ffmpeg.filter(
@@ -472,19 +1043,17 @@ class VideoService:
                     duration='longest'  # Use longest audio
                 )
                 
-                (
-                    ffmpeg
-                    .output(
-                        video_stream,
-                        mixed_audio,
-                        output,
-                        vcodec='libx264',  # Re-encode video if padded
-                        acodec='aac',
-                        audio_bitrate='192k'
-                    )
-                    .overwrite_output()
-                    .run(capture_stdout=True, capture_stderr=True)
-                )
+                # Re-encode video if padded
+                self._run_encode(lambda codec: ffmpeg.output(
+                    video_stream,
+                    mixed_audio,
+                    output,
+                    acodec='aac',
+                    audio_bitrate='192k',
+                    threads=0,
+                    **codec,
+                    **_output_kwargs(output)
+                ).global_args(*_filter_thread_args()))
             
             logger.success(f"Audio merged successfully: {output}")
             return output
@@ -527,57 +1096,218 @@ class VideoService:
         logger.info(f"Overlaying image on video (scale_mode={scale_mode})")
         
         try:
-            # Get overlay image dimensions
-            overlay_probe = ffmpeg.probe(overlay_image)
-            overlay_stream = next(s for s in overlay_probe['streams'] if s['codec_type'] == 'video')
-            overlay_width = int(overlay_stream['width'])
-            overlay_height = int(overlay_stream['height'])
-            
-            logger.debug(f"Overlay dimensions: {overlay_width}x{overlay_height}")
+            output_stream = self._build_overlay_stream(video, overlay_image, scale_mode)
             
-            input_video = ffmpeg.input(video)
-            input_overlay = ffmpeg.input(overlay_image)
+            self._run_encode(lambda codec: ffmpeg.output(
+                output_stream,
+                output,
+                pix_fmt='yuv420p',
+                **codec,
+                **_output_kwargs(output)
+            ))
             
-            # Scale video to fit overlay size using scale_mode
-            if scale_mode == "contain":
-                # Scale to fit (letterbox/pillarbox if aspect ratio differs)
-                # Use scale filter with force_original_aspect_ratio=decrease and pad to center
-                scaled_video = (
-                    input_video
-                    .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='decrease')
-                    .filter('pad', overlay_width, overlay_height, '(ow-iw)/2', '(oh-ih)/2', color='black')
-                )
-            elif scale_mode == "cover":
-                # Scale to cover (crop if aspect ratio differs)
-                scaled_video = (
-                    input_video
-                    .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='increase')
-                    .filter('crop', overlay_width, overlay_height)
+            logger.success(f"Image overlaid on video: {output}")
+            return output
+        except ffmpeg.Error as e:
+            error_msg = e.stderr.decode() if e.stderr else str(e)
+            logger.error(f"FFmpeg overlay error: {error_msg}")
+            raise RuntimeError(f"Failed to overlay image on video: {error_msg}")
+    
+    def _build_overlay_stream(self, video: str, overlay_image: str, scale_mode: str):
+        """Video stream of `video` scaled to the overlay size with the overlay on top"""
+        # Get overlay image dimensions (PIL reads only the image header,
+        # no pixel decode and no ffprobe process)
+        from PIL import Image
+        with Image.open(overlay_image) as img:
+            overlay_width, overlay_height = img.size
+        
+        logger.debug(f"Overlay dimensions: {overlay_width}x{overlay_height}")
+        
+        input_video = ffmpeg.input(video)
+        input_overlay = ffmpeg.input(overlay_image)
+        
+        # Scale video to fit overlay size using scale_mode
+        if scale_mode == "contain":
+            # Scale to fit (letterbox/pillarbox if aspect ratio differs)
+            # Use scale filter with force_original_aspect_ratio=decrease and pad to center
+            scaled_video = (
+                input_video
+                .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='decrease')
+                .filter('pad', overlay_width, overlay_height, '(ow-iw)/2', '(oh-ih)/2', color='black')
+            )
+        elif scale_mode == "cover":
+            # Scale to cover (crop if aspect ratio differs)
+            scaled_video = (
+                input_video
+                .filter('scale', overlay_width, overlay_height, force_original_aspect_ratio='increase')
+                .filter('crop', overlay_width, overlay_height)
+            )
+        else:  # stretch
+            # Stretch to exact dimensions
+            scaled_video = input_video.filter('scale', overlay_width, overlay_height)
+        
+        # Overlay the transparent image on top of the scaled video
+        return ffmpeg.overlay(scaled_video, input_overlay)
+    
+    def _pipe_chain(self, stages: List[List[str]]):
+        """
+        Run FFmpeg commands connected stdout -> stdin
+        
+        Each stage except the last writes its output to pipe:1 and the next
+        stage reads it from pipe:0, so intermediates never touch the disk.
+        Anonymous pipes are used (no mkfifo), which also works on Windows.
+        
+        Args:
+            stages: Arguments after the "ffmpeg" executable, one list per stage
+        
+        Raises:
+            ffmpeg.Error: If any stage exits with a non-zero status (stderr of
+                all failed stages is attached)
+        """
+        import tempfile
+        
+        processes = []
+        stderr_files = []
+        try:
+            previous_stdout = None
+            for index, args in enumerate(stages):
+                is_last = index == len(stages) - 1
+                # stderr goes to a file: an unread PIPE could fill up and stall the chain
+                stderr_file = tempfile.TemporaryFile()
+                stderr_files.append(stderr_file)
+                process = subprocess.Popen(
+                    ['ffmpeg', '-hide_banner', *args],
+                    stdin=previous_stdout if previous_stdout is not None else subprocess.DEVNULL,
+                    stdout=subprocess.DEVNULL if is_last else subprocess.PIPE,
+                    stderr=stderr_file,
                 )
-            else:  # stretch
-                # Stretch to exact dimensions
-                scaled_video = input_video.filter('scale', overlay_width, overlay_height)
+                if previous_stdout is not None:
+                    # The next stage owns the read end now; closing ours lets
+                    # the writer see EPIPE if the reader exits early
+                    previous_stdout.close()
+                previous_stdout = process.stdout
+                processes.append(process)
             
-            # Overlay the transparent image on top of the scaled video
-            output_stream = ffmpeg.overlay(scaled_video, input_overlay)
+            for process in processes:
+                process.wait()
             
-            (
+            failed = []
+            for process, stderr_file in zip(processes, stderr_files):
+                if process.returncode != 0:
+                    stderr_file.seek(0)
+                    failed.append(stderr_file.read())
+            if failed:
+                raise ffmpeg.Error('ffmpeg', None, b"\n".join(failed))
+        finally:
+            for process in processes:
+                if process.poll() is None:
+                    process.kill()
+                    process.wait()
+            for stderr_file in stderr_files:
+                stderr_file.close()
+    
+    def overlay_image_and_merge_audio(
+        self,
+        video: str,
+        overlay_image: str,
+        audio: str,
+        output: str,
+        scale_mode: str = "contain",
+        pad_strategy: str = "freeze",
+    ) -> str:
+        """
+        Overlay a transparent image on a video and set its audio in one go
+        
+        Same result as overlay_image_on_video() followed by
+        merge_audio_video(replace_audio=True), but the overlaid video is piped
+        as raw frames into the audio merge instead of being encoded to an
+        intermediate file, written, re-read and decoded again.
+        
+        Args:
+            video: Base video file path
+            overlay_image: Transparent overlay image path
+            audio: Audio file path (replaces the video's own audio)
+            output: Output video file path
+            scale_mode: "contain", "cover" or "stretch" (see overlay_image_on_video)
+            pad_strategy: "freeze" or "black" when audio is longer than video
+                (see merge_audio_video)
+        
+        Returns:
+            Path to the output video file
+        
+        Raises:
+            RuntimeError: If FFmpeg execution fails
+        """
+        logger.info(f"Overlaying image and merging audio (scale_mode={scale_mode})")
+        
+        # The overlay keeps the base video's duration, so it can be probed up front
+        video_duration = self._get_video_duration(video)
+        audio_duration = self._get_audio_duration(audio)
+        
+        try:
+            # Stage 1: overlay, handed over as raw frames in NUT (streamable, no encode)
+            overlay_args = (
                 ffmpeg
-                .output(output_stream, output, 
-                        vcodec='libx264',
-                        pix_fmt='yuv420p',
-                        preset='medium',
-                        crf=23)
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
+                .output(
+                    self._build_overlay_stream(video, overlay_image, scale_mode),
+                    'pipe:',
+                    format='nut',
+                    vcodec='rawvideo',
+                    pix_fmt='yuv420p'
+                )
+                .compile()[1:]
             )
             
-            logger.success(f"Image overlaid on video: {output}")
+            # Stage 2: pad to the longer duration, add audio, encode
+            video_stream = ffmpeg.input('pipe:', format='nut').video
+            if audio_duration > video_duration:
+                pad_duration = audio_duration - video_duration
+                if pad_strategy == "freeze":
+                    video_stream = video_stream.filter('tpad', stop_mode='clone', stop_duration=pad_duration)
+                else:  # black
+                    video_stream = video_stream.filter('tpad', stop_mode='add', stop_duration=pad_duration, color='black')
+            
+            input_audio = ffmpeg.input(audio)
+            if video_duration > audio_duration:
+                audio_stream = input_audio.audio.filter('apad', whole_dur=video_duration)
+                audio_codec = {'acodec': 'aac', 'audio_bitrate': '192k'}
+            elif self._probe_audio_codec(audio) == 'aac':
+                audio_stream = input_audio.audio
+                audio_codec = {'acodec': 'copy'}
+            else:
+                audio_stream = input_audio.audio
+                audio_codec = {'acodec': 'aac', 'audio_bitrate': '192k'}
+            
+            encoder = self._select_video_encoder()
+            for attempt_encoder in dict.fromkeys([encoder, "libx264"]):
+                merge_args = (
+                    ffmpeg
+                    .output(
+                        video_stream,
+                        audio_stream,
+                        output,
+                        **audio_codec,
+                        **self._video_codec_kwargs(attempt_encoder),
+                        **_output_kwargs(output)
+                    )
+                    .overwrite_output()
+                    .compile()[1:]
+                )
+                try:
+                    self._pipe_chain([overlay_args, merge_args])
+                    break
+                except ffmpeg.Error as e:
+                    if attempt_encoder == "libx264":
+                        raise
+                    error_msg = e.stderr.decode(errors="replace") if e.stderr else str(e)
+                    logger.warning(f"{attempt_encoder} encode failed, retrying with libx264: {error_msg[-500:]}")
+            
+            logger.success(f"Image overlaid and audio merged: {output}")
             return output
         except ffmpeg.Error as e:
-            error_msg = e.stderr.decode() if e.stderr else str(e)
-            logger.error(f"FFmpeg overlay error: {error_msg}")
-            raise RuntimeError(f"Failed to overlay image on video: {error_msg}")
+            error_msg = e.stderr.decode(errors="replace") if e.stderr else str(e)
+            logger.error(f"FFmpeg overlay/merge error: {error_msg}")
+            raise RuntimeError(f"Failed to overlay image and merge audio: {error_msg}")
     
     def create_video_from_image(
         self,
@@ -585,6 +1315,7 @@ class VideoService:
         audio: str,
         output: str,
         fps: int = 30,
+        threads: Optional[int] = None,
     ) -> str:
         """
         Create video from static image and audio
@@ -594,6 +1325,7 @@ class VideoService:
             audio: Audio file path
             output: Output video path
             fps: Frames per second
+            threads: Encoder thread count (None = FFmpeg default, all cores)
         
         Returns:
             Path to the output video
@@ -617,35 +1349,22 @@ class VideoService:
         
         try:
             # Get audio duration to ensure exact video duration match
-            probe = ffmpeg.probe(audio)
+            probe = probe_media(audio)
             audio_duration = float(probe['format']['duration'])
             logger.debug(f"Audio duration: {audio_duration:.3f}s")
             
-            # Input image with loop (loop=1 means loop indefinitely)
-            # Use framerate to set input framerate
-            input_image = ffmpeg.input(image, loop=1, framerate=fps)
-            input_audio = ffmpeg.input(audio)
-            
-            # Combine image and audio
+            # Combine image and audio. Only the paths and duration vary per
+            # segment; the output options are built once per output shape
+            # (see _image_video_output_args).
             # Use -t to explicitly set video duration = audio duration
-            (
-                ffmpeg
-                .output(
-                    input_image,
-                    input_audio,
-                    output,
-                    t=audio_duration,  # Force video duration to match audio exactly
-                    vcodec='libx264',
-                    acodec='aac',
-                    pix_fmt='yuv420p',
-                    audio_bitrate='192k',
-                    preset='medium',
-                    crf=23,
-                    **{'b:v': '2M'}  # Video bitrate
-                )
-                .overwrite_output()
-                .run(capture_stdout=True, capture_stderr=True)
-            )
+            self._run_encode_args(lambda codec_args: [
+                '-loop', '1', '-framerate', str(fps), '-i', image,  # Loop image at the target framerate
+                '-i', audio,
+                '-map', '0:v', '-map', '1:a',
+                '-t', str(audio_duration),  # Force video duration to match audio exactly
+                *_image_video_output_args(tuple(codec_args), threads, output.lower().endswith(_MP4_EXTENSIONS)),
+                '-y', output
+            ])
             
             logger.success(f"Video created from image: {output} (duration: {audio_duration:.3f}s)")
             return output
@@ -674,7 +1393,7 @@ class VideoService:
             bgm_volume: BGM volume relative to original (0.0 to 1.0+)
             loop: If True, loop BGM to match video duration
             fade_in: BGM fade-in duration in seconds
-            fade_out: BGM fade-out duration in seconds (not yet implemented)
+            fade_out: BGM fade-out duration in seconds (ends with the video)
         
         Returns:
             Path to the output video file
@@ -704,12 +1423,13 @@ class VideoService:
             # Apply fade effects if specified
             if fade_in > 0:
                 bgm_audio = bgm_audio.filter('afade', type='in', duration=fade_in)
-            # Note: fade_out at the end requires knowing the duration, which is complex
-            # For now, we skip fade_out in this implementation
-            # A more advanced implementation would need to:
-            # 1. Get video duration
-            # 2. Calculate fade_out start time
-            # 3. Apply fade filter with specific start_time
+            if fade_out > 0:
+                # The mix ends with the video, so the fade-out starts fade_out
+                # seconds before the video's end (container-level probe, no decode)
+                video_duration = self._get_video_duration(video)
+                if video_duration > 0:
+                    fade_start = max(0.0, video_duration - fade_out)
+                    bgm_audio = bgm_audio.filter('afade', type='out', start_time=fade_start, duration=fade_out)
             
             # Mix original audio with BGM
             mixed_audio = ffmpeg.filter(
@@ -727,7 +1447,8 @@ class VideoService:
                     output,
                     vcodec='copy',
                     acodec='aac',
-                    audio_bitrate='192k'
+                    audio_bitrate='192k',
+                    **_output_kwargs(output)
                 )
                 .overwrite_output()
                 .run(capture_stdout=True, capture_stderr=True)
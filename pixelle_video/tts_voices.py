@@ -110,6 +110,9 @@ EDGE_TTS_VOICES: List[Dict[str, Any]] = [
     },
 ]
 
+# Voice lookup by ID (built once at import)
+_VOICES_BY_ID: Dict[str, Dict[str, Any]] = {v["id"]: v for v in EDGE_TTS_VOICES}
+
 
 def get_voice_display_name(voice_id: str, tr_func=None, locale: str = "zh_CN") -> str:
     """
@@ -124,7 +127,7 @@ def get_voice_display_name(voice_id: str, tr_func=None, locale: str = "zh_CN") -
         Display name (translated label if in Chinese, otherwise voice ID)
     """
     # Find voice config
-    voice_config = next((v for v in EDGE_TTS_VOICES if v["id"] == voice_id), None)
+    voice_config = _VOICES_BY_ID.get(voice_id)
     
     if not voice_config:
         return voice_id
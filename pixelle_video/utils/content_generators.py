@@ -17,12 +17,24 @@ Pure/stateless functions for generating content using LLM.
 These functions are reusable across different pipelines.
 """
 
+import asyncio
 import json
 import re
-from typing import List, Optional, Literal
+import sys
+from typing import Dict, List, Optional, Literal, Tuple
 
 from loguru import logger
 
+from pixelle_video.utils.json_util import loads as json_loads
+from pixelle_video.utils.text_util import truncate_graphemes
+
+
+# Markdown code fence around a JSON payload
+_JSON_FENCE_RE = re.compile(r'```(?:json)?\s*([\s\S]+?)\s*```')
+
+# Characters that matter when scanning for balanced {...} objects
+_JSON_SCAN_RE = re.compile(r'[{}"\\]')
+
 
 async def generate_title(
     llm_service,
@@ -46,8 +58,7 @@ async def generate_title(
         Generated title
     """
     if strategy == "direct":
-        content = content.strip()
-        return content[:max_length] if len(content) > max_length else content
+        return truncate_graphemes(content.strip(), max_length)
     
     if strategy == "auto":
         if len(content.strip()) <= 15:
@@ -57,26 +68,34 @@ async def generate_title(
     # Use LLM to generate title
     from pixelle_video.prompts import build_title_generation_prompt
     
+    # The prompt only sees the first 500 chars; reruns on the same content
+    # reuse the cached title instead of another LLM round-trip
     prompt = build_title_generation_prompt(content, max_length=500)
-    response = await llm_service(prompt, temperature=0.7, max_tokens=50)
-    
-    # Clean up response
-    title = response.strip()
-    
-    # Remove quotes if present
-    if title.startswith('"') and title.endswith('"'):
-        title = title[1:-1]
-    if title.startswith("'") and title.endswith("'"):
-        title = title[1:-1]
+    response = await llm_service(prompt, temperature=0.7, max_tokens=50, force_cache=True)
     
-    # Limit to max_length (safety)
-    if len(title) > max_length:
-        title = title[:max_length]
+    title = _clean_title(response, max_length)
     
     logger.debug(f"Generated title: '{title}' (length: {len(title)})")
     return title
 
 
+# Opening -> closing quote LLMs wrap titles in (ASCII and Chinese curly quotes).
+# Book title marks 《》 are kept: they are part of the title itself.
+_TITLE_QUOTES = {'"': '"', "'": "'", "“": "”", "‘": "’"}
+
+
+def _clean_title(title: str, max_length: int) -> str:
+    """Strip whitespace/surrounding quotes from an LLM title and limit its length"""
+    title = title.strip()
+    
+    # Remove quotes only when they form a matching surrounding pair
+    if len(title) >= 2 and _TITLE_QUOTES.get(title[0]) == title[-1]:
+        title = title[1:-1].strip()
+    
+    # Never cut inside a grapheme (emoji sequence, combining mark)
+    return truncate_graphemes(title, max_length)
+
+
 async def generate_narrations_from_topic(
     llm_service,
     topic: str,
@@ -111,28 +130,76 @@ async def generate_narrations_from_topic(
     response = await llm_service(
         prompt=prompt,
         temperature=0.8,
-        max_tokens=2000
+        max_tokens=2000,
+        json_mode=True
     )
     
     logger.debug(f"LLM response: {response[:200]}...")
     
     # Parse JSON
     result = _parse_json(response)
+    narrations = _extract_narrations(result, n_scenes)
     
-    if "narrations" not in result:
-        raise ValueError("Invalid response format: missing 'narrations' key")
+    logger.info(f"Generated {len(narrations)} narrations successfully")
+    return narrations
+
+
+async def generate_title_and_narrations_from_topic(
+    llm_service,
+    topic: str,
+    n_scenes: int = 5,
+    min_words: int = 5,
+    max_words: int = 20,
+    max_title_length: int = 15
+) -> Tuple[str, List[str]]:
+    """
+    Generate video title and narrations from topic in a single LLM call
     
-    narrations = result["narrations"]
+    Equivalent to generate_title(strategy="llm") + generate_narrations_from_topic(),
+    but saves one LLM round-trip. Falls back to a separate title call if the
+    response has no usable title.
     
-    # Validate count
-    if len(narrations) > n_scenes:
-        logger.warning(f"Got {len(narrations)} narrations, taking first {n_scenes}")
-        narrations = narrations[:n_scenes]
-    elif len(narrations) < n_scenes:
-        raise ValueError(f"Expected {n_scenes} narrations, got only {len(narrations)}")
+    Args:
+        llm_service: LLM service instance
+        topic: Topic/theme to generate narrations from
+        n_scenes: Number of narrations to generate
+        min_words: Minimum narration length
+        max_words: Maximum narration length
+        max_title_length: Maximum title length (default: 15)
     
-    logger.info(f"Generated {len(narrations)} narrations successfully")
-    return narrations
+    Returns:
+        (title, narrations)
+    """
+    from pixelle_video.prompts import build_topic_narration_with_title_prompt
+    
+    logger.info(f"Generating title and {n_scenes} narrations from topic: {topic}")
+    
+    prompt = build_topic_narration_with_title_prompt(
+        topic=topic,
+        n_storyboard=n_scenes,
+        min_words=min_words,
+        max_words=max_words
+    )
+    
+    response = await llm_service(
+        prompt=prompt,
+        temperature=0.8,
+        max_tokens=2000,
+        json_mode=True
+    )
+    
+    # Parse JSON
+    result = _parse_json(response)
+    narrations = _extract_narrations(result, n_scenes)
+    
+    raw_title = result.get("title")
+    title = _clean_title(raw_title, max_title_length) if isinstance(raw_title, str) else ""
+    if not title:
+        logger.warning("LLM response has no title, generating it separately")
+        title = await generate_title(llm_service, topic, strategy="llm", max_length=max_title_length)
+    
+    logger.info(f"Generated title '{title}' and {len(narrations)} narrations successfully")
+    return title, narrations
 
 
 async def generate_narrations_from_content(
@@ -169,23 +236,13 @@ async def generate_narrations_from_content(
     response = await llm_service(
         prompt=prompt,
         temperature=0.8,
-        max_tokens=2000
+        max_tokens=2000,
+        json_mode=True
     )
     
     # Parse JSON
     result = _parse_json(response)
-    
-    if "narrations" not in result:
-        raise ValueError("Invalid response format: missing 'narrations' key")
-    
-    narrations = result["narrations"]
-    
-    # Validate count
-    if len(narrations) > n_scenes:
-        logger.warning(f"Got {len(narrations)} narrations, taking first {n_scenes}")
-        narrations = narrations[:n_scenes]
-    elif len(narrations) < n_scenes:
-        raise ValueError(f"Expected {n_scenes} narrations, got only {len(narrations)}")
+    narrations = _extract_narrations(result, n_scenes)
     
     logger.info(f"Generated {len(narrations)} narrations successfully")
     return narrations
@@ -225,11 +282,15 @@ async def generate_image_prompts(
     max_words: int = 60,
     batch_size: int = 10,
     max_retries: int = 3,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_concurrency: int = 3
 ) -> List[str]:
     """
     Generate image prompts from narrations (with batching and retry)
     
+    Batches are independent, so they are sent to the LLM concurrently
+    (bounded by max_concurrency) and reassembled in order.
+    
     Args:
         llm_service: LLM service instance
         narrations: List of narrations
@@ -238,6 +299,7 @@ async def generate_image_prompts(
         batch_size: Max narrations per batch (default: 10)
         max_retries: Max retry attempts per batch (default: 3)
         progress_callback: Optional callback(completed, total, message) for progress updates
+        max_concurrency: Max batches in flight at once (default: 3)
     
     Returns:
         List of image prompts (base prompts, without prefix applied)
@@ -246,76 +308,94 @@ async def generate_image_prompts(
     
     logger.info(f"Generating image prompts for {len(narrations)} narrations (batch_size={batch_size})")
     
-    # Split narrations into batches
-    batches = [narrations[i:i + batch_size] for i in range(0, len(narrations), batch_size)]
+    # Identical narrations get identical prompts - only send unique ones to the LLM
+    unique_narrations, inverse = _dedupe_narrations(narrations)
+    if len(unique_narrations) < len(narrations):
+        logger.info(f"Deduplicated narrations: {len(narrations)} -> {len(unique_narrations)} unique")
+    narrations = unique_narrations
+    
+    # Split narrations into batches (several narrations per LLM request)
+    batches = _split_batches(narrations, batch_size)
     logger.info(f"Split into {len(batches)} batches")
     
-    all_prompts = []
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    completed = 0
     
-    # Process each batch
-    for batch_idx, batch_narrations in enumerate(batches, 1):
-        logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
+    async def process_batch(batch_idx: int, batch_narrations: List[str]) -> List[str]:
+        nonlocal completed
         
-        # Retry logic for this batch
-        for attempt in range(1, max_retries + 1):
-            try:
-                # Generate prompts for this batch
-                prompt = build_image_prompt_prompt(
-                    narrations=batch_narrations,
-                    min_words=min_words,
-                    max_words=max_words
-                )
-                
-                response = await llm_service(
-                    prompt=prompt,
-                    temperature=0.7,
-                    max_tokens=8192
-                )
-                
-                logger.debug(f"Batch {batch_idx} attempt {attempt}: LLM response length: {len(response)} chars")
-                
-                # Parse JSON
-                result = _parse_json(response)
-                
-                if "image_prompts" not in result:
-                    raise KeyError("Invalid response format: missing 'image_prompts'")
-                
-                batch_prompts = result["image_prompts"]
-                
-                # Validate count
-                if len(batch_prompts) != len(batch_narrations):
-                    error_msg = (
-                        f"Batch {batch_idx} prompt count mismatch (attempt {attempt}/{max_retries}):\n"
-                        f"  Expected: {len(batch_narrations)} prompts\n"
-                        f"  Got: {len(batch_prompts)} prompts"
+        async with semaphore:
+            logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
+            
+            # The prompt is the same for every attempt; build it once
+            prompt = build_image_prompt_prompt(
+                narrations=batch_narrations,
+                min_words=min_words,
+                max_words=max_words
+            )
+            
+            # Retry logic for this batch
+            for attempt in range(1, max_retries + 1):
+                try:
+                    response = await llm_service(
+                        prompt=prompt,
+                        temperature=0.7,
+                        max_tokens=8192,
+                        json_mode=True
                     )
-                    logger.warning(error_msg)
                     
-                    if attempt < max_retries:
-                        logger.info(f"Retrying batch {batch_idx}...")
-                        continue
-                    else:
-                        raise ValueError(error_msg)
-                
-                # Success!
-                logger.info(f"✅ Batch {batch_idx} completed successfully ({len(batch_prompts)} prompts)")
-                all_prompts.extend(batch_prompts)
-                
-                # Report progress
-                if progress_callback:
-                    progress_callback(
-                        len(all_prompts),
-                        len(narrations),
-                        f"Batch {batch_idx}/{len(batches)} completed"
-                    )
-                
-                break
-                
-            except json.JSONDecodeError as e:
-                logger.error(f"Batch {batch_idx} JSON parse error (attempt {attempt}/{max_retries}): {e}")
-                if attempt >= max_retries:
-                    raise
-                logger.info(f"Retrying batch {batch_idx}...")
+                    logger.debug(f"Batch {batch_idx} attempt {attempt}: LLM response length: {len(response)} chars")
+                    
+                    # Parse JSON
+                    result = _parse_json(response)
+                    
+                    if "image_prompts" not in result:
+                        raise KeyError("Invalid response format: missing 'image_prompts'")
+                    
+                    batch_prompts = result["image_prompts"]
+                    
+                    # Validate count
+                    if len(batch_prompts) != len(batch_narrations):
+                        error_msg = (
+                            f"Batch {batch_idx} prompt count mismatch (attempt {attempt}/{max_retries}):\n"
+                            f"  Expected: {len(batch_narrations)} prompts\n"
+                            f"  Got: {len(batch_prompts)} prompts"
+                        )
+                        logger.warning(error_msg)
+                        
+                        if attempt < max_retries:
+                            logger.info(f"Retrying batch {batch_idx}...")
+                            continue
+                        else:
+                            raise ValueError(error_msg)
+                    
+                    # Success!
+                    logger.info(f"✅ Batch {batch_idx} completed successfully ({len(batch_prompts)} prompts)")
+                    completed += len(batch_prompts)
+                    
+                    # Report progress
+                    if progress_callback:
+                        progress_callback(
+                            completed,
+                            len(narrations),
+                            f"Batch {batch_idx}/{len(batches)} completed"
+                        )
+                    
+                    return batch_prompts
+                    
+                except json.JSONDecodeError as e:
+                    logger.error(f"Batch {batch_idx} JSON parse error (attempt {attempt}/{max_retries}): {e}")
+                    if attempt >= max_retries:
+                        raise
+                    logger.info(f"Retrying batch {batch_idx}...")
+    
+    batch_results = await asyncio.gather(
+        *(process_batch(idx, batch) for idx, batch in enumerate(batches, 1))
+    )
+    unique_prompts = [p for batch_prompts in batch_results for p in batch_prompts]
+    
+    # Expand back to one prompt per original narration
+    all_prompts = [unique_prompts[i] for i in inverse]
     
     logger.info(f"✅ Generated {len(all_prompts)} image prompts")
     return all_prompts
@@ -328,11 +408,15 @@ async def generate_video_prompts(
     max_words: int = 60,
     batch_size: int = 10,
     max_retries: int = 3,
-    progress_callback: Optional[callable] = None
+    progress_callback: Optional[callable] = None,
+    max_concurrency: int = 3
 ) -> List[str]:
     """
     Generate video prompts from narrations (with batching and retry)
     
+    Batches are independent, so they are sent to the LLM concurrently
+    (bounded by max_concurrency) and reassembled in order.
+    
     Args:
         llm_service: LLM service instance
         narrations: List of narrations
@@ -341,6 +425,7 @@ async def generate_video_prompts(
         batch_size: Max narrations per batch (default: 10)
         max_retries: Max retry attempts per batch (default: 3)
         progress_callback: Optional callback(completed, total, message) for progress updates
+        max_concurrency: Max batches in flight at once (default: 3)
     
     Returns:
         List of video prompts (base prompts, without prefix applied)
@@ -349,70 +434,171 @@ async def generate_video_prompts(
     
     logger.info(f"Generating video prompts for {len(narrations)} narrations (batch_size={batch_size})")
     
-    # Split narrations into batches
-    batches = [narrations[i:i + batch_size] for i in range(0, len(narrations), batch_size)]
+    # Identical narrations get identical prompts - only send unique ones to the LLM
+    unique_narrations, inverse = _dedupe_narrations(narrations)
+    if len(unique_narrations) < len(narrations):
+        logger.info(f"Deduplicated narrations: {len(narrations)} -> {len(unique_narrations)} unique")
+    narrations = unique_narrations
+    
+    # Split narrations into batches (several narrations per LLM request)
+    batches = _split_batches(narrations, batch_size)
     logger.info(f"Split into {len(batches)} batches")
     
-    all_prompts = []
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+    completed = 0
     
-    # Process each batch
-    for batch_idx, batch_narrations in enumerate(batches, 1):
-        logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
+    async def process_batch(batch_idx: int, batch_narrations: List[str]) -> List[str]:
+        nonlocal completed
         
-        # Retry logic for this batch
-        for attempt in range(1, max_retries + 1):
-            try:
-                # Generate prompts for this batch
-                prompt = build_video_prompt_prompt(
-                    narrations=batch_narrations,
-                    min_words=min_words,
-                    max_words=max_words
-                )
-                
-                response = await llm_service(
-                    prompt=prompt,
-                    temperature=0.7,
-                    max_tokens=8192
-                )
-                
-                logger.debug(f"Batch {batch_idx} attempt {attempt}: LLM response length: {len(response)} chars")
-                
-                # Parse JSON
-                result = _parse_json(response)
-                
-                if "video_prompts" not in result:
-                    raise KeyError("Invalid response format: missing 'video_prompts'")
-                
-                batch_prompts = result["video_prompts"]
-                
-                # Validate batch result
-                if len(batch_prompts) != len(batch_narrations):
-                    raise ValueError(
-                        f"Prompt count mismatch: expected {len(batch_narrations)}, got {len(batch_prompts)}"
+        async with semaphore:
+            logger.info(f"Processing batch {batch_idx}/{len(batches)} ({len(batch_narrations)} narrations)")
+            
+            # The prompt is the same for every attempt; build it once
+            prompt = build_video_prompt_prompt(
+                narrations=batch_narrations,
+                min_words=min_words,
+                max_words=max_words
+            )
+            
+            # Retry logic for this batch
+            for attempt in range(1, max_retries + 1):
+                try:
+                    response = await llm_service(
+                        prompt=prompt,
+                        temperature=0.7,
+                        max_tokens=8192,
+                        json_mode=True
                     )
+                    
+                    logger.debug(f"Batch {batch_idx} attempt {attempt}: LLM response length: {len(response)} chars")
+                    
+                    # Parse JSON
+                    result = _parse_json(response)
+                    
+                    if "video_prompts" not in result:
+                        raise KeyError("Invalid response format: missing 'video_prompts'")
+                    
+                    batch_prompts = result["video_prompts"]
+                    
+                    # Validate batch result
+                    if len(batch_prompts) != len(batch_narrations):
+                        raise ValueError(
+                            f"Prompt count mismatch: expected {len(batch_narrations)}, got {len(batch_prompts)}"
+                        )
+                    
+                    # Success
+                    completed += len(batch_prompts)
+                    logger.info(f"✓ Batch {batch_idx} completed: {len(batch_prompts)} video prompts")
+                    
+                    # Report progress
+                    if progress_callback:
+                        progress_callback(completed, len(narrations), f"Batch {batch_idx}/{len(batches)} completed")
+                    
+                    return batch_prompts
                 
-                # Success - add to all_prompts
-                all_prompts.extend(batch_prompts)
-                logger.info(f"✓ Batch {batch_idx} completed: {len(batch_prompts)} video prompts")
-                
-                # Report progress
-                if progress_callback:
-                    completed = len(all_prompts)
-                    total = len(narrations)
-                    progress_callback(completed, total, f"Batch {batch_idx}/{len(batches)} completed")
-                
-                break  # Success, move to next batch
-            
-            except Exception as e:
-                logger.warning(f"✗ Batch {batch_idx} attempt {attempt} failed: {e}")
-                if attempt >= max_retries:
-                    raise
-                logger.info(f"Retrying batch {batch_idx}...")
+                except Exception as e:
+                    logger.warning(f"✗ Batch {batch_idx} attempt {attempt} failed: {e}")
+                    if attempt >= max_retries:
+                        raise
+                    logger.info(f"Retrying batch {batch_idx}...")
+    
+    batch_results = await asyncio.gather(
+        *(process_batch(idx, batch) for idx, batch in enumerate(batches, 1))
+    )
+    unique_prompts = [p for batch_prompts in batch_results for p in batch_prompts]
+    
+    # Expand back to one prompt per original narration
+    all_prompts = [unique_prompts[i] for i in inverse]
     
     logger.info(f"✅ Generated {len(all_prompts)} video prompts")
     return all_prompts
 
 
+def _extract_narrations(result: dict, n_scenes: int) -> List[str]:
+    """
+    Get narrations from a parsed LLM response and validate their count
+    
+    Args:
+        result: Parsed JSON response
+        n_scenes: Expected number of narrations
+    
+    Returns:
+        Exactly n_scenes narrations
+    
+    Raises:
+        ValueError: If the key is missing or there are too few narrations
+    """
+    if "narrations" not in result:
+        raise ValueError("Invalid response format: missing 'narrations' key")
+    
+    narrations = result["narrations"]
+    
+    # Validate count
+    if len(narrations) > n_scenes:
+        logger.warning(f"Got {len(narrations)} narrations, taking first {n_scenes}")
+        narrations = narrations[:n_scenes]
+    elif len(narrations) < n_scenes:
+        raise ValueError(f"Expected {n_scenes} narrations, got only {len(narrations)}")
+    
+    return narrations
+
+
+def _split_batches(items: List[str], batch_size: int) -> List[List[str]]:
+    """
+    Split items into the fewest batches of at most batch_size, evenly sized
+    
+    Batches run concurrently, so the largest batch bounds the latency:
+    11 items with batch_size=10 become [6, 5] rather than [10, 1].
+    
+    Args:
+        items: Items to split
+        batch_size: Maximum items per batch
+    
+    Returns:
+        List of batches, in order
+    """
+    if not items:
+        return []
+    n_batches = -(-len(items) // max(1, batch_size))
+    base, extra = divmod(len(items), n_batches)
+    batches = []
+    start = 0
+    for i in range(n_batches):
+        end = start + base + (1 if i < extra else 0)
+        batches.append(items[start:end])
+        start = end
+    return batches
+
+
+def _dedupe_narrations(narrations: List[str]) -> Tuple[List[str], List[int]]:
+    """
+    Deduplicate narrations while preserving first-seen order
+    
+    Unique narrations are interned, so repeated lines (within a call and
+    across retries/regenerations) share one string object and compare by
+    identity first.
+    
+    Args:
+        narrations: List of narrations (may contain duplicates)
+    
+    Returns:
+        (unique_narrations, inverse) where narrations[i] == unique_narrations[inverse[i]]
+    """
+    unique: List[str] = []
+    inverse: List[int] = []
+    seen: Dict[str, int] = {}
+    for narration in narrations:
+        idx = seen.get(narration)
+        if idx is None:
+            if isinstance(narration, str):
+                narration = sys.intern(narration)
+            idx = len(unique)
+            seen[narration] = idx
+            unique.append(narration)
+        inverse.append(idx)
+    return unique, inverse
+
+
 def _parse_json(text: str) -> dict:
     """
     Parse JSON from text, with fallback to extract JSON from markdown code blocks
@@ -428,28 +614,78 @@ def _parse_json(text: str) -> dict:
     """
     # Try direct parsing first
     try:
-        return json.loads(text)
+        return json_loads(text)
     except json.JSONDecodeError:
         pass
     
     # Try to extract JSON from markdown code block
-    json_pattern = r'```(?:json)?\s*([\s\S]+?)\s*```'
-    match = re.search(json_pattern, text, re.DOTALL)
+    match = _JSON_FENCE_RE.search(text)
     if match:
         try:
-            return json.loads(match.group(1))
+            return json_loads(match.group(1))
         except json.JSONDecodeError:
             pass
     
-    # Try to find any JSON object in the text
-    json_pattern = r'\{[^{}]*(?:"narrations"|"image_prompts")\s*:\s*\[[^\]]*\][^{}]*\}'
-    match = re.search(json_pattern, text, re.DOTALL)
-    if match:
+    # Try the outermost {...} span (JSON wrapped in prose)
+    start = text.find('{')
+    end = text.rfind('}')
+    if 0 <= start < end:
         try:
-            return json.loads(match.group(0))
+            return json_loads(text[start:end + 1])
         except json.JSONDecodeError:
             pass
     
+    # Try each balanced {...} object in the text
+    for candidate in _iter_json_objects(text):
+        try:
+            result = json_loads(candidate)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(result, dict):
+            return result
+    
     # If all fails, raise error
     raise json.JSONDecodeError("No valid JSON found", text, 0)
 
+
+def _iter_json_objects(text: str):
+    """
+    Yield balanced {...} spans of text, in order of their opening brace
+    
+    Braces inside JSON string literals are ignored. Each span is found by a
+    forward scan that stops at its closing brace (no regex backtracking on
+    long LLM output). The scan jumps between structural characters
+    ({, }, " and backslash) instead of stepping through every character, so
+    long runs of narration text (e.g. Chinese without separators) cost one
+    regex search rather than a Python iteration per character.
+    """
+    start = text.find('{')
+    while start != -1:
+        depth = 0
+        in_string = False
+        escaped_pos = -1
+        end = -1
+        for match in _JSON_SCAN_RE.finditer(text, start):
+            i = match.start()
+            char = text[i]
+            if in_string:
+                if i == escaped_pos:
+                    continue  # Escaped character
+                if char == '\\':
+                    escaped_pos = i + 1
+                elif char == '"':
+                    in_string = False
+            elif char == '"':
+                in_string = True
+            elif char == '{':
+                depth += 1
+            elif char == '}':
+                depth -= 1
+                if depth == 0:
+                    end = i
+                    break
+        
+        if end != -1:
+            yield text[start:end + 1]
+        start = text.find('{', start + 1)
+
@@ -0,0 +1,72 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Shared HTTP client
+
+Provides a lazily-created httpx.AsyncClient so that media downloads reuse
+pooled keep-alive connections instead of paying connection setup per request.
+
+The client is bound to the event loop it was created on. The web UI runs each
+action in a fresh loop (asyncio.run), so a new client is created transparently
+whenever the running loop changes.
+"""
+
+import asyncio
+from typing import Optional
+
+import httpx
+from loguru import logger
+
+
+_DEFAULT_TIMEOUT = httpx.Timeout(connect=10.0, read=60.0, write=60.0, pool=60.0)
+_DEFAULT_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=50)
+
+_client: Optional[httpx.AsyncClient] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared AsyncClient for the current event loop
+
+    Must be called from within a running event loop.
+
+    Returns:
+        Shared httpx.AsyncClient instance
+    """
+    global _client, _client_loop
+
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # Previous client (if any) belongs to a finished loop; its transports
+        # were torn down with that loop, so just drop the reference
+        _client = httpx.AsyncClient(
+            timeout=_DEFAULT_TIMEOUT,
+            limits=_DEFAULT_LIMITS,
+        )
+        _client_loop = loop
+        logger.debug("Created shared HTTP client")
+
+    return _client
+
+
+async def close_http_client():
+    """Close the shared AsyncClient (call on application shutdown)"""
+    global _client, _client_loop
+
+    if _client is not None and not _client.is_closed:
+        await _client.aclose()
+        logger.debug("Closed shared HTTP client")
+
+    _client = None
+    _client_loop = None
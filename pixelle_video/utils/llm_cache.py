@@ -0,0 +1,253 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+LLM response cache
+
+Exact-match, disk-backed cache for LLM responses. Entries are keyed by a
+blake2b digest of the request (model, base_url, sampling params, prompt)
+and stored as small JSON files under temp/llm_cache/. Recently used entries
+are also kept in an in-process LRU so repeated lookups skip the disk. On
+disk, hits refresh the file's mtime, expired entries are removed when read
+and the least recently used files are evicted past MAX_DISK_ENTRIES.
+
+Only near-deterministic requests should be cached: a high-temperature
+request is expected to return different text on every call.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from pixelle_video.utils.json_util import dumps as json_dumps, loads as json_loads
+from pixelle_video.utils.os_util import get_temp_path
+
+
+# Requests above this temperature are never cached
+MAX_CACHEABLE_TEMPERATURE = 0.2
+
+# Default entry lifetime (7 days)
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Max entries kept in the in-process LRU
+MEMORY_CACHE_SIZE = 256
+
+# Max entry files kept in temp/llm_cache/
+MAX_DISK_ENTRIES = 2000
+
+# key -> (created, response), most recently used last
+_memory_cache: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+
+
+def _remember(key: str, created: float, response: str):
+    _memory_cache[key] = (created, response)
+    _memory_cache.move_to_end(key)
+    if len(_memory_cache) > MEMORY_CACHE_SIZE:
+        _memory_cache.popitem(last=False)
+
+
+def _cache_dir() -> str:
+    return get_temp_path("llm_cache")
+
+
+def make_cache_key(
+    model: str,
+    base_url: Optional[str],
+    temperature: float,
+    max_tokens: int,
+    prompt: str,
+    extra: Optional[Dict[str, Any]] = None,
+) -> str:
+    """
+    Build cache key for an LLM request
+
+    Args:
+        model: Model name
+        base_url: API base URL
+        temperature: Sampling temperature
+        max_tokens: Max tokens
+        prompt: Prompt text
+        extra: Additional request parameters that affect the response
+
+    Returns:
+        Hex digest string
+    """
+    header = f"{model}|{base_url or ''}|{temperature}|{max_tokens}|"
+    if extra:
+        header += repr(sorted(extra.items()))
+    # Hash the prompt separately instead of concatenating it onto the header,
+    # so the (large) prompt is not copied before being encoded
+    hasher = hashlib.blake2b(digest_size=16)
+    hasher.update(f"{header}|".encode("utf-8"))
+    hasher.update(prompt.encode("utf-8"))
+    return hasher.hexdigest()
+
+
+def get_cached_response(key: str, ttl: float = DEFAULT_TTL) -> Optional[str]:
+    """
+    Look up cached response
+
+    Args:
+        key: Cache key from make_cache_key()
+        ttl: Maximum entry age in seconds
+
+    Returns:
+        Cached response text, or None on miss/expiry
+    """
+    path = os.path.join(_cache_dir(), f"{key}.json")
+
+    hit = _memory_cache.get(key)
+    if hit is not None:
+        created, response = hit
+        if time.time() - created > ttl:
+            _drop_entry(key, path)
+            return None
+        _memory_cache.move_to_end(key)
+        return response
+
+    try:
+        with open(path, "rb") as f:
+            entry = json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable LLM cache entry {key}: {e}")
+        return None
+
+    created = entry.get("created", 0)
+    response = entry.get("response")
+    if time.time() - created > ttl:
+        _drop_entry(key, path)
+        return None
+
+    if response is not None:
+        _remember(key, created, response)
+        # mtime tracks last use, so disk eviction drops the least recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+    return response
+
+
+def _drop_entry(key: str, path: str):
+    """Forget an expired entry in memory and on disk"""
+    _memory_cache.pop(key, None)
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
+def _evict_disk_entries(cache_dir: str, max_entries: int = MAX_DISK_ENTRIES):
+    """Delete the least recently used entry files beyond max_entries"""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [e for e in it if e.name.endswith(".json")]
+        if len(entries) <= max_entries:
+            return
+        mtimes = []
+        for e in entries:
+            try:
+                mtimes.append((e.stat().st_mtime, e.path))
+            except OSError:
+                pass
+    except OSError as e:
+        logger.debug(f"Failed to scan LLM cache: {e}")
+        return
+
+    mtimes.sort()
+    for _, path in mtimes[:len(mtimes) - max_entries]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def set_cached_response(key: str, response: str, model: str = ""):
+    """
+    Store response in cache
+
+    Args:
+        key: Cache key from make_cache_key()
+        response: Response text
+        model: Model name (stored for selective invalidation)
+    """
+    created = time.time()
+    _remember(key, created, response)
+
+    cache_dir = _cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+
+    path = os.path.join(cache_dir, f"{key}.json")
+    tmp_path = None
+    try:
+        # Unique temp file per writer: concurrent workers storing the same key
+        # must not write into (or swap in) each other's partial file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f"{key}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json_dumps({"created": created, "model": model, "response": response}))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Failed to write LLM cache entry: {e}")
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        return
+
+    _evict_disk_entries(cache_dir)
+
+
+def clear_llm_cache(model: Optional[str] = None) -> int:
+    """
+    Remove cached LLM responses
+
+    Args:
+        model: Only remove entries for this model (None = remove all)
+
+    Returns:
+        Number of entries removed
+    """
+    # Memory entries don't record the model; drop them all
+    _memory_cache.clear()
+
+    cache_dir = _cache_dir()
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".json"):
+            continue
+        path = os.path.join(cache_dir, name)
+        if model is not None:
+            try:
+                with open(path, "rb") as f:
+                    if json_loads(f.read()).get("model") != model:
+                        continue
+            except Exception:
+                pass
+        try:
+            os.unlink(path)
+            removed += 1
+        except OSError:
+            pass
+
+    logger.info(f"Cleared {removed} LLM cache entries")
+    return removed
@@ -21,7 +21,20 @@ import os
 import random
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple, Literal
+from typing import Dict, Iterable, Optional, Set, Tuple, Literal
+
+
+# PIXELLE_VIDEO_ROOT value -> resolved root path
+_resolved_env_roots: Dict[str, str] = {}
+
+# Root paths whose output/ directory was already created in this process
+_bootstrapped_roots: Set[str] = set()
+
+# Max buffers per writev call
+try:
+    _IOV_MAX = max(1, os.sysconf("SC_IOV_MAX"))
+except (AttributeError, ValueError, OSError):
+    _IOV_MAX = 1024
 
 
 def get_pixelle_video_root_path() -> str:
@@ -36,8 +49,14 @@ def get_pixelle_video_root_path() -> str:
     """
     # Check environment variable (required for reliable operation)
     env_root = os.environ.get("PIXELLE_VIDEO_ROOT")
-    if env_root and Path(env_root).exists():
-        return str(Path(env_root).resolve())
+    if env_root:
+        resolved = _resolved_env_roots.get(env_root)
+        if resolved is not None:
+            return resolved
+        if Path(env_root).exists():
+            resolved = str(Path(env_root).resolve())
+            _resolved_env_roots[env_root] = resolved
+            return resolved
     
     # Fallback to current working directory if environment variable not set
     # (for development environments where env var might not be set)
@@ -48,13 +67,17 @@ def ensure_pixelle_video_root_path() -> str:
     """
     Ensure Pixelle-Video root path exists and return the path
     
+    Every get_*_path() helper goes through here, so the output directory is
+    only created on the first call per root instead of on every path lookup.
+    
     Returns:
         Root path as string
     """
     root_path = get_pixelle_video_root_path()
-    root_path_obj = Path(root_path)
-    output_dir = root_path_obj / 'output'
-    output_dir.mkdir(parents=True, exist_ok=True)
+    if root_path not in _bootstrapped_roots:
+        output_dir = Path(root_path) / 'output'
+        output_dir.mkdir(parents=True, exist_ok=True)
+        _bootstrapped_roots.add(root_path)
     
     return root_path
 
@@ -143,7 +166,8 @@ def save_bytes_to_file(data: bytes, file_path: str) -> str:
     """
     Save bytes data to file
     
-    Creates parent directories if they don't exist.
+    Creates parent directories if they don't exist. Data is written straight
+    to the file descriptor, without Python's buffered IO layer copying it.
     
     Args:
         data: Binary data to save
@@ -155,16 +179,78 @@ def save_bytes_to_file(data: bytes, file_path: str) -> str:
     Example:
         save_bytes_to_file(audio_data, get_temp_path("audio.mp3"))
     """
-    # Ensure parent directory exists
-    os.makedirs(os.path.dirname(file_path), exist_ok=True)
+    fd = _open_for_write(file_path)
+    try:
+        _write_all(fd, memoryview(data))
+    finally:
+        os.close(fd)
+    
+    return os.path.abspath(file_path)
+
+
+def save_chunks_to_file(chunks: Iterable[bytes], file_path: str) -> str:
+    """
+    Save a sequence of byte chunks to file
     
-    # Write binary data
-    with open(file_path, "wb") as f:
-        f.write(data)
+    For data that arrives in pieces (e.g. streamed TTS audio). The chunks are
+    written with scatter-gather os.writev where available, so they are never
+    concatenated into one bytes object first.
+    
+    Args:
+        chunks: Binary data chunks, written in order
+        file_path: Target file path
+    
+    Returns:
+        Absolute path of saved file
+    
+    Example:
+        save_chunks_to_file(audio_chunks, get_temp_path("audio.mp3"))
+    """
+    views = [memoryview(chunk).cast("B") for chunk in chunks if len(chunk)]
+    
+    fd = _open_for_write(file_path)
+    try:
+        if hasattr(os, "writev"):
+            start = 0
+            while start < len(views):
+                written = os.writev(fd, views[start:start + _IOV_MAX])
+                # Skip fully written chunks, trim a partially written one
+                while start < len(views) and written >= len(views[start]):
+                    written -= len(views[start])
+                    start += 1
+                if written:
+                    views[start] = views[start][written:]
+        else:
+            # No writev (Windows)
+            for view in views:
+                _write_all(fd, view)
+    finally:
+        os.close(fd)
     
     return os.path.abspath(file_path)
 
 
+def _open_for_write(file_path: str) -> int:
+    """Open file for writing (truncate), creating parent directories only on a miss"""
+    flags = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+    try:
+        return os.open(file_path, flags, 0o644)
+    except FileNotFoundError:
+        # Parent directory is usually there already; only create it on a miss
+        parent_dir = os.path.dirname(file_path)
+        if not parent_dir:
+            raise
+        os.makedirs(parent_dir, exist_ok=True)
+        return os.open(file_path, flags, 0o644)
+
+
+def _write_all(fd: int, view: memoryview):
+    """Write the whole buffer (os.write may write less than asked)"""
+    written = 0
+    while written < len(view):
+        written += os.write(fd, view[written:])
+
+
 def ensure_dir(path: str) -> str:
     """
     Ensure directory exists, create if not
@@ -13,9 +13,17 @@
 """
 Prompt helper utilities
 
-Simple utilities for building prompts with optional prefixes.
+Simple utilities for building prompts with optional prefixes,
+and for rendering precompiled prompt templates.
 """
 
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Compiled template: sequence of (literal_text, field_name or None)
+CompiledTemplate = Tuple[Tuple[str, Optional[str]], ...]
+
 
 def build_image_prompt(prompt: str, prefix: str = "") -> str:
     """
@@ -48,3 +56,53 @@ def build_image_prompt(prompt: str, prefix: str = "") -> str:
     else:
         return prompt
 
+
+
+def compile_template(template: str) -> CompiledTemplate:
+    """
+    Precompile a str.format-style template into literal/field segments
+    
+    Parsing happens once (typically at import time), so rendering only joins
+    segments instead of rescanning the whole template for braces on every call.
+    Escaped braces ("{{" / "}}") are unescaped in the literal segments.
+    Format specs and conversions are not supported.
+    
+    Args:
+        template: Template string using {field} placeholders
+    
+    Returns:
+        Compiled template for render_template()
+    
+    Example:
+        >>> parts = compile_template("Hello {name}!")
+        >>> render_template(parts, {"name": "world"})
+        'Hello world!'
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in Formatter().parse(template):
+        if format_spec or conversion:
+            raise ValueError(f"Format spec/conversion not supported in field '{field_name}'")
+        parts.append((literal, field_name))
+    return tuple(parts)
+
+
+def render_template(compiled: CompiledTemplate, values: Dict[str, Any]) -> str:
+    """
+    Render a template compiled by compile_template()
+    
+    Args:
+        compiled: Compiled template
+        values: Field values (converted with str())
+    
+    Returns:
+        Rendered string
+    
+    Raises:
+        KeyError: If a field has no value
+    """
+    out: List[str] = []
+    for literal, field_name in compiled:
+        out.append(literal)
+        if field_name is not None:
+            out.append(str(values[field_name]))
+    return "".join(out)
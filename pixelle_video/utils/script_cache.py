@@ -0,0 +1,194 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Script cache
+
+Disk-backed cache for the LLM-generated part of a video (title, narrations
+and media prompts). Reruns with identical input and LLM settings, e.g. while
+trying other templates, voices or BGM, can skip the LLM steps entirely.
+
+Entries are keyed by a blake2b digest of the inputs that shape the script
+and stored as small JSON files under temp/script_cache/. Expired entries are
+removed when read, and the least recently used files are evicted past
+MAX_ENTRIES.
+"""
+
+import hashlib
+import os
+import tempfile
+import time
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from pixelle_video.utils.json_util import dumps as json_dumps, loads as json_loads
+from pixelle_video.utils.os_util import get_temp_path
+
+
+# Default entry lifetime (7 days)
+DEFAULT_TTL = 7 * 24 * 3600
+
+# Max entry files kept in temp/script_cache/
+MAX_ENTRIES = 500
+
+
+def _cache_dir() -> str:
+    return get_temp_path("script_cache")
+
+
+def make_script_cache_key(**inputs: Any) -> str:
+    """
+    Build cache key from the inputs that determine a script
+
+    Args:
+        **inputs: JSON-serializable inputs (text, mode, word limits, model, ...)
+
+    Returns:
+        Hex digest string
+    """
+    payload = json_dumps(dict(sorted(inputs.items())))
+    return hashlib.blake2b(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def get_cached_script(key: str, ttl: float = DEFAULT_TTL) -> Optional[Dict[str, Any]]:
+    """
+    Look up cached script
+
+    Args:
+        key: Cache key from make_script_cache_key()
+        ttl: Maximum entry age in seconds
+
+    Returns:
+        Dict with "title", "narrations" and "image_prompts", or None on miss/expiry
+    """
+    path = os.path.join(_cache_dir(), f"{key}.json")
+    try:
+        with open(path, "rb") as f:
+            entry = json_loads(f.read())
+    except FileNotFoundError:
+        return None
+    except Exception as e:
+        logger.debug(f"Ignoring unreadable script cache entry {key}: {e}")
+        return None
+
+    if time.time() - entry.get("created", 0) > ttl:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+        return None
+
+    narrations = entry.get("narrations")
+    image_prompts = entry.get("image_prompts")
+    if not narrations or not isinstance(image_prompts, list) or len(image_prompts) != len(narrations):
+        return None
+
+    # mtime tracks last use, so eviction drops the least recently used
+    try:
+        os.utime(path)
+    except OSError:
+        pass
+    return entry
+
+
+def _evict_entries(cache_dir: str, max_entries: int = MAX_ENTRIES):
+    """Delete the least recently used entry files beyond max_entries"""
+    try:
+        with os.scandir(cache_dir) as it:
+            entries = [e for e in it if e.name.endswith(".json")]
+        if len(entries) <= max_entries:
+            return
+        mtimes = []
+        for e in entries:
+            try:
+                mtimes.append((e.stat().st_mtime, e.path))
+            except OSError:
+                pass
+    except OSError as e:
+        logger.debug(f"Failed to scan script cache: {e}")
+        return
+
+    mtimes.sort()
+    for _, path in mtimes[:len(mtimes) - max_entries]:
+        try:
+            os.unlink(path)
+        except OSError:
+            pass
+
+
+def set_cached_script(
+    key: str,
+    title: Optional[str],
+    narrations: List[str],
+    image_prompts: List[Optional[str]],
+):
+    """
+    Store script in cache
+
+    Args:
+        key: Cache key from make_script_cache_key()
+        title: Generated title (None if the title was user-specified)
+        narrations: Narrations, one per frame
+        image_prompts: Media prompts, one per frame (None entries for text-only templates)
+    """
+    cache_dir = _cache_dir()
+    os.makedirs(cache_dir, exist_ok=True)
+
+    path = os.path.join(cache_dir, f"{key}.json")
+    tmp_path = None
+    try:
+        # Unique temp file per writer, so concurrent tasks never share a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=f"{key}.", suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json_dumps({
+                "created": time.time(),
+                "title": title,
+                "narrations": narrations,
+                "image_prompts": image_prompts,
+            }))
+        os.replace(tmp_path, path)
+    except Exception as e:
+        logger.warning(f"Failed to write script cache entry: {e}")
+        if tmp_path is not None:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+        return
+
+    _evict_entries(cache_dir)
+
+
+def clear_script_cache() -> int:
+    """
+    Remove all cached scripts
+
+    Returns:
+        Number of entries removed
+    """
+    cache_dir = _cache_dir()
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    removed = 0
+    for name in os.listdir(cache_dir):
+        if not name.endswith(".json"):
+            continue
+        try:
+            os.unlink(os.path.join(cache_dir, name))
+            removed += 1
+        except OSError:
+            pass
+
+    logger.info(f"Cleared {removed} script cache entries")
+    return removed
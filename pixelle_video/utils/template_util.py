@@ -15,9 +15,10 @@ Template utility functions for size parsing and template management
 """
 
 import os
+import re
+from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Tuple, Optional, Literal
-from pydantic import BaseModel, Field
 import logging
 
 from pixelle_video.utils.os_util import (
@@ -29,6 +30,12 @@ from pixelle_video.utils.os_util import (
 
 logger = logging.getLogger(__name__)
 
+# Template type from filename prefix (static_*, image_*, video_*), matched in one pass
+_TEMPLATE_TYPE_RE = re.compile(r"^(static|image|video)_")
+
+# Standard video sizes (width, height)
+_STANDARD_SIZES = frozenset({(1080, 1920), (1920, 1080), (1080, 1080)})
+
 
 def parse_template_size(template_path: str) -> Tuple[int, int]:
     """
@@ -170,28 +177,24 @@ def get_template_full_path(size: str, template_name: str) -> str:
         )
 
 
-class TemplateDisplayInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TemplateDisplayInfo:
     """Template display information for UI layer"""
     
-    name: str = Field(..., description="Template name without extension")
-    size: str = Field(..., description="Size string like '1080x1920'")
-    width: int = Field(..., description="Width in pixels")
-    height: int = Field(..., description="Height in pixels")
-    orientation: Literal['portrait', 'landscape', 'square'] = Field(
-        ..., 
-        description="Video orientation"
-    )
-    is_standard: bool = Field(
-        ..., 
-        description="True only for standard sizes: 1080x1920, 1920x1080, 1080x1080"
-    )
+    name: str                   # Template name (filename, e.g. 'default.html')
+    size: str                   # Size string like '1080x1920'
+    width: int                  # Width in pixels
+    height: int                 # Height in pixels
+    orientation: Literal['portrait', 'landscape', 'square']  # Video orientation
+    is_standard: bool           # True only for standard sizes: 1080x1920, 1920x1080, 1080x1080
 
 
-class TemplateInfo(BaseModel):
+@dataclass(frozen=True, slots=True)
+class TemplateInfo:
     """Complete template information with path and display info"""
     
-    template_path: str = Field(..., description="Full template path like '1080x1920/default.html'")
-    display_info: TemplateDisplayInfo = Field(..., description="Display information")
+    template_path: str                  # Full template path like '1080x1920/default.html'
+    display_info: TemplateDisplayInfo   # Display information
 
 
 def format_template_display_info(template_name: str, size: str) -> TemplateDisplayInfo:
@@ -235,7 +238,7 @@ def format_template_display_info(template_name: str, size: str) -> TemplateDispl
         orientation = 'square'
     
     # Check if it's a standard size (only these three)
-    is_standard = (width, height) in [(1080, 1920), (1920, 1080), (1080, 1080)]
+    is_standard = (width, height) in _STANDARD_SIZES
     
     return TemplateDisplayInfo(
         name=name,
@@ -292,25 +295,7 @@ def get_templates_grouped_by_size() -> dict:
         ...     for t in templates:
         ...         print(f"  - {t.display_info.name}")
     """
-    from collections import defaultdict
-    
-    templates = get_all_templates_with_info()
-    grouped = defaultdict(list)
-    
-    for t in templates:
-        grouped[t.display_info.size].append(t)
-    
-    # Sort groups by orientation priority: portrait > landscape > square
-    orientation_priority = {'portrait': 0, 'landscape': 1, 'square': 2}
-    
-    sorted_grouped = {}
-    for size in sorted(grouped.keys(), key=lambda s: (
-        orientation_priority.get(grouped[s][0].display_info.orientation, 3),
-        s
-    )):
-        sorted_grouped[size] = sorted(grouped[size], key=lambda t: t.display_info.name)
-    
-    return sorted_grouped
+    return get_templates_grouped_by_size_and_type()
 
 
 def resolve_template_path(template_input: Optional[str]) -> str:
@@ -347,16 +332,17 @@ def resolve_template_path(template_input: Optional[str]) -> str:
     size = None
     template_name = None
     
-    # Handle different input formats
-    if template_input.startswith("templates/") or template_input.startswith("data/templates/"):
+    # Handle different input formats (split off the first path segment once)
+    head, sep, tail = template_input.partition('/')
+    if template_input.startswith(("templates/", "data/templates/")):
         # Legacy full path format - extract size and name
         parts = Path(template_input).parts
         if len(parts) >= 3:
             size = parts[-2]
             template_name = parts[-1]
-    elif '/' in template_input and 'x' in template_input.split('/')[0]:
+    elif sep and 'x' in head:
         # "1080x1920/template.html" format
-        size, template_name = template_input.split('/', 1)
+        size, template_name = head, tail
     else:
         # Just template name - use default size
         size = "1080x1920"
@@ -411,12 +397,9 @@ def get_template_type(template_name: str) -> Literal['static', 'image', 'video']
     """
     name = Path(template_name).name
     
-    if name.startswith("static_"):
-        return "static"
-    elif name.startswith("video_"):
-        return "video"
-    elif name.startswith("image_"):
-        return "image"
+    match = _TEMPLATE_TYPE_RE.match(name)
+    if match:
+        return match.group(1)
     else:
         # Fallback: try to detect from legacy names
         logger.warning(
@@ -476,16 +459,11 @@ def get_templates_grouped_by_size_and_type(
     """
     from collections import defaultdict
     
-    templates = get_all_templates_with_info()
-    
-    # Filter by type if specified
-    if template_type is not None:
-        templates = filter_templates_by_type(templates, template_type)
-    
+    # Filter by type (if specified) and group by size in a single pass
     grouped = defaultdict(list)
-    
-    for t in templates:
-        grouped[t.display_info.size].append(t)
+    for t in get_all_templates_with_info():
+        if template_type is None or get_template_type(t.display_info.name) == template_type:
+            grouped[t.display_info.size].append(t)
     
     # Sort groups by orientation priority: portrait > landscape > square
     orientation_priority = {'portrait': 0, 'landscape': 1, 'square': 2}
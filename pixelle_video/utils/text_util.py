@@ -0,0 +1,101 @@
+# Copyright (C) 2025 AIDC-AI
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#     http://www.apache.org/licenses/LICENSE-2.0
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Text utilities
+
+Grapheme-aware truncation for titles and prompt previews. Uses the `regex`
+module's \\X (extended grapheme cluster) when available and falls back to a
+stdlib check for the common cluster continuations (combining marks, ZWJ
+emoji sequences, variation selectors, skin tones, emoji tags, regional
+indicator flag pairs).
+"""
+
+import unicodedata
+
+try:
+    import regex as _regex
+    _GRAPHEME_RE = _regex.compile(r"\X")
+except ImportError:  # pragma: no cover - regex is optional
+    _GRAPHEME_RE = None
+
+
+_ZWJ = "\u200d"
+
+
+def _is_regional_indicator(ch: str) -> bool:
+    return 0x1F1E6 <= ord(ch) <= 0x1F1FF
+
+
+def _continues_cluster(text: str, i: int) -> bool:
+    """Whether text[i] belongs to the same grapheme cluster as text[i - 1]"""
+    ch = text[i]
+    if ch == _ZWJ or text[i - 1] == _ZWJ:
+        return True
+    if unicodedata.category(ch).startswith("M"):
+        # Combining, spacing and enclosing marks
+        return True
+    if _is_regional_indicator(ch) and _is_regional_indicator(text[i - 1]):
+        # Regional indicators pair up into flags: text[i] closes a pair when an
+        # odd number of indicators run up to it since the last other character
+        count = 0
+        j = i - 1
+        while j >= 0 and _is_regional_indicator(text[j]):
+            count += 1
+            j -= 1
+        return count % 2 == 1
+    code = ord(ch)
+    return (
+        0xFE00 <= code <= 0xFE0F          # Variation selectors
+        or 0x1F3FB <= code <= 0x1F3FF     # Emoji skin tone modifiers
+        or 0xE0020 <= code <= 0xE007F     # Emoji tag sequences (flags)
+    )
+
+
+def truncate_graphemes(text: str, max_length: int) -> str:
+    """
+    Truncate text to at most max_length characters without splitting a grapheme
+
+    The cut is moved back to the previous grapheme cluster boundary when it
+    would land inside one (e.g. between a letter and its combining accent,
+    or inside a ZWJ emoji sequence).
+
+    Args:
+        text: Text to truncate
+        max_length: Maximum length in characters (code points)
+
+    Returns:
+        Text itself when short enough, otherwise its longest prefix that ends
+        on a grapheme boundary
+
+    Example:
+        >>> truncate_graphemes("家庭👨‍👩‍👧", 4)
+        '家庭'
+    """
+    if len(text) <= max_length:
+        return text
+    if max_length <= 0:
+        return ""
+
+    if _GRAPHEME_RE is not None:
+        # Scan stops at the first cluster that crosses max_length
+        end = 0
+        for match in _GRAPHEME_RE.finditer(text):
+            if match.end() > max_length:
+                break
+            end = match.end()
+        return text[:end]
+
+    end = max_length
+    while end > 0 and _continues_cluster(text, end):
+        end -= 1
+    return text[:end]
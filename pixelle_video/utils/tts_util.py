@@ -18,22 +18,29 @@ Currently, TTS service uses ComfyUI workflows only.
 """
 
 import asyncio
-import ssl
 import random
-import certifi
+import time
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+
 import edge_tts as edge_tts_sdk
 from loguru import logger
 from aiohttp import WSServerHandshakeError, ClientResponseError
 
+from pixelle_video.utils.os_util import save_chunks_to_file
+
 
-# Use certifi bundle for SSL verification instead of disabling it
-_USE_CERTIFI_SSL = True
+# SSL: edge-tts (>=7.2.3) builds its own SSL context from the certifi bundle
+# for every connection, so no global ssl patching is needed (or safe) here.
 
 # Retry configuration for Edge TTS (to handle 401 errors)
 _RETRY_COUNT = 5       # Default retry count (increased from 3 to 5)
 _RETRY_BASE_DELAY = 1.0     # Base retry delay in seconds (for exponential backoff)
 _MAX_RETRY_DELAY = 10.0     # Maximum retry delay in seconds
 
+# Hedging: if no attempt has produced data after this long, start one more in parallel
+_HEDGE_DELAY = 3.0          # seconds
+_MAX_PARALLEL_ATTEMPTS = 2  # Max attempts in flight for a single request
+
 # Rate limiting configuration
 _REQUEST_DELAY = 0.5        # Minimum delay before each request (seconds)
 _MAX_CONCURRENT_REQUESTS = 3  # Maximum concurrent requests
@@ -41,6 +48,13 @@ _MAX_CONCURRENT_REQUESTS = 3  # Maximum concurrent requests
 # Global semaphore for rate limiting
 _request_semaphore = asyncio.Semaphore(_MAX_CONCURRENT_REQUESTS)
 
+# Voice catalog cache (the catalog changes rarely; avoid a network round-trip per query)
+_VOICES_CACHE_TTL = 3600.0  # seconds
+# (fetched_at monotonic, raw voice list, locale-prefix index)
+_voices_cache: Optional[Tuple[float, list, Dict[str, list[str]]]] = None
+
+T = TypeVar("T")
+
 
 async def edge_tts(
     text: str,
@@ -51,7 +65,8 @@ async def edge_tts(
     output_path: str = None,
     retry_count: int = _RETRY_COUNT,
     retry_base_delay: float = _RETRY_BASE_DELAY,
-) -> bytes:
+    return_bytes: bool = True,
+) -> Optional[bytes]:
     """
     Convert text to speech using Microsoft Edge TTS
     
@@ -62,6 +77,7 @@ async def edge_tts(
     
     Includes automatic retry mechanism with exponential backoff and jitter
     to handle 401 authentication errors and temporary network issues.
+    A stalled attempt (no audio yet) is hedged with one parallel attempt.
     Also includes concurrent request limiting and rate limiting.
     
     Args:
@@ -73,9 +89,11 @@ async def edge_tts(
         output_path: Optional output file path to save audio
         retry_count: Number of retries on failure (default: 5)
         retry_base_delay: Base delay for exponential backoff (default: 1.0s)
+        return_bytes: Return the audio data (default: True). Callers that only
+            need the file at output_path can pass False to skip copying the audio
     
     Returns:
-        Audio data as bytes (MP3 format)
+        Audio data as bytes (MP3 format), or None if return_bytes is False
     
     Popular Chinese voices:
     - [Chinese] zh-CN Yunjian (male, default)
@@ -104,99 +122,43 @@ async def edge_tts(
         logger.debug(f"Waiting {pre_delay:.2f}s before request (rate limiting)")
         await asyncio.sleep(pre_delay)
         
-        last_error = None
-        
-        # Retry loop
-        for attempt in range(retry_count + 1):  # +1 because first attempt is not a retry
-            if attempt > 0:
-                # Exponential backoff with jitter
-                # delay = base * (2 ^ attempt) + random jitter
-                exponential_delay = retry_base_delay * (2 ** (attempt - 1))
-                jitter = random.uniform(0, retry_base_delay)
-                retry_delay = min(exponential_delay + jitter, _MAX_RETRY_DELAY)
-                
-                logger.info(f"🔄 Retrying Edge TTS (attempt {attempt + 1}/{retry_count + 1}) after {retry_delay:.2f}s delay...")
-                await asyncio.sleep(retry_delay)
-            
-            # Use certifi SSL context for proper certificate verification
-            if _USE_CERTIFI_SSL:
-                if attempt == 0:  # Only log info once
-                    logger.debug("Using certifi SSL certificates for secure Edge TTS connection")
-                original_create_default_context = ssl.create_default_context
-                
-                def create_certifi_context(*args, **kwargs):
-                    # Build SSL context that uses certifi bundle (resolves Windows / missing CA issues)
-                    return original_create_default_context(cafile=certifi.where())
-                
-                # Temporarily replace the function
-                ssl.create_default_context = create_certifi_context
-            
-            try:
-                # Create communicate instance
-                communicate = edge_tts_sdk.Communicate(
-                    text=text,
-                    voice=voice,
-                    rate=rate,
-                    volume=volume,
-                    pitch=pitch,
-                )
-                
-                # Collect audio chunks
-                audio_chunks = []
-                async for chunk in communicate.stream():
-                    if chunk["type"] == "audio":
-                        audio_chunks.append(chunk["data"])
-                
-                audio_data = b"".join(audio_chunks)
-                
-                if attempt > 0:
-                    logger.success(f"✅ Retry succeeded on attempt {attempt + 1}")
-                
-                logger.info(f"Generated {len(audio_data)} bytes of audio data")
-                
-                # Save to file if output_path is provided
-                if output_path:
-                    with open(output_path, "wb") as f:
-                        f.write(audio_data)
-                    logger.info(f"Audio saved to: {output_path}")
-                
-                return audio_data
-            
-            except (WSServerHandshakeError, ClientResponseError) as e:
-                # Network/authentication errors - retry
-                last_error = e
-                error_code = getattr(e, 'status', 'unknown')
-                error_msg = str(e)
-                
-                # Log more detailed information for 401 errors
-                if error_code == 401 or '401' in error_msg:
-                    logger.warning(f"⚠️  Edge TTS 401 Authentication Error (attempt {attempt + 1}/{retry_count + 1})")
-                    logger.debug(f"Error details: {error_msg}")
-                    logger.debug(f"This is usually caused by rate limiting. Will retry with exponential backoff...")
-                else:
-                    logger.warning(f"⚠️  Edge TTS error (attempt {attempt + 1}/{retry_count + 1}): {error_code} - {e}")
-                
-                if attempt >= retry_count:
-                    # Last attempt failed
-                    logger.error(f"❌ All {retry_count + 1} attempts failed. Last error: {error_code}")
-                    raise
-                # Otherwise, continue to next retry
-            
-            except Exception as e:
-                # Other errors - don't retry, raise immediately
-                logger.error(f"Edge TTS error (non-retryable): {type(e).__name__} - {e}")
-                raise
+        async def attempt_tts(attempt: int, progressed: asyncio.Event) -> List[bytes]:
+            # Create communicate instance
+            communicate = edge_tts_sdk.Communicate(
+                text=text,
+                voice=voice,
+                rate=rate,
+                volume=volume,
+                pitch=pitch,
+            )
             
-            finally:
-                # Restore original function if we patched it
-                if _USE_CERTIFI_SSL:
-                    ssl.create_default_context = original_create_default_context
+            # Keep audio chunks as received; they are written with one
+            # scatter-gather call and only joined if bytes are requested
+            chunks = []
+            async for chunk in communicate.stream():
+                if chunk["type"] == "audio":
+                    progressed.set()
+                    chunks.append(chunk["data"])
+            return chunks
         
-        # Should not reach here, but just in case
-        if last_error:
-            raise last_error
-        else:
-            raise RuntimeError("Edge TTS failed without error (unexpected)")
+        chunks = await _run_with_hedged_retries(
+            attempt_tts,
+            retry_count=retry_count,
+            retry_base_delay=retry_base_delay,
+            label="Edge TTS",
+        )
+        
+        logger.info(f"Generated {sum(len(chunk) for chunk in chunks)} bytes of audio data")
+        
+        # Save to file if output_path is provided (chunks written without concatenating)
+        if output_path:
+            save_chunks_to_file(chunks, output_path)
+            logger.info(f"Audio saved to: {output_path}")
+        
+        if not return_bytes:
+            return None
+        
+        return b"".join(chunks)
 
 
 def get_audio_duration(audio_path: str) -> float:
@@ -252,6 +214,14 @@ async def list_voices(locale: str = None, retry_count: int = _RETRY_COUNT, retry
         voices = await list_voices(locale="zh-CN")
         # Returns: ['[Chinese] zh-CN Yunjian', '[Chinese] zh-CN Xiaoxiao', ...]
     """
+    global _voices_cache
+    
+    # Serve from in-process cache if fresh
+    if _voices_cache and time.monotonic() - _voices_cache[0] < _VOICES_CACHE_TTL:
+        voice_ids = _filter_voice_ids(_voices_cache[1], locale, _voices_cache[2])
+        logger.debug(f"Found {len(voice_ids)} voices (cached)" + (f" for locale '{locale}'" if locale else ""))
+        return voice_ids
+    
     logger.debug(f"Fetching Edge TTS voices, locale filter: {locale}, retry_count: {retry_count}")
     
     # Use semaphore to limit concurrent requests
@@ -261,79 +231,195 @@ async def list_voices(locale: str = None, retry_count: int = _RETRY_COUNT, retry
         logger.debug(f"Waiting {pre_delay:.2f}s before request (rate limiting)")
         await asyncio.sleep(pre_delay)
         
-        last_error = None
+        async def attempt_list(attempt: int, progressed: asyncio.Event) -> list:
+            return await edge_tts_sdk.list_voices()
+        
+        # Get all voices (and cache the full catalog)
+        voices = await _run_with_hedged_retries(
+            attempt_list,
+            retry_count=retry_count,
+            retry_base_delay=retry_base_delay,
+            label="list voices",
+        )
+        index = _build_locale_index(voices)
+        _voices_cache = (time.monotonic(), voices, index)
+        
+        # Filter by locale if specified and extract voice IDs (ShortName)
+        voice_ids = _filter_voice_ids(voices, locale, index)
+        
+        logger.info(f"Found {len(voice_ids)} voices" + (f" for locale '{locale}'" if locale else ""))
+        return voice_ids
+
+
+def _retry_delay(attempt: int, retry_base_delay: float) -> float:
+    """
+    Exponential backoff with jitter for the given (1-based) retry attempt
+    
+    delay = base * (2 ^ (attempt - 1)) + random jitter, capped at _MAX_RETRY_DELAY
+    """
+    exponential_delay = retry_base_delay * (2 ** (attempt - 1))
+    jitter = random.uniform(0, retry_base_delay)
+    return min(exponential_delay + jitter, _MAX_RETRY_DELAY)
+
+
+async def _run_with_hedged_retries(
+    run_attempt: Callable[[int, asyncio.Event], Awaitable[T]],
+    retry_count: int,
+    retry_base_delay: float,
+    label: str,
+) -> T:
+    """
+    Run an Edge TTS request with hedging and retries
+    
+    - Hedging: if no attempt has made progress (signalled via the event)
+      within _HEDGE_DELAY, one extra attempt is started in parallel
+      (at most _MAX_PARALLEL_ATTEMPTS in flight). The first success wins
+      and the remaining attempts are cancelled.
+    - Retries: retryable network/authentication errors (e.g., 401 from rate
+      limiting) start the next attempt after exponential backoff with jitter.
+      Once an error has been seen, no further hedging is done.
+    - Any other exception cancels all attempts and is raised immediately.
+    
+    Args:
+        run_attempt: Coroutine function (attempt_index, progressed_event) -> result
+        retry_count: Number of retries on failure
+        retry_base_delay: Base delay for exponential backoff
+        label: Name used in log messages
+    
+    Returns:
+        Result of the first successful attempt
+    """
+    total = retry_count + 1  # +1 because first attempt is not a retry
+    progressed = asyncio.Event()
+    pending: set[asyncio.Task] = set()
+    started = 0
+    last_error: Optional[BaseException] = None
+    
+    def launch(delay: float):
+        nonlocal started
+        attempt = started
+        started += 1
         
-        # Retry loop
-        for attempt in range(retry_count + 1):
+        async def runner():
+            if delay > 0:
+                logger.info(f"🔄 Retrying {label} (attempt {attempt + 1}/{total}) after {delay:.2f}s delay...")
+                await asyncio.sleep(delay)
+            result = await run_attempt(attempt, progressed)
             if attempt > 0:
-                # Exponential backoff with jitter
-                exponential_delay = retry_base_delay * (2 ** (attempt - 1))
-                jitter = random.uniform(0, retry_base_delay)
-                retry_delay = min(exponential_delay + jitter, _MAX_RETRY_DELAY)
-                
-                logger.info(f"🔄 Retrying list voices (attempt {attempt + 1}/{retry_count + 1}) after {retry_delay:.2f}s delay...")
-                await asyncio.sleep(retry_delay)
-            
-            # Use certifi SSL context for proper certificate verification
-            if _USE_CERTIFI_SSL:
-                if attempt == 0:  # Only log info once
-                    logger.debug("Using certifi SSL certificates for secure Edge TTS connection")
-                original_create_default_context = ssl.create_default_context
-                
-                def create_certifi_context(*args, **kwargs):
-                    # Build SSL context that uses certifi bundle (resolves Windows / missing CA issues)
-                    return original_create_default_context(cafile=certifi.where())
-                
-                ssl.create_default_context = create_certifi_context
+                logger.success(f"✅ Retry succeeded on attempt {attempt + 1}")
+            return result
+        
+        pending.add(asyncio.create_task(runner()))
+    
+    launch(0.0)
+    try:
+        while pending:
+            can_hedge = (
+                last_error is None
+                and started < total
+                and len(pending) < _MAX_PARALLEL_ATTEMPTS
+                and not progressed.is_set()
+            )
+            done, _ = await asyncio.wait(
+                pending,
+                timeout=_HEDGE_DELAY if can_hedge else None,
+                return_when=asyncio.FIRST_COMPLETED,
+            )
             
-            try:
-                # Get all voices
-                voices = await edge_tts_sdk.list_voices()
-                
-                # Filter by locale if specified
-                if locale:
-                    voices = [v for v in voices if v["Locale"].startswith(locale)]
-                
-                # Extract voice IDs (ShortName)
-                voice_ids = [voice["ShortName"] for voice in voices]
-                
-                if attempt > 0:
-                    logger.success(f"✅ Retry succeeded on attempt {attempt + 1}")
-                
-                logger.info(f"Found {len(voice_ids)} voices" + (f" for locale '{locale}'" if locale else ""))
-                return voice_ids
+            if not done:
+                # No response yet - hedge with a parallel attempt
+                if not progressed.is_set():
+                    logger.info(f"⏩ {label} slow to respond, starting parallel attempt {started + 1}/{total}")
+                    launch(0.0)
+                continue
             
-            except (WSServerHandshakeError, ClientResponseError) as e:
-                # Network/authentication errors - retry
-                last_error = e
-                error_code = getattr(e, 'status', 'unknown')
-                error_msg = str(e)
+            for task in done:
+                pending.discard(task)
+                try:
+                    return task.result()
                 
-                # Log more detailed information for 401 errors
-                if error_code == 401 or '401' in error_msg:
-                    logger.warning(f"⚠️  Edge TTS 401 Authentication Error (list_voices attempt {attempt + 1}/{retry_count + 1})")
-                    logger.debug(f"Error details: {error_msg}")
-                    logger.debug(f"This is usually caused by rate limiting. Will retry with exponential backoff...")
-                else:
-                    logger.warning(f"⚠️  List voices error (attempt {attempt + 1}/{retry_count + 1}): {error_code} - {e}")
+                except (WSServerHandshakeError, ClientResponseError) as e:
+                    # Network/authentication errors - retry
+                    last_error = e
+                    error_code = getattr(e, 'status', 'unknown')
+                    error_msg = str(e)
+                    
+                    # Log more detailed information for 401 errors
+                    if error_code == 401 or '401' in error_msg:
+                        logger.warning(f"⚠️  {label} 401 Authentication Error ({started}/{total} attempts started)")
+                        logger.debug(f"Error details: {error_msg}")
+                        logger.debug(f"This is usually caused by rate limiting. Will retry with exponential backoff...")
+                    else:
+                        logger.warning(f"⚠️  {label} error ({started}/{total} attempts started): {error_code} - {e}")
+                    
+                    # Start next attempt unless a parallel one is still running
+                    if started < total and not pending:
+                        launch(_retry_delay(started, retry_base_delay))
                 
-                if attempt >= retry_count:
-                    logger.error(f"❌ All {retry_count + 1} attempts failed. Last error: {error_code}")
+                except Exception as e:
+                    # Other errors - don't retry, raise immediately
+                    logger.error(f"{label} error (non-retryable): {type(e).__name__} - {e}")
                     raise
-            
-            except Exception as e:
-                # Other errors - don't retry, raise immediately
-                logger.error(f"List voices error (non-retryable): {type(e).__name__} - {e}")
-                raise
-            
-            finally:
-                # Restore original function if we patched it
-                if _USE_CERTIFI_SSL:
-                    ssl.create_default_context = original_create_default_context
         
-        # Should not reach here, but just in case
         if last_error:
+            logger.error(f"❌ All {total} attempts failed. Last error: {getattr(last_error, 'status', 'unknown')}")
             raise last_error
-        else:
-            raise RuntimeError("List voices failed without error (unexpected)")
+        raise RuntimeError(f"{label} failed without error (unexpected)")
+    
+    finally:
+        # pending also holds finished tasks from the last wait() that were not
+        # looked at yet; gathering retrieves their results/exceptions and waits
+        # for the cancelled ones to unwind
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+
+
+def _build_locale_index(voices: list) -> Dict[str, list[str]]:
+    """
+    Index voice IDs by every hyphen-delimited locale prefix
+    
+    A voice with Locale "zh-CN-liaoning" is indexed under "zh",
+    "zh-CN" and "zh-CN-liaoning", so prefix lookups become dict hits.
+    
+    Args:
+        voices: Raw voice list from edge_tts.list_voices()
+    
+    Returns:
+        Dict mapping locale prefix to list of voice IDs
+    """
+    index: Dict[str, list[str]] = {}
+    for voice in voices:
+        short_name = voice["ShortName"]
+        parts = voice["Locale"].split("-")
+        for i in range(1, len(parts) + 1):
+            index.setdefault("-".join(parts[:i]), []).append(short_name)
+    return index
 
+
+def _filter_voice_ids(
+    voices: list,
+    locale: Optional[str] = None,
+    index: Optional[Dict[str, list[str]]] = None
+) -> list[str]:
+    """
+    Extract voice IDs (ShortName), optionally filtered by locale prefix
+    
+    Args:
+        voices: Raw voice list from edge_tts.list_voices()
+        locale: Locale prefix filter (e.g., zh-CN, en)
+        index: Optional index from _build_locale_index()
+    
+    Returns:
+        List of voice IDs
+    """
+    if not locale:
+        return [voice["ShortName"] for voice in voices]
+    
+    # Fast path: whole-segment prefix (e.g., "zh" or "zh-CN")
+    if index is not None and locale in index:
+        return list(index[locale])
+    
+    # Partial-segment prefix (e.g., "zh-C") - fall back to linear scan
+    return [v["ShortName"] for v in voices if v["Locale"].startswith(locale)]
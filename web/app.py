@@ -72,10 +72,8 @@ def get_project_version():
 
 def safe_rerun():
     """Safe rerun that works with both old and new Streamlit versions"""
-    if hasattr(st, 'rerun'):
-        st.rerun()
-    else:
-        st.experimental_rerun()
+    rerun = getattr(st, 'rerun', None) or st.experimental_rerun
+    rerun()
 
 
 # ============================================================================
@@ -101,14 +99,26 @@ def init_i18n():
 # ============================================================================
 
 def get_pixelle_video():
-    """Get initialized Pixelle-Video instance (no caching - always fresh)"""
+    """
+    Get initialized Pixelle-Video instance
+    
+    The instance is kept in session state across reruns and rebuilt only when
+    the configuration has changed, so services keep their client and workflow
+    caches instead of being re-created on every interaction.
+    """
     from pixelle_video.service import PixelleVideoCore
     
+    current_config = config_manager.config.to_dict()
+    cached = st.session_state.get("pixelle_video_core")
+    if cached is not None and cached.config == current_config:
+        return cached
+    
     logger.info("Initializing Pixelle-Video...")
     pixelle_video = PixelleVideoCore()
     run_async(pixelle_video.initialize())
     logger.info("Pixelle-Video initialized")
     
+    st.session_state.pixelle_video_core = pixelle_video
     return pixelle_video
 
 
@@ -285,18 +295,21 @@ def render_advanced_settings():
         with col1:
             if st.button(tr("btn.save_config"), use_container_width=True, key="save_config_btn"):
                 try:
+                    changed = False
+                    
                     # Save LLM configuration
                     if llm_api_key and llm_base_url and llm_model:
-                        config_manager.set_llm_config(llm_api_key, llm_base_url, llm_model)
+                        changed |= config_manager.set_llm_config(llm_api_key, llm_base_url, llm_model)
                     
                     # Save ComfyUI configuration
-                    config_manager.set_comfyui_config(
+                    changed |= config_manager.set_comfyui_config(
                         comfyui_url=comfyui_url if comfyui_url else None,
                         runninghub_api_key=runninghub_api_key if runninghub_api_key else None
                     )
                     
-                    # Save to file
-                    config_manager.save()
+                    # Save to file (skip the rewrite when nothing was edited)
+                    if changed or not config_manager.config_path.exists():
+                        config_manager.save()
                     
                     st.success(tr("status.config_saved"))
                     safe_rerun()
@@ -14,16 +14,21 @@
 International language support for Pixelle-Video Web UI
 """
 
-import json
 import locale
 from pathlib import Path
 from typing import Dict, Optional
 
 from loguru import logger
 
+from pixelle_video.utils.json_util import loads as json_loads
+from pixelle_video.utils.prompt_helper import CompiledTemplate, compile_template, render_template
+
 _locales: Dict[str, dict] = {}
 _current_language: str = "en_US"  # Default fallback to English
 
+# Translation string -> compiled template (parsed once, reused on every rerun)
+_compiled_translations: Dict[str, CompiledTemplate] = {}
+
 
 def load_locales() -> Dict[str, dict]:
     """Load all locale files from locales directory"""
@@ -38,8 +43,8 @@ def load_locales() -> Dict[str, dict]:
     for json_file in locales_dir.glob("*.json"):
         lang_code = json_file.stem
         try:
-            with open(json_file, "r", encoding="utf-8") as f:
-                _locales[lang_code] = json.load(f)
+            with open(json_file, "rb") as f:
+                _locales[lang_code] = json_loads(f.read())
             logger.debug(f"Loaded locale: {lang_code}")
         except Exception as e:
             logger.error(f"Failed to load locale {lang_code}: {e}")
@@ -101,7 +106,15 @@ def tr(key: str, fallback: Optional[str] = None, **kwargs) -> str:
     # Apply string interpolation if kwargs provided
     if kwargs:
         try:
-            result = result.format(**kwargs)
+            compiled = _compiled_translations.get(result)
+            if compiled is None:
+                try:
+                    compiled = compile_template(result)
+                except ValueError:
+                    # Format specs/conversions: use str.format directly
+                    compiled = ()
+                _compiled_translations[result] = compiled
+            result = render_template(compiled, kwargs) if compiled else result.format(**kwargs)
         except (KeyError, ValueError) as e:
             logger.warning(f"Failed to format translation '{key}': {e}")
     